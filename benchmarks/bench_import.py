@@ -0,0 +1,66 @@
+"""Import-time benchmark for fitviz_events.
+
+Each scenario runs in a fresh interpreter so module caches do not leak
+between measurements. Run from the repository root:
+
+    python benchmarks/bench_import.py [--runs 20]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import fitviz_events": "import fitviz_events",
+    "RabbitMQ only": "from fitviz_events import EventPublisher",
+    "SNS only": "from fitviz_events import SNSEventPublisher",
+    "both transports": "from fitviz_events import EventPublisher, SNSEventPublisher",
+    "pika + boto3 baseline": "import pika, boto3, pydantic",
+}
+
+HEAVY_MODULES = ("pika", "boto3", "botocore", "pydantic")
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+loaded = [m for m in {heavy!r} if m in sys.modules]
+print(elapsed, ",".join(loaded))
+"""
+
+
+def measure(statement: str, runs: int):
+    """Time ``statement`` in ``runs`` fresh interpreters.
+
+    Returns:
+        Tuple of (median seconds, heavy modules loaded)
+    """
+    timings = []
+    loaded = ""
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        timings.append(float(output[0]))
+        loaded = output[1] if len(output) > 1 else "-"
+    return statistics.median(timings), loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="interpreters per scenario")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<24} {'median ms':>10}  heavy modules loaded")
+    for name, statement in SCENARIOS.items():
+        median, loaded = measure(statement, args.runs)
+        print(f"{name:<24} {median * 1000:>10.1f}  {loaded}")
+
+
+if __name__ == "__main__":
+    main()
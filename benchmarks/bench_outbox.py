@@ -0,0 +1,72 @@
+"""Outbox append throughput benchmark for fitviz_events.
+
+Measures appends per second to the segment log with batched fsync, as seen by
+request threads during a broker outage. Run from the repository root:
+
+    python benchmarks/bench_outbox.py [--events 100000] [--threads 4]
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fitviz_events.codecs import JsonCodec  # noqa: E402
+from fitviz_events.envelope import validate_event  # noqa: E402
+from fitviz_events.outbox import SegmentLog  # noqa: E402
+
+WORKOUT = {
+    "workout_id": "workout_123",
+    "title": "Morning Yoga",
+    "description": "Relaxing yoga session",
+    "duration_minutes": 60,
+    "created_by": "user_456",
+}
+
+
+def bench(events, threads, fsync_interval):
+    """Return appends per second across ``threads`` writer threads."""
+    body = JsonCodec().encode_event(
+        "workout.created", WORKOUT, "org_123", validate_event("workout.created", WORKOUT)
+    )
+    headers = {"content_type": "application/json"}
+
+    with tempfile.TemporaryDirectory() as path:
+        log = SegmentLog(path, fsync_interval=fsync_interval)
+        per_thread = events // threads
+
+        def append_many():
+            for _ in range(per_thread):
+                log.append("workout.created", body, headers)
+
+        workers = [threading.Thread(target=append_many) for _ in range(threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        log.sync()
+        elapsed = time.perf_counter() - start
+        log.close()
+
+    return per_thread * threads / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=100000, help="appends per measurement")
+    parser.add_argument("--threads", type=int, default=4, help="writer threads")
+    args = parser.parse_args()
+
+    print(f"{'fsync interval':<16} {'appends/s':>12}")
+    for fsync_interval in (0.05, 0.01):
+        rate = bench(args.events, args.threads, fsync_interval)
+        print(f"{fsync_interval:<16} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Validate-and-serialize benchmark for fitviz_events.
+
+Compares normalizing validated data to a dict and encoding the envelope with
+``json.dumps`` against serializing the validated model straight to bytes with
+``serialize_event``. Run from the repository root:
+
+    python benchmarks/bench_serialization.py [--events 20000]
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fitviz_events.envelope import serialize_event, validate_event  # noqa: E402
+from fitviz_events.validation import validate_event_data  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_validation import SAMPLES  # noqa: E402
+
+
+def dict_path(event_type, data):
+    """Validate to a JSON-compatible dict, then encode the envelope with json."""
+    payload = {
+        "event_id": str(uuid4()),
+        "event_type": event_type,
+        "organization_id": "org_123",
+        "timestamp": datetime.utcnow().isoformat(),
+        "data": validate_event_data(event_type, data),
+    }
+    return json.dumps(payload).encode("utf-8")
+
+
+def model_path(event_type, data):
+    """Validate to a model and serialize it in a single pass."""
+    return serialize_event(event_type, data, "org_123", validate_event(event_type, data))
+
+
+def bench(func, event_type, data, events):
+    """Return microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(events):
+        func(event_type, data)
+    return (time.perf_counter() - start) / events * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20000, help="events per measurement")
+    args = parser.parse_args()
+
+    print(f"{'event type':<20} {'dict+json us':>13} {'single-pass us':>15} {'speedup':>8}")
+    for event_type, data in SAMPLES.items():
+        legacy = bench(dict_path, event_type, data, args.events)
+        single = bench(model_path, event_type, data, args.events)
+        print(f"{event_type:<20} {legacy:>13.2f} {single:>15.2f} {legacy / single:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Per-event validation benchmark for fitviz_events.
+
+Compares building the full event wrapper model (the original validation
+path) against the compiled per-type data validators. Run from the
+repository root:
+
+    python benchmarks/bench_validation.py [--events 20000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fitviz_events.events import EVENT_TYPE_MAP  # noqa: E402
+from fitviz_events.validation import validate_event_data  # noqa: E402
+
+SAMPLES = {
+    "workout.created": {
+        "workout_id": "workout_123",
+        "title": "Morning Yoga",
+        "description": "Relaxing yoga session",
+        "duration_minutes": 60,
+        "created_by": "user_456",
+    },
+    "booking.confirmed": {
+        "booking_id": "booking_123",
+        "user_id": "user_456",
+        "class_id": "class_789",
+        "class_name": "Yoga 101",
+        "scheduled_time": "2025-01-15T10:00:00Z",
+        "location": "Studio A",
+    },
+    "class.cancelled": {
+        "class_id": "class_789",
+        "class_name": "Spin",
+        "scheduled_time": "2025-01-15T10:00:00Z",
+        "cancellation_reason": "Trainer sick",
+        "affected_users": [f"user_{i}" for i in range(50)],
+    },
+}
+
+
+def wrapper_model(event_type, data):
+    """The original path: build and discard a full event model."""
+    return EVENT_TYPE_MAP[event_type](
+        event_id=str(uuid4()),
+        event_type=event_type,
+        organization_id="org_123",
+        data=data,
+    )
+
+
+def bench(func, event_type, data, events):
+    """Return microseconds per call."""
+    start = time.perf_counter()
+    for _ in range(events):
+        func(event_type, data)
+    return (time.perf_counter() - start) / events * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20000, help="events per measurement")
+    args = parser.parse_args()
+
+    print(f"{'event type':<20} {'wrapper us':>11} {'compiled us':>12} {'speedup':>8}")
+    for event_type, data in SAMPLES.items():
+        legacy = bench(wrapper_model, event_type, data, args.events)
+        compiled = bench(validate_event_data, event_type, data, args.events)
+        print(f"{event_type:<20} {legacy:>11.2f} {compiled:>12.2f} {legacy / compiled:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,38 +3,150 @@ FitViz Events - Event publishing client for FitViz notification service.
 
 This package provides a simple interface for Flask applications to publish
 domain events to the FitViz notification service via RabbitMQ or AWS SNS.
+
+Transport backends are imported lazily on first attribute access, so a
+RabbitMQ-only service never imports boto3 and an SNS-only service never
+imports pika.
 """
 
-from fitviz_events.config import EventPublisherConfig
-from fitviz_events.events import (
-    BaseEvent,
-    BookingCancelledEvent,
-    BookingConfirmedEvent,
-    ClassCancelledEvent,
-    ClassScheduledEvent,
-    MembershipCreatedEvent,
-    MembershipExpiredEvent,
-    PaymentCompletedEvent,
-    PaymentFailedEvent,
-    WorkoutCreatedEvent,
-    WorkoutDeletedEvent,
-    WorkoutUpdatedEvent,
+import importlib
+from typing import TYPE_CHECKING
+
+from fitviz_events.config import (
+    BackgroundPublisherConfig,
+    CircuitBreakerConfig,
+    ClaimCheckConfig,
+    CoalescerConfig,
+    EventPublisherConfig,
+    FanoutConfig,
+    OutboxConfig,
+    RateLimitConfig,
+    ShardingConfig,
+    TransactionalOutboxConfig,
 )
 from fitviz_events.exceptions import (
+    CircuitOpenError,
+    ClaimCheckError,
     ConnectionError,
     EventPublishError,
     EventValidationError,
 )
-from fitviz_events.publisher import EventPublisher
 from fitviz_events.sns_config import SNSPublisherConfig
-from fitviz_events.sns_publisher import SNSEventPublisher
+
+if TYPE_CHECKING:
+    from fitviz_events.async_publisher import AsyncEventPublisher
+    from fitviz_events.background import BackgroundPublisher
+    from fitviz_events.circuit_breaker import CircuitBreaker
+    from fitviz_events.claim_check import (
+        BlobStore,
+        ClaimCheckResolver,
+        FileBlobStore,
+        S3BlobStore,
+    )
+    from fitviz_events.coalescer import Coalescer
+    from fitviz_events.codecs import Codec, decode_event, get_codec
+    from fitviz_events.confirming_publisher import ConfirmingEventPublisher
+    from fitviz_events.events import (
+        BaseEvent,
+        BookingCancelledEvent,
+        BookingConfirmedEvent,
+        ClassCancelledEvent,
+        ClassScheduledEvent,
+        MembershipCreatedEvent,
+        MembershipExpiredEvent,
+        PaymentCompletedEvent,
+        PaymentFailedEvent,
+        WorkoutCreatedEvent,
+        WorkoutDeletedEvent,
+        WorkoutUpdatedEvent,
+    )
+    from fitviz_events.fanout import FanoutPublisher
+    from fitviz_events.publisher import EventPublisher
+    from fitviz_events.sharding import ShardedPublisher
+    from fitviz_events.sns_publisher import SNSEventPublisher
+    from fitviz_events.transactional_outbox import OutboxRelay, TransactionalOutbox
+
+_LAZY_ATTRIBUTES = {
+    "EventPublisher": "fitviz_events.publisher",
+    "AsyncEventPublisher": "fitviz_events.async_publisher",
+    "ConfirmingEventPublisher": "fitviz_events.confirming_publisher",
+    "BackgroundPublisher": "fitviz_events.background",
+    "SNSEventPublisher": "fitviz_events.sns_publisher",
+    "TransactionalOutbox": "fitviz_events.transactional_outbox",
+    "OutboxRelay": "fitviz_events.transactional_outbox",
+    "CircuitBreaker": "fitviz_events.circuit_breaker",
+    "Coalescer": "fitviz_events.coalescer",
+    "FanoutPublisher": "fitviz_events.fanout",
+    "ShardedPublisher": "fitviz_events.sharding",
+    "BlobStore": "fitviz_events.claim_check",
+    "FileBlobStore": "fitviz_events.claim_check",
+    "S3BlobStore": "fitviz_events.claim_check",
+    "ClaimCheckResolver": "fitviz_events.claim_check",
+    "Codec": "fitviz_events.codecs",
+    "get_codec": "fitviz_events.codecs",
+    "decode_event": "fitviz_events.codecs",
+    "BaseEvent": "fitviz_events.events",
+    "WorkoutCreatedEvent": "fitviz_events.events",
+    "WorkoutUpdatedEvent": "fitviz_events.events",
+    "WorkoutDeletedEvent": "fitviz_events.events",
+    "BookingConfirmedEvent": "fitviz_events.events",
+    "BookingCancelledEvent": "fitviz_events.events",
+    "MembershipCreatedEvent": "fitviz_events.events",
+    "MembershipExpiredEvent": "fitviz_events.events",
+    "PaymentCompletedEvent": "fitviz_events.events",
+    "PaymentFailedEvent": "fitviz_events.events",
+    "ClassScheduledEvent": "fitviz_events.events",
+    "ClassCancelledEvent": "fitviz_events.events",
+}
+
+
+def __getattr__(name: str):
+    """Import transport backends and event schemas on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported attributes in ``dir(fitviz_events)``."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __version__ = "1.0.0"
 __all__ = [
     "EventPublisher",
+    "AsyncEventPublisher",
+    "ConfirmingEventPublisher",
     "EventPublisherConfig",
+    "BackgroundPublisher",
+    "BackgroundPublisherConfig",
+    "OutboxConfig",
+    "TransactionalOutbox",
+    "TransactionalOutboxConfig",
+    "OutboxRelay",
+    "CircuitBreaker",
+    "CircuitBreakerConfig",
+    "RateLimitConfig",
+    "Coalescer",
+    "CoalescerConfig",
+    "FanoutPublisher",
+    "FanoutConfig",
+    "ShardedPublisher",
+    "ShardingConfig",
+    "BlobStore",
+    "FileBlobStore",
+    "S3BlobStore",
+    "ClaimCheckResolver",
+    "ClaimCheckConfig",
     "SNSEventPublisher",
     "SNSPublisherConfig",
+    "Codec",
+    "get_codec",
+    "decode_event",
     "BaseEvent",
     "WorkoutCreatedEvent",
     "WorkoutUpdatedEvent",
@@ -49,5 +161,7 @@ __all__ = [
     "ClassCancelledEvent",
     "EventPublishError",
     "EventValidationError",
+    "CircuitOpenError",
+    "ClaimCheckError",
     "ConnectionError",
 ]
@@ -0,0 +1,512 @@
+"""Native asyncio event publisher for RabbitMQ integration."""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple
+from uuid import UUID
+
+import pika
+from pika.adapters.asyncio_connection import AsyncioConnection
+from pydantic import BaseModel
+
+from fitviz_events.codecs import get_codec
+from fitviz_events.compression import compress_body, get_compressor
+from fitviz_events.config import EventPublisherConfig
+from fitviz_events.confirms import DeliveryTracker
+from fitviz_events.envelope import resolve_organization_id, validate_event
+from fitviz_events.exceptions import (
+    ConnectionError,
+    EventPublishError,
+    EventValidationError,
+)
+from fitviz_events.reconnect import backoff_delay
+
+logger = logging.getLogger(__name__)
+
+# EventPublisherConfig features only EventPublisher implements
+_UNSUPPORTED_OPTIONS = ("outbox", "circuit_breaker", "rate_limit", "claim_check")
+
+
+class AsyncEventPublisher:
+    """Asyncio event publisher for FitViz notification service.
+
+    Runs a non-blocking AMQP connection directly on the event loop, so
+    publishing never ties up executor threads. The channel is put into
+    publisher-confirm mode: each publish resolves when the broker acks the
+    message, and many publishes can be pipelined on the channel while their
+    confirms are outstanding.
+
+    Example:
+        publisher = AsyncEventPublisher(
+            rabbitmq_url="amqp://localhost:5672",
+            organization_id_getter=lambda: get_current_organization_id()
+        )
+
+        # Publish and wait for the broker confirm
+        success = await publisher.publish("workout.created", {
+            "workout_id": "123",
+            "title": "Morning Yoga",
+            "created_by": "user_456"
+        })
+
+        # Pipeline many publishes, then await all confirms
+        futures = [publisher.publish_nowait("workout.created", data) for data in batch]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+    """
+
+    def __init__(
+        self,
+        rabbitmq_url: Optional[str] = None,
+        exchange_name: str = "fitviz.events",
+        organization_id_getter: Optional[Callable[[], Optional[UUID]]] = None,
+        retry_attempts: int = 3,
+        retry_delay: float = 1.0,
+        enable_validation: bool = True,
+        config: Optional[EventPublisherConfig] = None,
+    ):
+        """Initialize the async event publisher.
+
+        Args:
+            rabbitmq_url: RabbitMQ connection URL
+            exchange_name: Exchange name for publishing events
+            organization_id_getter: Callable that returns current organization ID
+            retry_attempts: Number of connection retry attempts
+            retry_delay: Delay between retries in seconds
+            enable_validation: Whether to validate events with Pydantic
+            config: EventPublisherConfig instance (overrides individual params)
+
+        Raises:
+            ValueError: If ``config`` sets ``outbox``, ``circuit_breaker``,
+                ``rate_limit`` or ``claim_check``, which only EventPublisher supports
+        """
+        if config:
+            unsupported = [name for name in _UNSUPPORTED_OPTIONS if getattr(config, name)]
+            if unsupported:
+                raise ValueError(
+                    f"AsyncEventPublisher does not support {', '.join(unsupported)}; "
+                    "use EventPublisher"
+                )
+            self.config = config
+        else:
+            if not rabbitmq_url:
+                raise ValueError("rabbitmq_url is required")
+            self.config = EventPublisherConfig(
+                rabbitmq_url=rabbitmq_url,
+                exchange_name=exchange_name,
+                retry_attempts=retry_attempts,
+                retry_delay=retry_delay,
+                enable_validation=enable_validation,
+            )
+
+        self.organization_id_getter = organization_id_getter
+        self._codec = get_codec(self.config.codec)
+        self._compressor = get_compressor(self.config.compression)
+        self._init_process_state()
+        self._is_closed = False
+
+    def _init_process_state(self):
+        """Create the connection state owned by this process and event loop."""
+        self._connection = None
+        self._channel = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._tracker = DeliveryTracker()
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the connection and channel are open."""
+        return bool(
+            self._connection
+            and self._connection.is_open
+            and self._channel
+            and self._channel.is_open
+        )
+
+    @property
+    def pending_confirms(self) -> int:
+        """Number of published messages still waiting for a broker confirm."""
+        return len(self._tracker)
+
+    def _get_organization_id(self, organization_id: Optional[UUID] = None) -> Optional[str]:
+        """Get organization ID from parameter or getter.
+
+        Args:
+            organization_id: Explicit organization ID
+
+        Returns:
+            Organization ID as string or None
+        """
+        return resolve_organization_id(organization_id, self.organization_id_getter)
+
+    def _validate_event(
+        self, event_type: str, data: Dict[str, Any], organization_id: str
+    ) -> Optional[BaseModel]:
+        """Validate event data using Pydantic schemas.
+
+        Args:
+            event_type: Type of the event
+            data: Event data dictionary
+            organization_id: Organization ID
+
+        Returns:
+            Validated data model, or None if not validated
+
+        Raises:
+            EventValidationError: If validation fails
+        """
+        if not self.config.enable_validation:
+            return None
+
+        return validate_event(event_type, data)
+
+    def _priority(self, event_type: str) -> Optional[int]:
+        """AMQP message priority configured for an event type, if any."""
+        priorities = self.config.event_priorities
+        return priorities.get(event_type) if priorities else None
+
+    async def connect(self) -> bool:
+        """Establish the RabbitMQ connection with retry logic.
+
+        Returns:
+            True if connection successful, False otherwise
+        """
+        if self._is_closed:
+            logger.warning("Publisher is closed, cannot connect")
+            return False
+
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+
+        async with self._connect_lock:
+            if self.is_connected:
+                return True
+
+            for attempt in range(1, self.config.retry_attempts + 1):
+                try:
+                    logger.info(
+                        f"Connecting to RabbitMQ (attempt {attempt}/{self.config.retry_attempts})"
+                    )
+                    await self._open()
+                    logger.info("Successfully connected to RabbitMQ")
+                    return True
+
+                except ConnectionError as e:
+                    logger.warning(f"Connection attempt {attempt} failed: {str(e)}")
+                    if attempt < self.config.retry_attempts:
+                        await asyncio.sleep(
+                            backoff_delay(attempt, self.config.retry_delay, self.config.max_backoff)
+                        )
+                    else:
+                        logger.error("All connection attempts failed")
+                        return False
+
+                except Exception as e:
+                    logger.error(f"Unexpected error during connection: {str(e)}")
+                    return False
+
+            return False
+
+    async def _open(self):
+        """Open a confirm-mode channel on the running loop.
+
+        An open connection whose channel was closed (e.g. by a channel-level
+        error) is reused; otherwise any old connection is closed and a new one
+        is opened first.
+        """
+        loop = asyncio.get_running_loop()
+        connection = self._connection
+        if not (connection and connection.is_open):
+            self._abort_connection()
+            connection = await self._open_connection(loop)
+
+        try:
+            channel_opened = loop.create_future()
+            connection.channel(on_open_callback=channel_opened.set_result)
+            channel = await self._wait_for_step(channel_opened)
+            channel.add_on_close_callback(self._on_channel_closed)
+
+            declared = loop.create_future()
+            channel.exchange_declare(
+                exchange=self.config.exchange_name,
+                exchange_type="topic",
+                durable=True,
+                callback=declared.set_result,
+            )
+            await self._wait_for_step(declared)
+
+            selected = loop.create_future()
+            channel.confirm_delivery(
+                ack_nack_callback=self._tracker.on_delivery_confirmation,
+                callback=selected.set_result,
+            )
+            await self._wait_for_step(selected)
+
+        except BaseException:
+            self._abort_connection()
+            raise
+
+        self._channel = channel
+
+    async def _open_connection(self, loop: asyncio.AbstractEventLoop) -> AsyncioConnection:
+        """Open the AMQP connection on ``loop``."""
+        params = pika.URLParameters(self.config.rabbitmq_url)
+        for key, value in self.config.to_pika_params().items():
+            if value is not None:
+                setattr(params, key, value)
+
+        opened = loop.create_future()
+
+        def on_open(connection):
+            if not opened.done():
+                opened.set_result(connection)
+
+        def on_open_error(connection, error):
+            if not opened.done():
+                opened.set_exception(
+                    ConnectionError(
+                        f"Failed to connect to RabbitMQ: {error}",
+                        rabbitmq_url=self.config.rabbitmq_url,
+                        original_error=error if isinstance(error, Exception) else None,
+                    )
+                )
+
+        connection = AsyncioConnection(
+            parameters=params,
+            on_open_callback=on_open,
+            on_open_error_callback=on_open_error,
+            on_close_callback=self._on_connection_closed,
+            custom_ioloop=loop,
+        )
+        self._connection = connection
+        try:
+            await self._wait_for_step(opened)
+        except BaseException:
+            self._abort_connection()
+            raise
+        return connection
+
+    async def _wait_for_step(self, future: asyncio.Future):
+        """Wait for one step of the connection handshake.
+
+        Raises:
+            ConnectionError: If the step does not complete within ``connection_timeout``
+        """
+        try:
+            return await asyncio.wait_for(future, timeout=self.config.connection_timeout)
+        except asyncio.TimeoutError:
+            raise ConnectionError(
+                "Timed out connecting to RabbitMQ", rabbitmq_url=self.config.rabbitmq_url
+            )
+
+    def _abort_connection(self):
+        """Close a half-open connection, ignoring errors."""
+        try:
+            if self._connection and not self._connection.is_closed:
+                self._connection.close()
+        except Exception as e:
+            logger.warning(f"Error closing connection: {str(e)}")
+        self._connection = None
+
+    def _on_channel_closed(self, channel, reason):
+        """Fail every unconfirmed publish when the channel closes."""
+        if channel is self._channel:
+            self._channel = None
+        self._fail_pending(reason)
+
+    def _on_connection_closed(self, connection, reason):
+        """Fail every unconfirmed publish when the connection closes."""
+        if connection is self._connection:
+            self._connection = None
+            self._channel = None
+        self._fail_pending(reason)
+
+    def _fail_pending(self, reason):
+        """Fail every outstanding confirm future."""
+        self._tracker.fail_all(
+            EventPublishError(
+                f"Channel closed before confirm: {reason}",
+                original_error=reason if isinstance(reason, Exception) else None,
+            )
+        )
+
+    def _encode_message(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        org_id: str,
+        validated_data: Optional[BaseModel],
+    ) -> Tuple[bytes, Optional[str]]:
+        """Encode an event with the configured codec and compression.
+
+        Returns:
+            Tuple of the message body and its ``content_encoding``
+        """
+        message_body = self._codec.encode_event(event_type, data, org_id, validated_data)
+        return compress_body(message_body, self._compressor, self.config.compression_threshold)
+
+    def _send(
+        self,
+        event_type: str,
+        message_body: bytes,
+        future: Any = None,
+        content_encoding: Optional[str] = None,
+    ) -> Any:
+        """Publish a serialized message and register its confirm future.
+
+        Args:
+            event_type: Routing key for the message
+            message_body: Serialized event envelope
+            future: Future to resolve on confirm (a new asyncio future if omitted)
+            content_encoding: Compression applied to ``message_body``, if any
+
+        Returns:
+            The registered future
+
+        Raises:
+            EventPublishError: If the channel is not open
+        """
+        channel = self._channel
+        if channel is None:
+            raise EventPublishError("Publisher is not connected", event_type=event_type)
+
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+        channel.basic_publish(
+            exchange=self.config.exchange_name,
+            routing_key=event_type,
+            body=message_body,
+            properties=pika.BasicProperties(
+                delivery_mode=2,
+                content_type=self._codec.content_type,
+                content_encoding=content_encoding,
+                priority=self._priority(event_type),
+            ),
+        )
+        self._tracker.register(future)
+        return future
+
+    def publish_nowait(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        organization_id: Optional[UUID] = None,
+    ) -> asyncio.Future:
+        """Publish an event without waiting for the broker confirm.
+
+        The message is written to the channel immediately, so many calls can be
+        pipelined before any confirm arrives. The publisher must already be
+        connected (see ``connect``).
+
+        Args:
+            event_type: Type of event (e.g., "workout.created")
+            data: Event data dictionary
+            organization_id: Optional organization ID (uses getter if not provided)
+
+        Returns:
+            Future resolving to True on broker ack and False on nack
+
+        Raises:
+            EventValidationError: If validation fails
+            EventPublishError: If the publisher is closed, not connected or has no organization ID
+        """
+        if self._is_closed:
+            raise EventPublishError("Publisher is closed", event_type=event_type)
+
+        org_id = self._get_organization_id(organization_id)
+        if not org_id:
+            raise EventPublishError("No organization ID available", event_type=event_type)
+
+        validated_data = self._validate_event(event_type, data, org_id)
+
+        if not self.is_connected:
+            raise EventPublishError("Publisher is not connected", event_type=event_type)
+
+        message_body, content_encoding = self._encode_message(
+            event_type, data, org_id, validated_data
+        )
+        future: asyncio.Future = self._send(
+            event_type, message_body, content_encoding=content_encoding
+        )
+        return future
+
+    async def publish(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        organization_id: Optional[UUID] = None,
+    ) -> bool:
+        """Publish an event and wait for the broker confirm.
+
+        Cancelling the awaiting task stops waiting for the confirm; a message
+        already written to the channel is not recalled.
+
+        Args:
+            event_type: Type of event (e.g., "workout.created")
+            data: Event data dictionary
+            organization_id: Optional organization ID (uses getter if not provided)
+
+        Returns:
+            True if the broker acknowledged the event, False otherwise
+        """
+        if self._is_closed:
+            logger.warning("Publisher is closed, cannot publish event")
+            return False
+
+        try:
+            if not await self.connect():
+                logger.error("Failed to connect to RabbitMQ")
+                return False
+
+            future = self.publish_nowait(event_type, data, organization_id)
+            acked = bool(await asyncio.wait_for(future, timeout=self.config.confirm_timeout))
+
+            if acked:
+                logger.info(f"Published event: {event_type}")
+            else:
+                logger.error(f"Broker rejected event: {event_type}")
+            return acked
+
+        except asyncio.CancelledError:
+            raise
+
+        except EventValidationError as e:
+            logger.error(f"Event validation failed: {str(e)}")
+            return False
+
+        except asyncio.TimeoutError:
+            logger.error(f"Timed out waiting for broker confirm: {event_type}")
+            return False
+
+        except Exception as e:
+            logger.error(f"Unexpected error publishing event: {str(e)}")
+            return False
+
+    async def close(self):
+        """Close the publisher and release resources."""
+        self._is_closed = True
+        self._fail_pending("publisher closed")
+
+        try:
+            if self._channel and self._channel.is_open:
+                self._channel.close()
+        except Exception as e:
+            logger.warning(f"Error closing channel: {str(e)}")
+
+        try:
+            if self._connection and self._connection.is_open:
+                self._connection.close()
+        except Exception as e:
+            logger.warning(f"Error closing connection: {str(e)}")
+
+        self._channel = None
+        self._connection = None
+        logger.info("Async publisher closed")
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+        return False
@@ -0,0 +1,115 @@
+"""Process-wide registry of shared boto3 clients."""
+
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+import boto3
+from botocore.config import Config
+
+from fitviz_events.forking import register_fork_handlers
+
+logger = logging.getLogger(__name__)
+
+
+class ClientRegistry:
+    """Cache of boto3 clients keyed by service, connection settings and credentials.
+
+    boto3 clients are thread-safe, so publishers with the same region, endpoint,
+    credentials and botocore settings share one client and its connection pool
+    instead of each paying for client construction, endpoint resolution and
+    credential lookup on their first publish. Creating clients from the default
+    boto3 session is not thread-safe, so creation is serialized.
+
+    Clients do not survive a fork; a forked child starts with an empty registry.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._init_process_state()
+        register_fork_handlers(self)
+
+    def _init_process_state(self):
+        """Create the lock and client cache owned by this process."""
+        self._lock = threading.Lock()
+        self._clients: Dict[tuple, Any] = {}
+
+    def _after_fork(self):
+        """Drop clients inherited from the parent, whose sockets it still uses."""
+        self._init_process_state()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get(
+        self,
+        service_name: str,
+        client_config: Optional[Dict[str, Any]] = None,
+        **client_kwargs,
+    ) -> Any:
+        """Get the shared client for a service and settings, creating it on first use.
+
+        Args:
+            service_name: AWS service (e.g., "sns", "s3")
+            client_config: ``botocore.config.Config`` arguments, such as
+                ``max_pool_connections`` and timeouts
+            **client_kwargs: ``boto3.client`` arguments, such as ``region_name``,
+                ``endpoint_url`` and credentials
+
+        Returns:
+            boto3 client
+        """
+        client_config = client_config or {}
+        key = (
+            service_name,
+            tuple(sorted(client_kwargs.items())),
+            tuple(sorted(client_config.items())),
+        )
+
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                if client_config:
+                    client_kwargs["config"] = Config(**client_config)
+                client = boto3.client(service_name, **client_kwargs)
+                self._clients[key] = client
+                logger.info(
+                    f"Created {service_name} client for region {client_kwargs.get('region_name')}"
+                )
+            return client
+
+    def clear(self):
+        """Forget every client, so the next ``get`` creates new ones."""
+        with self._lock:
+            self._clients = {}
+
+
+_registry = ClientRegistry()
+
+
+def get_client(
+    service_name: str, client_config: Optional[Dict[str, Any]] = None, **client_kwargs
+) -> Any:
+    """Get a shared boto3 client from the process-wide registry.
+
+    Example:
+        sns = get_client("sns", {"max_pool_connections": 50}, region_name="us-east-2")
+
+    Args:
+        service_name: AWS service (e.g., "sns", "s3")
+        client_config: ``botocore.config.Config`` arguments
+        **client_kwargs: ``boto3.client`` arguments
+
+    Returns:
+        boto3 client
+    """
+    return _registry.get(service_name, client_config, **client_kwargs)
+
+
+def clear_clients():
+    """Forget every shared client (e.g., after rotating credentials, or between tests)."""
+    _registry.clear()
@@ -0,0 +1,440 @@
+"""Fire-and-forget background publishing for FitViz publishers."""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Union
+from uuid import UUID
+
+from pydantic_core import to_json
+
+from fitviz_events.config import BackgroundPublisherConfig
+from fitviz_events.forking import register_fork_handlers
+from fitviz_events.priority import PriorityLanes
+from fitviz_events.rate_limit import FairQueue, TokenBucketLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class QueuedEvent(NamedTuple):
+    """An event waiting to be published by the background worker."""
+
+    event_type: str
+    data: Dict[str, Any]
+    organization_id: str
+
+
+class SpillFile:
+    """Append-only JSON-lines file holding events that overflowed the queue.
+
+    Events are written by pydantic-core like the JSON envelope, so ``datetime``,
+    ``date`` and ``UUID`` values are stored in the same form the publisher
+    would send them. Events are read back in the order they were written. The
+    file is truncated once every spilled event has been read.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._read_offset = 0
+        self._count = 0
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                self._count = sum(1 for line in f if line.strip())
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, event: QueuedEvent):
+        """Append an event to the file."""
+        line = to_json(event._asdict()) + b"\n"
+        with self._lock:
+            with open(self.path, "ab") as f:
+                f.write(line)
+            self._count += 1
+
+    def read(self, limit: int) -> List[QueuedEvent]:
+        """Read up to ``limit`` unread events, oldest first."""
+        events: List[QueuedEvent] = []
+        with self._lock:
+            if not self._count:
+                return events
+
+            with open(self.path, "r", encoding="utf-8") as f:
+                f.seek(self._read_offset)
+                while len(events) < limit:
+                    line = f.readline()
+                    if not line:
+                        break
+                    if line.strip():
+                        events.append(QueuedEvent(**json.loads(line)))
+                self._read_offset = f.tell()
+
+            self._count -= len(events)
+            if not self._count:
+                open(self.path, "w").close()
+                self._read_offset = 0
+
+        return events
+
+
+class BackgroundPublisher:
+    """Publish events from a dedicated background thread.
+
+    Wraps an ``EventPublisher`` or ``SNSEventPublisher``. ``publish()`` only
+    resolves the organization ID and appends the event to a bounded in-memory
+    queue; a worker thread drains the queue through the wrapped publisher, so
+    broker latency, reconnects and retries never block the caller.
+
+    Example:
+        publisher = BackgroundPublisher(
+            EventPublisher(rabbitmq_url="amqp://localhost:5672",
+                           organization_id_getter=get_current_organization_id),
+            config=BackgroundPublisherConfig(max_queue_size=5000,
+                                             overflow_policy="drop_oldest"),
+        )
+
+        publisher.publish("workout.created", {...})  # returns immediately
+        publisher.close()  # flushes queued events
+    """
+
+    def __init__(self, publisher: Any, config: Optional[BackgroundPublisherConfig] = None):
+        """Initialize the background publisher.
+
+        Args:
+            publisher: Publisher used by the worker thread to send events
+            config: BackgroundPublisherConfig instance (defaults used if omitted)
+        """
+        self.publisher = publisher
+        self.config = config or BackgroundPublisherConfig()
+
+        self._spill = SpillFile(self.config.spill_path) if self.config.spill_path else None
+        self._fair = self.config.fair_queue or self.config.rate_limit is not None
+        self._is_closing = False
+        self._is_stopping = False
+        self._is_closed = False
+        self._init_process_state()
+        register_fork_handlers(self)
+
+    def _init_process_state(self):
+        """Create the queue and worker state owned by this process."""
+        self._queue: Union[Deque[QueuedEvent], FairQueue, PriorityLanes]
+        priorities = self.config.event_priorities
+        if priorities:
+            self._queue = PriorityLanes(
+                lambda event: priorities.get(event.event_type, 0),
+                starvation_limit=self.config.starvation_limit,
+                lane_factory=self._new_lane,
+            )
+        else:
+            self._queue = self._new_lane()
+        self._limiter: Optional[TokenBucketLimiter] = None
+        if self.config.rate_limit is not None:
+            self._limiter = TokenBucketLimiter(self.config.rate_limit)
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._in_flight = 0
+        self._counters = {
+            "enqueued": 0,
+            "published": 0,
+            "failed": 0,
+            "dropped": 0,
+            "spilled": 0,
+        }
+
+    def _new_lane(self) -> Union[Deque[QueuedEvent], FairQueue]:
+        """Create a FIFO queue, or a per-organization fair queue if configured."""
+        if self._fair:
+            return FairQueue(
+                key=lambda event: event.organization_id, weights=self.config.org_weights
+            )
+        return deque()
+
+    def _after_fork(self):
+        """Drop state inherited from the parent process after ``os.fork()``.
+
+        Events queued in the parent are left to the parent, so the child starts
+        with an empty queue instead of publishing them a second time. A child
+        spills to its own file (``spill_path`` suffixed with its PID).
+        """
+        self._init_process_state()
+        if self._spill is not None:
+            self._spill = SpillFile(f"{self.config.spill_path}.{os.getpid()}")
+
+    @property
+    def depth(self) -> int:
+        """Number of events waiting in memory."""
+        return len(self._queue)
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of queue depth and lifetime counters.
+
+        Returns:
+            Dictionary with ``depth``, ``spill_depth``, ``in_flight`` and the
+            ``enqueued``, ``published``, ``failed``, ``dropped`` and ``spilled`` counters
+        """
+        with self._cond:
+            stats = dict(self._counters)
+            stats["depth"] = len(self._queue)
+            stats["spill_depth"] = len(self._spill) if self._spill else 0
+            stats["in_flight"] = self._in_flight
+            return stats
+
+    def publish(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        organization_id: Optional[UUID] = None,
+    ) -> bool:
+        """Queue an event for background publishing.
+
+        The organization ID is resolved on the calling thread so request-scoped
+        getters keep working.
+
+        Args:
+            event_type: Type of event (e.g., "workout.created")
+            data: Event data dictionary
+            organization_id: Optional organization ID (uses getter if not provided)
+
+        Returns:
+            True if the event was queued or spilled, False if it was dropped
+        """
+        if self._is_closing:
+            logger.warning("Background publisher is closed, cannot publish event")
+            return False
+
+        org_id = self.publisher._get_organization_id(organization_id)
+        if not org_id:
+            logger.warning("No organization ID available, skipping event publish")
+            return False
+
+        event = QueuedEvent(event_type, data, org_id)
+        self._ensure_worker()
+
+        with self._cond:
+            if (
+                self.config.overflow_policy == "spill"
+                and self._spill is not None
+                and (len(self._spill) or len(self._queue) >= self.config.max_queue_size)
+            ):
+                # Events keep going to the file until the worker has replayed
+                # it, so queued events are always older than spilled ones and
+                # the worker, which drains the queue first, keeps their order
+                self._spill.append(event)
+                self._counters["spilled"] += 1
+                self._cond.notify_all()
+                return True
+
+            if len(self._queue) >= self.config.max_queue_size:
+                if not self._make_room(event):
+                    return False
+
+            self._queue.append(event)
+            self._counters["enqueued"] += 1
+            self._cond.notify_all()
+            return True
+
+    async def async_publish(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        organization_id: Optional[UUID] = None,
+    ) -> bool:
+        """Queue an event for background publishing from a coroutine.
+
+        Args:
+            event_type: Type of event (e.g., "workout.created")
+            data: Event data dictionary
+            organization_id: Optional organization ID
+
+        Returns:
+            True if the event was queued or spilled, False if it was dropped
+        """
+        return self.publish(event_type, data, organization_id)
+
+    def _make_room(self, event: QueuedEvent) -> bool:
+        """Apply the overflow policy to a full queue. Caller must hold ``_cond``.
+
+        Returns:
+            True if there is now room for ``event``, False if it was dropped
+        """
+        policy = self.config.overflow_policy
+
+        if policy == "drop_oldest":
+            if isinstance(self._queue, deque):
+                self._queue.popleft()
+            else:
+                self._queue.evict()
+            self._counters["dropped"] += 1
+            return True
+
+        if policy == "drop_newest":
+            self._counters["dropped"] += 1
+            logger.warning(f"Background queue full, dropping event: {event.event_type}")
+            return False
+
+        deadline = None
+        if self.config.block_timeout is not None:
+            deadline = time.monotonic() + self.config.block_timeout
+        while len(self._queue) >= self.config.max_queue_size and not self._is_closing:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            self._cond.wait(remaining)
+
+        if len(self._queue) >= self.config.max_queue_size or self._is_closing:
+            self._counters["dropped"] += 1
+            logger.warning(f"Background queue full, dropping event: {event.event_type}")
+            return False
+        return True
+
+    def _ensure_worker(self):
+        """Start the worker thread on first use."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._cond:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="fitviz-events-publisher", daemon=True
+                )
+                self._worker.start()
+
+    def _next_batch(self) -> Optional[List[QueuedEvent]]:
+        """Wait for events to publish. Returns None when the worker should stop."""
+        with self._cond:
+            while True:
+                if self._is_stopping:
+                    return None
+
+                if self._queue:
+                    event = self._pop_next()
+                    if event is not None:
+                        self._in_flight = 1
+                        self._cond.notify_all()
+                        return [event]
+
+                    # Every organization with queued events is over its rate
+                    self._cond.wait(self._limiter.refill_interval if self._limiter else None)
+                    continue
+
+                if self._spill and len(self._spill):
+                    events = self._spill.read(self.config.max_queue_size)
+                    self._in_flight = len(events)
+                    return events
+
+                if self._is_closing:
+                    return None
+
+                self._cond.wait()
+
+    def _pop_next(self) -> Optional[QueuedEvent]:
+        """Take the next event to publish. Caller must hold ``_cond``.
+
+        Returns:
+            The event, or None if every queued organization is rate limited
+        """
+        if self._limiter is None or self._is_closing or isinstance(self._queue, deque):
+            # Rate limits are not applied while close() flushes the queue
+            return self._queue.popleft()
+        return self._queue.popleft(ready=self._limiter.try_acquire)
+
+    def _run(self):
+        """Worker loop draining the queue through the wrapped publisher."""
+        while True:
+            events = self._next_batch()
+            if events is None:
+                return
+
+            for index, event in enumerate(events):
+                if self._is_stopping:
+                    # close() gave up waiting; the rest of a spill batch is not sent
+                    with self._cond:
+                        self._counters["dropped"] += len(events) - index
+                        self._in_flight = 0
+                    logger.warning(
+                        f"Background publisher stopped, dropped {len(events) - index} events"
+                    )
+                    return
+
+                try:
+                    success = self.publisher.publish(
+                        event.event_type, event.data, organization_id=event.organization_id
+                    )
+                except Exception as e:
+                    logger.error(f"Unexpected error in background publish: {str(e)}")
+                    success = False
+
+                with self._cond:
+                    self._counters["published" if success else "failed"] += 1
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued and spilled event has been handed to the publisher.
+
+        Starts the worker if it is not running, so events left in the spill
+        file by an earlier process are replayed even before the first publish.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            True if the queue drained, False on timeout or if the publisher is closed
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._is_closing and (self._queue or (self._spill and len(self._spill))):
+            self._ensure_worker()
+        with self._cond:
+            while self._queue or self._in_flight or (self._spill and len(self._spill)):
+                if self._worker is None or not self._worker.is_alive():
+                    return False
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def close(self, timeout: Optional[float] = None):
+        """Flush queued events, stop the worker and close the wrapped publisher.
+
+        If the flush does not finish in time, the worker stops after the event
+        it is publishing and the events still queued are not sent.
+
+        Args:
+            timeout: Seconds to wait for the flush (defaults to ``config.flush_timeout``)
+        """
+        if self._is_closed:
+            return
+        if timeout is None:
+            timeout = self.config.flush_timeout
+        deadline = time.monotonic() + timeout
+
+        drained = self.flush(timeout)
+        if not drained:
+            logger.warning(
+                f"Background publisher closed with {len(self._queue)} events still queued"
+            )
+
+        with self._cond:
+            self._is_closing = True
+            self._is_stopping = not drained
+            self._cond.notify_all()
+
+        if self._worker is not None:
+            self._worker.join(max(0.0, deadline - time.monotonic()))
+
+        self._is_closed = True
+        self.publisher.close()
+        logger.info("Background publisher closed")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+        return False
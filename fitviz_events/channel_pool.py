@@ -0,0 +1,296 @@
+"""Bounded pool of AMQP channels for EventPublisher."""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional
+
+from fitviz_events.exceptions import EventPublishError
+
+logger = logging.getLogger(__name__)
+
+
+class PooledConnection:
+    """An AMQP connection shared by one or more pooled channels.
+
+    pika's BlockingConnection is not thread-safe, so every channel opened on
+    the same connection shares ``lock``. Configure one connection per channel
+    to let publishes on different channels run fully in parallel.
+    """
+
+    def __init__(self, connection: Any):
+        self.connection = connection
+        self.lock = threading.RLock()
+        self.channel_count = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the underlying connection is still open."""
+        return bool(self.connection and self.connection.is_open)
+
+    def close(self):
+        """Close the underlying connection."""
+        with self.lock:
+            try:
+                if self.connection and self.connection.is_open:
+                    self.connection.close()
+            except Exception as e:
+                logger.warning(f"Error closing pooled connection: {str(e)}")
+
+
+class PooledChannel:
+    """A channel checked out from a ChannelPool."""
+
+    def __init__(self, channel: Any, connection: PooledConnection):
+        self.channel = channel
+        self.connection = connection
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock guarding the channel's connection."""
+        return self.connection.lock
+
+    @property
+    def is_open(self) -> bool:
+        """Whether both the channel and its connection are still open."""
+        return bool(self.connection.is_open and self.channel and self.channel.is_open)
+
+    def close(self):
+        """Close the channel, leaving its connection open."""
+        with self.lock:
+            try:
+                if self.channel and self.channel.is_open:
+                    self.channel.close()
+            except Exception as e:
+                logger.warning(f"Error closing pooled channel: {str(e)}")
+
+
+class ChannelPool:
+    """Bounded, thread-safe pool of AMQP channels.
+
+    Channels are opened lazily up to ``size`` and spread across at most
+    ``max_connections`` connections. Threads check a channel out, publish on
+    it and check it back in; closed channels are detected on checkout and
+    replaced transparently.
+
+    Example:
+        pool = ChannelPool(open_connection, size=8)
+        with pool.channel() as pooled:
+            with pooled.lock:
+                pooled.channel.basic_publish(...)
+    """
+
+    def __init__(
+        self,
+        open_connection: Callable[[], Any],
+        size: int = 1,
+        max_connections: Optional[int] = None,
+        setup_channel: Optional[Callable[[Any], None]] = None,
+        checkout_timeout: Optional[float] = None,
+    ):
+        """Initialize the channel pool.
+
+        Args:
+            open_connection: Callable returning a new open AMQP connection
+            size: Maximum number of channels in the pool
+            max_connections: Maximum number of connections (defaults to ``size``)
+            setup_channel: Optional callable run on every newly opened channel
+            checkout_timeout: Default seconds to wait for a free channel (None waits forever)
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        self.size = size
+        self.max_connections = max(1, min(max_connections or size, size))
+        self.checkout_timeout = checkout_timeout
+        self._open_connection = open_connection
+        self._setup_channel = setup_channel
+        self._connections: List[PooledConnection] = []
+        self._idle: List[PooledChannel] = []
+        self._created = 0
+        self._is_closed = False
+        self._cond = threading.Condition(threading.Lock())
+
+    @property
+    def in_use(self) -> int:
+        """Number of channels currently checked out."""
+        with self._cond:
+            return self._created - len(self._idle)
+
+    @property
+    def idle(self) -> int:
+        """Number of open channels waiting to be checked out."""
+        with self._cond:
+            return len(self._idle)
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the pool has been closed."""
+        return self._is_closed
+
+    @property
+    def connections(self) -> List[PooledConnection]:
+        """Snapshot of the pool's connections."""
+        with self._cond:
+            return list(self._connections)
+
+    def seed(self, connection: Any, channel: Any) -> PooledChannel:
+        """Add an already opened connection and channel to the pool.
+
+        Args:
+            connection: Open AMQP connection
+            channel: Open channel on ``connection``
+
+        Returns:
+            The pooled channel, available for checkout
+        """
+        with self._cond:
+            pooled_connection = PooledConnection(connection)
+            pooled_connection.channel_count = 1
+            self._connections.append(pooled_connection)
+            pooled = PooledChannel(channel, pooled_connection)
+            self._idle.append(pooled)
+            self._created += 1
+            self._cond.notify()
+            return pooled
+
+    def checkout(self, timeout: Optional[float] = None) -> PooledChannel:
+        """Check a healthy channel out of the pool.
+
+        Args:
+            timeout: Seconds to wait for a free channel (defaults to ``checkout_timeout``)
+
+        Returns:
+            An open PooledChannel
+
+        Raises:
+            EventPublishError: If the pool is closed or no channel frees up in time
+        """
+        if timeout is None:
+            timeout = self.checkout_timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        stale: List[PooledChannel] = []
+
+        try:
+            return self._checkout(deadline, stale)
+        finally:
+            for pooled in stale:
+                pooled.close()
+
+    def _checkout(self, deadline: Optional[float], stale: List[PooledChannel]) -> PooledChannel:
+        """Take an idle channel or reserve a slot and open a new one."""
+        with self._cond:
+            while True:
+                if self._is_closed:
+                    raise EventPublishError("Channel pool is closed")
+
+                while self._idle:
+                    pooled = self._idle.pop()
+                    if pooled.is_open:
+                        return pooled
+                    self._forget_locked(pooled)
+                    stale.append(pooled)
+
+                if self._created < self.size:
+                    self._created += 1
+                    break
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise EventPublishError(
+                        f"Timed out waiting for a free channel (pool size {self.size})"
+                    )
+                self._cond.wait(remaining)
+
+        try:
+            return self._open_channel()
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+    def checkin(self, pooled: PooledChannel, discard: bool = False):
+        """Return a channel to the pool.
+
+        Args:
+            pooled: Channel previously returned by ``checkout``
+            discard: Close the channel instead of reusing it (e.g. after a channel error)
+        """
+        with self._cond:
+            reuse = not (discard or self._is_closed or not pooled.is_open)
+            if reuse:
+                self._idle.append(pooled)
+            else:
+                self._forget_locked(pooled)
+            self._cond.notify()
+
+        if not reuse:
+            pooled.close()
+
+    @contextmanager
+    def channel(self, timeout: Optional[float] = None):
+        """Context manager that checks a channel out and back in.
+
+        The channel is discarded if the block raises.
+        """
+        pooled = self.checkout(timeout)
+        try:
+            yield pooled
+        except BaseException:
+            self.checkin(pooled, discard=True)
+            raise
+        else:
+            self.checkin(pooled)
+
+    def close(self):
+        """Close every channel and connection owned by the pool."""
+        with self._cond:
+            self._is_closed = True
+            idle, self._idle = self._idle, []
+            connections, self._connections = self._connections, []
+            self._created = 0
+            self._cond.notify_all()
+
+        for pooled in idle:
+            pooled.close()
+        for pooled_connection in connections:
+            pooled_connection.close()
+
+    def _open_channel(self) -> PooledChannel:
+        """Open a new channel, opening a new connection if the pool allows it."""
+        pooled_connection = self._pick_connection()
+        if pooled_connection is None:
+            pooled_connection = PooledConnection(self._open_connection())
+            with self._cond:
+                if self._is_closed:
+                    pooled_connection.close()
+                    raise EventPublishError("Channel pool is closed")
+                self._connections.append(pooled_connection)
+
+        with pooled_connection.lock:
+            channel = pooled_connection.connection.channel()
+            if self._setup_channel is not None:
+                self._setup_channel(channel)
+
+        with self._cond:
+            pooled_connection.channel_count += 1
+        logger.debug(f"Opened pooled channel ({self._created}/{self.size})")
+        return PooledChannel(channel, pooled_connection)
+
+    def _pick_connection(self) -> Optional[PooledConnection]:
+        """Pick the least loaded open connection, or None to open a new one."""
+        with self._cond:
+            self._connections = [c for c in self._connections if c.is_open]
+            if not self._connections or len(self._connections) < self.max_connections:
+                return None
+            return min(self._connections, key=lambda c: c.channel_count)
+
+    def _forget_locked(self, pooled: PooledChannel):
+        """Release a channel's slot. Caller must hold ``_cond`` and close it afterwards."""
+        self._created -= 1
+        pooled.connection.channel_count -= 1
+        if pooled.connection.channel_count <= 0 and not pooled.connection.is_open:
+            if pooled.connection in self._connections:
+                self._connections.remove(pooled.connection)
@@ -0,0 +1,206 @@
+"""Circuit breaker that stops publishing to a failing broker."""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from fitviz_events.config import CircuitBreakerConfig
+from fitviz_events.exceptions import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Number of buckets the sliding window is divided into
+_WINDOW_BUCKETS = 10
+
+
+class CircuitBreaker:
+    """Tracks the publish failure rate and rejects calls while it is too high.
+
+    * **closed**: calls go through; outcomes are counted in a sliding time
+      window. Once the window holds at least ``minimum_calls`` outcomes and the
+      failure rate reaches ``failure_rate_threshold``, the breaker opens.
+    * **open**: calls are rejected without touching the broker for
+      ``open_duration`` seconds.
+    * **half_open**: up to ``half_open_max_calls`` trial calls are let through.
+      A failure re-opens the breaker; that many successes close it.
+
+    Example:
+        breaker = CircuitBreaker(CircuitBreakerConfig(), name="rabbitmq")
+
+        breaker.acquire("workout.created")  # raises CircuitOpenError when open
+        breaker.record(send())
+    """
+
+    def __init__(
+        self,
+        config: Optional[CircuitBreakerConfig] = None,
+        name: str = "publisher",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the breaker in the closed state.
+
+        Args:
+            config: CircuitBreakerConfig instance (defaults used if omitted)
+            name: Name used in log messages
+            clock: Monotonic time source in seconds
+        """
+        self.config = config or CircuitBreakerConfig()
+        self.name = name
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._bucket_width = self.config.window / _WINDOW_BUCKETS
+        self._buckets: Deque[List[float]] = deque()
+        self._calls = 0
+        self._failures = 0
+        self._trial_calls = 0
+        self._trial_successes = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            self._advance(self._clock())
+            return self._state
+
+    def snapshot(self) -> Dict[str, Any]:
+        """State and window counters for health checks and metrics.
+
+        Returns:
+            Dictionary with ``state``, ``calls``, ``failures``, ``failure_rate``
+            and ``rejected`` (calls rejected since the breaker was created)
+        """
+        with self._lock:
+            now = self._clock()
+            self._advance(now)
+            self._trim(now)
+            return {
+                "state": self._state,
+                "calls": self._calls,
+                "failures": self._failures,
+                "failure_rate": self._failures / self._calls if self._calls else 0.0,
+                "rejected": self._rejected,
+            }
+
+    def allow_request(self) -> bool:
+        """Whether a call may go to the broker now.
+
+        Returns:
+            True if the call is allowed, False if it is rejected
+        """
+        with self._lock:
+            self._advance(self._clock())
+
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._trial_calls < self.config.half_open_max_calls:
+                self._trial_calls += 1
+                return True
+
+            self._rejected += 1
+            return False
+
+    def acquire(self, event_type: Optional[str] = None):
+        """Allow a call or raise if the breaker rejects it.
+
+        Args:
+            event_type: Event being published, for the error
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(
+                f"Circuit breaker for {self.name} is open", event_type=event_type
+            )
+
+    def record(self, success: bool):
+        """Record the outcome of an allowed call.
+
+        Args:
+            success: Whether the broker accepted the call
+        """
+        with self._lock:
+            now = self._clock()
+            self._advance(now)
+
+            if self._state == HALF_OPEN:
+                if not success:
+                    self._open(now, "trial call failed")
+                    return
+                self._trial_successes += 1
+                if self._trial_successes >= self.config.half_open_max_calls:
+                    self._close()
+                return
+
+            if self._state == OPEN:
+                return
+
+            self._add(now, success)
+            if (
+                self._calls >= self.config.minimum_calls
+                and self._failures / self._calls >= self.config.failure_rate_threshold
+            ):
+                self._open(
+                    now, f"{self._failures}/{self._calls} calls failed in {self.config.window:g}s"
+                )
+
+    def _advance(self, now: float):
+        """Move from open to half-open once ``open_duration`` has passed.
+
+        Trial slots are also handed out again if a half-open breaker has not
+        seen an outcome for ``open_duration``, so a trial call that never
+        reports back cannot wedge the breaker.
+        """
+        if self._state == CLOSED or now < self._opened_at + self.config.open_duration:
+            return
+
+        if self._state == OPEN:
+            logger.info(f"Circuit breaker for {self.name} half-open, allowing trial calls")
+        self._state = HALF_OPEN
+        self._opened_at = now
+        self._trial_calls = 0
+        self._trial_successes = 0
+
+    def _open(self, now: float, reason: str):
+        self._state = OPEN
+        self._opened_at = now
+        logger.warning(
+            f"Circuit breaker for {self.name} opened ({reason}), "
+            f"rejecting publishes for {self.config.open_duration:g}s"
+        )
+
+    def _close(self):
+        self._state = CLOSED
+        self._buckets.clear()
+        self._calls = 0
+        self._failures = 0
+        logger.info(f"Circuit breaker for {self.name} closed")
+
+    def _trim(self, now: float):
+        """Drop buckets that have left the sliding window."""
+        horizon = now - self.config.window
+        while self._buckets and self._buckets[0][0] + self._bucket_width <= horizon:
+            _, calls, failures = self._buckets.popleft()
+            self._calls -= int(calls)
+            self._failures -= int(failures)
+
+    def _add(self, now: float, success: bool):
+        self._trim(now)
+        if not self._buckets or now >= self._buckets[-1][0] + self._bucket_width:
+            self._buckets.append([now, 0, 0])
+
+        bucket = self._buckets[-1]
+        bucket[1] += 1
+        self._calls += 1
+        if not success:
+            bucket[2] += 1
+            self._failures += 1
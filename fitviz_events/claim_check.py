@@ -0,0 +1,308 @@
+"""Claim-check offload of oversized event payloads to a blob store."""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+from urllib.request import pathname2url, url2pathname
+
+from fitviz_events.codecs import Codec, decode_event
+from fitviz_events.config import ClaimCheckConfig
+from fitviz_events.exceptions import ClaimCheckError
+
+
+class BlobStore:
+    """Stores offloaded message bodies and fetches them back by reference.
+
+    Subclasses implement ``put`` and ``get``. Keys are content addressed, so
+    writing the same key twice stores the same bytes and ``put`` may skip it.
+    """
+
+    def put(self, key: str, body: bytes) -> str:
+        """Store a body.
+
+        Args:
+            key: Key of the form ``{organization_id}/{event_type}/{sha256}``
+            body: Message body to store
+
+        Returns:
+            Reference consumers pass to ``get``
+        """
+        raise NotImplementedError
+
+    def get(self, reference: str) -> bytes:
+        """Fetch a stored body.
+
+        Args:
+            reference: Reference returned by ``put``
+
+        Returns:
+            Stored message body
+        """
+        raise NotImplementedError
+
+
+class FileBlobStore(BlobStore):
+    """Blob store in a local directory, for development and tests.
+
+    References are ``file://`` URIs. Bodies are written to a temporary file
+    and renamed into place, so readers never see a partial body.
+
+    Example:
+        store = FileBlobStore("/var/lib/fitviz/claims")
+    """
+
+    def __init__(self, path: str):
+        """Initialize the store.
+
+        Args:
+            path: Directory holding the stored bodies (created if missing)
+        """
+        self.path = os.path.realpath(path)
+        os.makedirs(self.path, exist_ok=True)
+
+    def _contained(self, path: str, reference: str) -> str:
+        """Resolve a path, rejecting any that escape the store directory."""
+        path = os.path.realpath(path)
+        if os.path.commonpath([path, self.path]) != self.path:
+            raise ClaimCheckError(
+                f"Reference outside {self.path}: {reference}", reference=reference
+            )
+        return path
+
+    def _file_path(self, reference: str) -> str:
+        parts = urlsplit(reference)
+        if parts.scheme != "file":
+            raise ClaimCheckError(f"Not a file reference: {reference}", reference=reference)
+        return self._contained(url2pathname(parts.path), reference)
+
+    def put(self, key: str, body: bytes) -> str:
+        segments = key.split("/")
+        if any(segment in ("", ".", "..") for segment in segments):
+            raise ClaimCheckError(f"Invalid blob key: {key}", reference=key)
+        path = self._contained(os.path.join(self.path, *segments), key)
+        if not os.path.exists(path):
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(body)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        return "file://" + pathname2url(path)
+
+    def get(self, reference: str) -> bytes:
+        with open(self._file_path(reference), "rb") as f:
+            return f.read()
+
+
+class S3BlobStore(BlobStore):
+    """Blob store in an S3 bucket (or an S3-compatible service).
+
+    References are ``s3://bucket/key`` URIs. An S3 lifecycle rule on the
+    prefix is the place to expire bodies once consumers are done with them.
+
+    Example:
+        store = S3BlobStore("fitviz-claim-checks", prefix="events/", region_name="us-east-2")
+    """
+
+    def __init__(self, bucket: str, prefix: str = "", client: Any = None, **client_kwargs):
+        """Initialize the store.
+
+        Args:
+            bucket: Bucket name
+            prefix: Prefix prepended to every key
+            client: boto3 S3 client (the shared client for ``client_kwargs`` if omitted)
+            **client_kwargs: Arguments for ``boto3.client("s3")``, such as
+                ``region_name`` or ``endpoint_url`` for LocalStack
+        """
+        if client is None:
+            from fitviz_events.aws_clients import get_client
+
+            client = get_client("s3", **client_kwargs)
+        self.bucket = bucket
+        self.prefix = prefix
+        self._client = client
+
+    def put(self, key: str, body: bytes) -> str:
+        key = self.prefix + key
+        self._client.put_object(
+            Bucket=self.bucket, Key=key, Body=body, ContentType="application/octet-stream"
+        )
+        return f"s3://{self.bucket}/{key}"
+
+    def get(self, reference: str) -> bytes:
+        parts = urlsplit(reference)
+        if parts.scheme != "s3" or parts.netloc != self.bucket:
+            raise ClaimCheckError(
+                f"Not a reference to bucket {self.bucket}: {reference}", reference=reference
+            )
+        response = self._client.get_object(Bucket=self.bucket, Key=parts.path.lstrip("/"))
+        body: bytes = response["Body"].read()
+        return body
+
+
+def offload_body(
+    config: ClaimCheckConfig,
+    codec: Codec,
+    event_type: str,
+    organization_id: str,
+    body: bytes,
+    content_encoding: Optional[str] = None,
+) -> Tuple[bytes, Optional[str]]:
+    """Move a message body to the blob store if it is over the threshold.
+
+    The body is stored under a content-addressed key and replaced by a small
+    envelope, encoded with the same codec, whose ``claim_check`` field holds
+    the reference, the body's SHA-256 digest and size, and the content type
+    and encoding needed to decode it.
+
+    Args:
+        config: ClaimCheckConfig instance
+        codec: Codec the body was encoded with
+        event_type: Type of the event
+        organization_id: Organization ID
+        body: Encoded (and possibly compressed) message body
+        content_encoding: Compression applied to ``body``, if any
+
+    Returns:
+        Tuple of the body to send and its ``content_encoding``
+
+    Raises:
+        ClaimCheckError: If the body could not be stored
+    """
+    if len(body) <= config.threshold:
+        return body, content_encoding
+
+    digest = hashlib.sha256(body).hexdigest()
+    key = f"{organization_id}/{event_type}/{digest}"
+    try:
+        reference = config.store.put(key, body)
+    except Exception as e:
+        raise ClaimCheckError(
+            f"Failed to store {len(body)} byte payload for {event_type}: {str(e)}",
+            reference=key,
+            original_error=e,
+        ) from e
+
+    stub = {
+        "event_type": event_type,
+        "organization_id": organization_id,
+        "claim_check": {
+            "reference": reference,
+            "digest": f"sha256:{digest}",
+            "size": len(body),
+            "content_type": codec.content_type,
+            "content_encoding": content_encoding,
+        },
+    }
+    return codec.encode(stub), None
+
+
+class ClaimCheckResolver:
+    """Resolves claim-checked events back into full envelopes for consumers.
+
+    Fetched bodies are verified against their digest and kept in an LRU cache
+    bounded by total size, so consumers that see the same payload more than
+    once (redelivery, several queues on one process) fetch it once.
+
+    Example:
+        resolver = ClaimCheckResolver(S3BlobStore("fitviz-claim-checks"))
+
+        # RabbitMQ consumer
+        event = resolver.decode(body, properties.content_type, properties.content_encoding)
+    """
+
+    def __init__(self, store: BlobStore, max_cache_bytes: int = 64 * 1024 * 1024):
+        """Initialize the resolver.
+
+        Args:
+            store: Blob store the publisher offloads to
+            max_cache_bytes: Total size of cached bodies (0 disables the cache)
+        """
+        self.store = store
+        self.max_cache_bytes = max_cache_bytes
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+
+    def decode(
+        self,
+        body: Union[bytes, str],
+        content_type: Optional[str] = None,
+        content_encoding: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Decode a message like ``decode_event``, resolving a claim check if it has one.
+
+        Raises:
+            ValueError: If the message cannot be decoded
+            ClaimCheckError: If the offloaded body cannot be fetched or fails verification
+        """
+        return self.resolve(decode_event(body, content_type, content_encoding))
+
+    def resolve(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace a claim-check envelope with the offloaded one.
+
+        Args:
+            event: Decoded envelope; returned unchanged if it has no claim check
+
+        Returns:
+            Full event envelope
+
+        Raises:
+            ClaimCheckError: If the offloaded body cannot be fetched or fails verification
+        """
+        claim = event.get("claim_check")
+        if claim is None:
+            return event
+
+        reference = claim["reference"]
+        body = self._fetch(reference, claim["digest"])
+        try:
+            return decode_event(body, claim.get("content_type"), claim.get("content_encoding"))
+        except ValueError as e:
+            raise ClaimCheckError(
+                f"Invalid offloaded payload {reference}: {str(e)}",
+                reference=reference,
+                original_error=e,
+            ) from e
+
+    def _fetch(self, reference: str, digest: str) -> bytes:
+        """Fetch and verify a body, using the cache."""
+        with self._lock:
+            body = self._cache.get(reference)
+            if body is not None:
+                self._cache.move_to_end(reference)
+                return body
+
+        try:
+            body = self.store.get(reference)
+        except ClaimCheckError:
+            raise
+        except Exception as e:
+            raise ClaimCheckError(
+                f"Failed to fetch offloaded payload {reference}: {str(e)}",
+                reference=reference,
+                original_error=e,
+            ) from e
+
+        if f"sha256:{hashlib.sha256(body).hexdigest()}" != digest:
+            raise ClaimCheckError(
+                f"Offloaded payload {reference} does not match its digest", reference=reference
+            )
+
+        if len(body) <= self.max_cache_bytes:
+            with self._lock:
+                if reference not in self._cache:
+                    self._cache[reference] = body
+                    self._cache_bytes += len(body)
+                while self._cache_bytes > self.max_cache_bytes:
+                    _, evicted = self._cache.popitem(last=False)
+                    self._cache_bytes -= len(evicted)
+        return body
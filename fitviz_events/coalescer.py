@@ -0,0 +1,271 @@
+"""Coalesce bursts of update events for the same entity."""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from fitviz_events.config import CoalescerConfig
+from fitviz_events.forking import register_fork_handlers
+
+logger = logging.getLogger(__name__)
+
+
+class PendingEvent(NamedTuple):
+    """Coalesced event waiting for its window to close."""
+
+    event_type: str
+    data: Dict[str, Any]
+    organization_id: str
+    deadline: float
+
+
+class Coalescer:
+    """Publish only the last (or merged) update per entity within a window.
+
+    Wraps an ``EventPublisher``, ``SNSEventPublisher`` or ``BackgroundPublisher``.
+    Events of a type listed in ``entity_keys`` are held for ``window`` seconds
+    from the first one for an entity (event type, organization and entity ID).
+    Later events for that entity replace or merge into the pending one, and a
+    worker thread publishes the result when the window closes. A superseding
+    event (e.g. ``workout.deleted``) discards pending updates for its entity
+    and is published at once, as are all other events.
+
+    Example:
+        publisher = Coalescer(
+            EventPublisher(rabbitmq_url="amqp://localhost:5672",
+                           organization_id_getter=get_current_organization_id),
+            config=CoalescerConfig(entity_keys={"workout.updated": "workout_id"},
+                                   window=2.0),
+        )
+
+        publisher.publish("workout.updated", {...})  # held for up to 2 seconds
+        publisher.close()  # publishes pending events
+    """
+
+    def __init__(self, publisher: Any, config: Optional[CoalescerConfig] = None):
+        """Initialize the coalescer.
+
+        Args:
+            publisher: Publisher that receives coalesced and pass-through events
+            config: CoalescerConfig instance (defaults used if omitted)
+        """
+        self.publisher = publisher
+        self.config = config or CoalescerConfig()
+        self._is_closed = False
+        self._init_process_state()
+        register_fork_handlers(self)
+
+    def _init_process_state(self):
+        """Create the pending events and worker state owned by this process."""
+        self._pending: "OrderedDict[Tuple[Hashable, ...], PendingEvent]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._counters = {"coalesced": 0, "superseded": 0, "published": 0, "failed": 0}
+
+    def _after_fork(self):
+        """Leave events pending in the parent process to the parent."""
+        self._init_process_state()
+
+    @property
+    def pending(self) -> int:
+        """Number of entities with an event waiting to be published."""
+        return len(self._pending)
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of pending entities and lifetime counters.
+
+        Returns:
+            Dictionary with ``pending`` and the ``coalesced`` (events folded into
+            a pending one), ``superseded``, ``published`` and ``failed`` counters
+        """
+        with self._cond:
+            stats = dict(self._counters)
+            stats["pending"] = len(self._pending)
+            return stats
+
+    def _get_organization_id(self, organization_id: Optional[UUID] = None) -> Optional[str]:
+        """Get organization ID from the wrapped publisher."""
+        org_id: Optional[str] = self.publisher._get_organization_id(organization_id)
+        return org_id
+
+    def publish(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        organization_id: Optional[UUID] = None,
+    ) -> bool:
+        """Publish an event, holding it back if it can be coalesced.
+
+        Args:
+            event_type: Type of event (e.g., "workout.updated")
+            data: Event data dictionary
+            organization_id: Optional organization ID (uses getter if not provided)
+
+        Returns:
+            True if the event is pending or was published, False otherwise
+        """
+        if self._is_closed:
+            logger.warning("Coalescer is closed, cannot publish event")
+            return False
+
+        field_name = self.config.entity_keys.get(event_type)
+        superseded = self.config.supersedes.get(event_type)
+        if field_name is None and superseded is None:
+            return bool(self.publisher.publish(event_type, data, organization_id=organization_id))
+
+        org_id = self._get_organization_id(organization_id)
+        if not org_id:
+            logger.warning("No organization ID available, skipping event publish")
+            return False
+
+        if superseded:
+            self._discard(org_id, data, superseded)
+
+        entity_id = data.get(field_name) if field_name is not None else None
+        if entity_id is None:
+            return bool(self.publisher.publish(event_type, data, organization_id=org_id))
+
+        self._hold(event_type, data, org_id, entity_id)
+        return True
+
+    async def async_publish(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        organization_id: Optional[UUID] = None,
+    ) -> bool:
+        """Publish an event asynchronously.
+
+        Args:
+            event_type: Type of event (e.g., "workout.updated")
+            data: Event data dictionary
+            organization_id: Optional organization ID
+
+        Returns:
+            True if the event is pending or was published, False otherwise
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.publish, event_type, data, organization_id)
+
+    def _hold(self, event_type: str, data: Dict[str, Any], org_id: str, entity_id: Any):
+        """Add an event to its entity's pending event."""
+        key = (event_type, org_id, entity_id)
+        overflow: List[PendingEvent] = []
+
+        with self._cond:
+            current = self._pending.get(key)
+            if current is not None:
+                merged = {**current.data, **data} if self.config.merge else data
+                self._pending[key] = current._replace(data=merged)
+                self._counters["coalesced"] += 1
+                return
+
+            deadline = time.monotonic() + self.config.window
+            self._pending[key] = PendingEvent(event_type, data, org_id, deadline)
+            while len(self._pending) > self.config.max_pending:
+                overflow.append(self._pending.popitem(last=False)[1])
+            self._ensure_worker()
+            self._cond.notify_all()
+
+        self._publish_events(overflow)
+
+    def _discard(self, org_id: str, data: Dict[str, Any], event_types: List[str]):
+        """Drop pending events of ``event_types`` for the entity ``data`` refers to."""
+        with self._cond:
+            for event_type in event_types:
+                field_name = self.config.entity_keys.get(event_type)
+                if field_name is None or data.get(field_name) is None:
+                    continue
+                if self._pending.pop((event_type, org_id, data[field_name]), None):
+                    self._counters["superseded"] += 1
+
+    def _ensure_worker(self):
+        """Start the worker thread on first use. Caller must hold ``_cond``."""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._run, name="fitviz-events-coalescer", daemon=True
+            )
+            self._worker.start()
+
+    def _take_due(self) -> Optional[List[PendingEvent]]:
+        """Wait for pending events whose window closed. Returns None when stopping."""
+        with self._cond:
+            while True:
+                if self._is_closed and not self._pending:
+                    return None
+
+                now = time.monotonic()
+                due = []
+                while self._pending:
+                    key, event = next(iter(self._pending.items()))
+                    if event.deadline > now and not self._is_closed:
+                        break
+                    due.append(self._pending.pop(key))
+                if due:
+                    return due
+
+                timeout = None
+                if self._pending:
+                    timeout = next(iter(self._pending.values())).deadline - now
+                self._cond.wait(timeout)
+
+    def _run(self):
+        """Worker loop publishing events as their windows close."""
+        while True:
+            events = self._take_due()
+            if events is None:
+                return
+            self._publish_events(events)
+
+    def _publish_events(self, events: List[PendingEvent]):
+        for event in events:
+            try:
+                success = self.publisher.publish(
+                    event.event_type, event.data, organization_id=event.organization_id
+                )
+            except Exception as e:
+                logger.error(f"Unexpected error publishing coalesced event: {str(e)}")
+                success = False
+
+            with self._cond:
+                self._counters["published" if success else "failed"] += 1
+
+    def flush(self):
+        """Publish every pending event now, without waiting for its window."""
+        with self._cond:
+            events = list(self._pending.values())
+            self._pending.clear()
+        self._publish_events(events)
+
+    def close(self, timeout: Optional[float] = None):
+        """Publish pending events, stop the worker and close the wrapped publisher.
+
+        Args:
+            timeout: Seconds to wait for the worker to stop
+        """
+        if self._is_closed:
+            return
+
+        with self._cond:
+            self._is_closed = True
+            self._cond.notify_all()
+
+        if self._worker is not None:
+            self._worker.join(timeout)
+        self.flush()
+
+        self.publisher.close()
+        logger.info("Coalescer closed")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+        return False
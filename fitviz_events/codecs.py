@@ -0,0 +1,251 @@
+"""Wire codecs for event envelopes."""
+
+import base64
+import binascii
+import json
+from typing import Any, Dict, Optional, Type, Union
+
+from pydantic import BaseModel
+from pydantic_core import to_json, to_jsonable_python
+
+from fitviz_events.compression import decompress, parse_content_encoding
+from fitviz_events.envelope import build_event_payload, serialize_event
+
+
+class Codec:
+    """Encodes event envelopes for the wire and decodes them for consumers.
+
+    Subclasses set ``name`` and ``content_type`` and implement ``encode`` and
+    ``decode``; ``binary`` marks codecs whose output is not UTF-8 text.
+    """
+
+    name: str = ""
+    content_type: str = ""
+    binary: bool = False
+
+    def encode(self, payload: Dict[str, Any]) -> bytes:
+        """Encode an envelope dictionary.
+
+        Args:
+            payload: Event envelope from ``build_event_payload``
+
+        Returns:
+            Encoded message body
+        """
+        raise NotImplementedError
+
+    def decode(self, body: bytes) -> Dict[str, Any]:
+        """Decode a message body back into an envelope dictionary.
+
+        Args:
+            body: Encoded message body
+
+        Returns:
+            Event envelope dictionary
+        """
+        raise NotImplementedError
+
+    def encode_event(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        organization_id: str,
+        validated_data: Optional[BaseModel] = None,
+        event_id: Optional[str] = None,
+    ) -> bytes:
+        """Build and encode the envelope for an event.
+
+        Args:
+            event_type: Type of the event
+            data: Event data dictionary
+            organization_id: Organization ID
+            validated_data: Model returned by ``validate_event``, if validation ran
+            event_id: Event ID to use (a new UUID if omitted)
+
+        Returns:
+            Encoded message body
+        """
+        return self.encode(
+            build_event_payload(event_type, data, organization_id, validated_data, event_id)
+        )
+
+
+class JsonCodec(Codec):
+    """JSON codec backed by pydantic-core; needs no extra dependencies."""
+
+    name = "json"
+    content_type = "application/json"
+
+    def encode(self, payload: Dict[str, Any]) -> bytes:
+        return to_json(payload)
+
+    def decode(self, body: bytes) -> Dict[str, Any]:
+        payload: Dict[str, Any] = json.loads(body)
+        return payload
+
+    def encode_event(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        organization_id: str,
+        validated_data: Optional[BaseModel] = None,
+        event_id: Optional[str] = None,
+    ) -> bytes:
+        return serialize_event(event_type, data, organization_id, validated_data, event_id)
+
+
+class OrjsonCodec(Codec):
+    """JSON codec backed by orjson (``pip install fitviz-events[orjson]``)."""
+
+    name = "orjson"
+    content_type = "application/json"
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError as e:
+            raise ImportError(
+                "The orjson codec requires orjson: pip install fitviz-events[orjson]"
+            ) from e
+        self._orjson = orjson
+
+    def encode(self, payload: Dict[str, Any]) -> bytes:
+        # Let pydantic format datetimes so UTC is written as "Z", as the JSON codec does
+        body: bytes = self._orjson.dumps(
+            payload, default=to_jsonable_python, option=self._orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        return body
+
+    def decode(self, body: bytes) -> Dict[str, Any]:
+        payload: Dict[str, Any] = self._orjson.loads(body)
+        return payload
+
+
+class MsgpackCodec(Codec):
+    """MessagePack codec (``pip install fitviz-events[msgpack]``).
+
+    Values MessagePack has no type for, such as ``datetime`` and ``UUID``, are
+    written as their JSON string form so consumers see the same values as with
+    the JSON codecs.
+    """
+
+    name = "msgpack"
+    content_type = "application/msgpack"
+    binary = True
+
+    def __init__(self):
+        try:
+            import msgpack
+        except ImportError as e:
+            raise ImportError(
+                "The msgpack codec requires msgpack: pip install fitviz-events[msgpack]"
+            ) from e
+        self._msgpack = msgpack
+
+    def encode(self, payload: Dict[str, Any]) -> bytes:
+        body: bytes = self._msgpack.packb(payload, default=to_jsonable_python, datetime=False)
+        return body
+
+    def decode(self, body: bytes) -> Dict[str, Any]:
+        payload: Dict[str, Any] = self._msgpack.unpackb(body, raw=False)
+        return payload
+
+
+CODECS: Dict[str, Type[Codec]] = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgpackCodec.name: MsgpackCodec,
+}
+
+
+def get_codec(codec: Union[str, Codec, None] = None) -> Codec:
+    """Resolve a codec name or instance.
+
+    Args:
+        codec: Codec name ("json", "orjson", "msgpack"), a Codec instance,
+            or None for the default JSON codec
+
+    Returns:
+        Codec instance
+
+    Raises:
+        ValueError: If the codec name is unknown
+        ImportError: If the codec's optional dependency is not installed
+    """
+    if codec is None:
+        return JsonCodec()
+    if isinstance(codec, Codec):
+        return codec
+
+    codec_class = CODECS.get(codec)
+    if codec_class is None:
+        raise ValueError(f"Unknown codec {codec!r}; expected one of {', '.join(CODECS)}")
+    return codec_class()
+
+
+def codec_for_content_type(content_type: Optional[str]) -> Codec:
+    """Pick the codec that decodes messages with the given content type.
+
+    Args:
+        content_type: AMQP ``content_type`` property or SNS ``content_type``
+            message attribute; None or a missing value means JSON
+
+    Returns:
+        Codec instance
+
+    Raises:
+        ValueError: If the content type is not supported
+    """
+    media_type = (content_type or JsonCodec.content_type).split(";")[0].strip().lower()
+    if media_type in ("application/json", "text/json"):
+        return JsonCodec()
+    if media_type in ("application/msgpack", "application/x-msgpack"):
+        return MsgpackCodec()
+    raise ValueError(f"Unsupported content type: {content_type}")
+
+
+def decode_event(
+    body: Union[bytes, str],
+    content_type: Optional[str] = None,
+    content_encoding: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Decode an event envelope received from RabbitMQ or SNS.
+
+    Example:
+        # RabbitMQ consumer
+        event = decode_event(body, properties.content_type, properties.content_encoding)
+
+        # SNS/SQS consumer
+        attributes = notification["MessageAttributes"]
+        event = decode_event(
+            notification["Message"],
+            attributes.get("content_type", {}).get("Value"),
+            attributes.get("content_encoding", {}).get("Value"),
+        )
+
+    Args:
+        body: Message body
+        content_type: Content type the publisher set (defaults to JSON)
+        content_encoding: Comma-separated encodings in the order they were
+            applied, e.g. "gzip" or "gzip, base64" for compressed SNS messages
+
+    Returns:
+        Event envelope dictionary
+
+    Raises:
+        ValueError: If the content type or an encoding is not supported, or the
+            body cannot be decoded
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+
+    for encoding in reversed(parse_content_encoding(content_encoding)):
+        if encoding == "base64":
+            try:
+                body = base64.b64decode(body, validate=True)
+            except binascii.Error as e:
+                raise ValueError(f"Invalid base64 message body: {str(e)}") from e
+        else:
+            body = decompress(body, encoding)
+
+    return codec_for_content_type(content_type).decode(body)
@@ -0,0 +1,133 @@
+"""Optional payload compression for large event envelopes."""
+
+import gzip
+import threading
+import zlib
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+class Compressor(NamedTuple):
+    """A compression algorithm and the ``content_encoding`` token that names it."""
+
+    name: str
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+def _gzip() -> Compressor:
+    return Compressor("gzip", lambda body: gzip.compress(body, compresslevel=6), gzip.decompress)
+
+
+def _zlib() -> Compressor:
+    return Compressor("zlib", lambda body: zlib.compress(body, 6), zlib.decompress)
+
+
+def _zstd() -> Compressor:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstd compression requires zstandard: pip install fitviz-events[zstd]"
+        ) from e
+
+    # zstandard compressor and decompressor objects are not thread-safe, and
+    # publishers compress on every calling thread, so each thread gets its own.
+    local = threading.local()
+
+    def compress(body: bytes) -> bytes:
+        compressor = getattr(local, "compressor", None)
+        if compressor is None:
+            compressor = local.compressor = zstandard.ZstdCompressor()
+        compressed: bytes = compressor.compress(body)
+        return compressed
+
+    def decompress(body: bytes) -> bytes:
+        decompressor = getattr(local, "decompressor", None)
+        if decompressor is None:
+            decompressor = local.decompressor = zstandard.ZstdDecompressor()
+        decompressed: bytes = decompressor.decompress(body)
+        return decompressed
+
+    return Compressor("zstd", compress, decompress)
+
+
+COMPRESSORS: Dict[str, Callable[[], Compressor]] = {
+    "gzip": _gzip,
+    "zlib": _zlib,
+    "zstd": _zstd,
+}
+
+
+def get_compressor(name: Optional[str]) -> Optional[Compressor]:
+    """Resolve a compression algorithm by name.
+
+    Args:
+        name: "gzip", "zlib", "zstd", or None to disable compression
+
+    Returns:
+        Compressor, or None when compression is disabled
+
+    Raises:
+        ValueError: If the algorithm is unknown
+        ImportError: If zstd is requested and zstandard is not installed
+    """
+    if name is None:
+        return None
+
+    factory = COMPRESSORS.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown compression {name!r}; expected one of {', '.join(COMPRESSORS)}")
+    return factory()
+
+
+def compress_body(
+    body: bytes, compressor: Optional[Compressor], threshold: int
+) -> Tuple[bytes, Optional[str]]:
+    """Compress a message body if it is larger than ``threshold`` bytes.
+
+    The compressed body is only used when it is actually smaller.
+
+    Args:
+        body: Encoded message body
+        compressor: Compressor from ``get_compressor``, or None
+        threshold: Minimum body size in bytes worth compressing
+
+    Returns:
+        Tuple of the body to send and its ``content_encoding`` (None if uncompressed)
+    """
+    if compressor is None or len(body) < threshold:
+        return body, None
+
+    compressed = compressor.compress(body)
+    if len(compressed) >= len(body):
+        return body, None
+    return compressed, compressor.name
+
+
+def parse_content_encoding(content_encoding: Optional[str]) -> List[str]:
+    """Split a ``content_encoding`` value into tokens in the order they were applied."""
+    if not content_encoding:
+        return []
+    return [token.strip().lower() for token in content_encoding.split(",") if token.strip()]
+
+
+def decompress(body: bytes, encoding: str) -> bytes:
+    """Reverse a single compression ``content_encoding`` token.
+
+    Args:
+        body: Compressed message body
+        encoding: "gzip", "zlib" or "zstd"
+
+    Returns:
+        Decompressed body
+
+    Raises:
+        ValueError: If the encoding is unknown or the body is corrupt
+    """
+    compressor = get_compressor(encoding)
+    if compressor is None:
+        raise ValueError("A content encoding is required to decompress a message body")
+    try:
+        return compressor.decompress(body)
+    except Exception as e:
+        raise ValueError(f"Invalid {encoding} message body: {str(e)}") from e
@@ -0,0 +1,288 @@
+"""Thread-safe RabbitMQ publisher returning per-event delivery futures."""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+from uuid import UUID
+
+from fitviz_events.async_publisher import AsyncEventPublisher
+from fitviz_events.config import EventPublisherConfig
+from fitviz_events.confirms import resolve_future
+from fitviz_events.exceptions import EventPublishError
+from fitviz_events.forking import register_fork_handlers
+
+logger = logging.getLogger(__name__)
+
+
+class ConfirmingEventPublisher:
+    """Thread-safe publisher returning a delivery future per event.
+
+    Validation and serialization run on the calling thread. Messages are then
+    handed to a dedicated I/O thread that owns a non-blocking, confirm-mode
+    AMQP connection (see ``AsyncEventPublisher``). Messages are written
+    back-to-back without waiting, and the broker's (typically ``multiple``)
+    acks resolve the futures in batches, so durability costs no per-message
+    round trip.
+
+    Example:
+        publisher = ConfirmingEventPublisher(
+            rabbitmq_url="amqp://localhost:5672",
+            organization_id_getter=lambda: get_current_organization_id()
+        )
+
+        future = publisher.publish("payment.completed", data)
+        future.result(timeout=5)  # True once the broker acked the event
+
+        publisher.publish("workout.updated", data, callback=on_confirmed)
+    """
+
+    def __init__(
+        self,
+        rabbitmq_url: Optional[str] = None,
+        exchange_name: str = "fitviz.events",
+        organization_id_getter: Optional[Callable[[], Optional[UUID]]] = None,
+        retry_attempts: int = 3,
+        retry_delay: float = 1.0,
+        enable_validation: bool = True,
+        config: Optional[EventPublisherConfig] = None,
+    ):
+        """Initialize the confirming publisher.
+
+        Args:
+            rabbitmq_url: RabbitMQ connection URL
+            exchange_name: Exchange name for publishing events
+            organization_id_getter: Callable that returns current organization ID
+            retry_attempts: Number of connection retry attempts
+            retry_delay: Delay between retries in seconds
+            enable_validation: Whether to validate events with Pydantic
+            config: EventPublisherConfig instance (overrides individual params)
+        """
+        self._publisher = AsyncEventPublisher(
+            rabbitmq_url=rabbitmq_url,
+            exchange_name=exchange_name,
+            organization_id_getter=organization_id_getter,
+            retry_attempts=retry_attempts,
+            retry_delay=retry_delay,
+            enable_validation=enable_validation,
+            config=config,
+        )
+        self.config = self._publisher.config
+        self.organization_id_getter = organization_id_getter
+        self._is_closed = False
+        self._init_process_state()
+        register_fork_handlers(self)
+
+    def _init_process_state(self):
+        """Create the queue and I/O thread state owned by this process."""
+        self._pid = os.getpid()
+        self._outbox: Deque[Tuple[str, bytes, Optional[str], Future]] = deque()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._started = threading.Event()
+
+    def _after_fork(self):
+        """Drop state inherited from the parent process after ``os.fork()``.
+
+        The I/O thread and its event loop do not exist in the child, and the
+        queued and unconfirmed futures belong to the parent's callers, so all
+        of it is discarded along with the parent's connection; the child
+        starts its own I/O thread and connection on its next publish.
+        """
+        self._init_process_state()
+        self._publisher._init_process_state()
+
+    def _check_fork(self):
+        """Reset inherited state if this process was forked without running the fork hooks."""
+        if self._pid != os.getpid():
+            self._after_fork()
+
+    @property
+    def pending_confirms(self) -> int:
+        """Number of events queued or waiting for a broker confirm."""
+        return len(self._outbox) + self._publisher.pending_confirms
+
+    def _get_organization_id(self, organization_id: Optional[UUID] = None) -> Optional[str]:
+        """Get organization ID from parameter or getter."""
+        return self._publisher._get_organization_id(organization_id)
+
+    def publish(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        organization_id: Optional[UUID] = None,
+        callback: Optional[Callable[[Future], None]] = None,
+    ) -> Future:
+        """Publish an event and return its delivery future.
+
+        Args:
+            event_type: Type of event (e.g., "workout.created")
+            data: Event data dictionary
+            organization_id: Optional organization ID (uses getter if not provided)
+            callback: Optional callable invoked with the future once it resolves
+
+        Returns:
+            Future resolving to True on broker ack and False on nack. It fails
+            with EventValidationError or EventPublishError if the event is
+            invalid, has no organization ID, or the channel closes first.
+        """
+        future: Future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+
+        try:
+            if self._is_closed:
+                raise EventPublishError("Publisher is closed", event_type=event_type)
+
+            org_id = self._get_organization_id(organization_id)
+            if not org_id:
+                raise EventPublishError("No organization ID available", event_type=event_type)
+
+            validated_data = self._publisher._validate_event(event_type, data, org_id)
+            message_body, content_encoding = self._publisher._encode_message(
+                event_type, data, org_id, validated_data
+            )
+
+        except Exception as e:
+            future.set_exception(e)
+            return future
+
+        self._check_fork()
+        self._ensure_io_thread()
+        self._outbox.append((event_type, message_body, content_encoding, future))
+        self._wake()
+        return future
+
+    def publish_and_wait(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        organization_id: Optional[UUID] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Publish an event and block until the broker confirms it.
+
+        Args:
+            event_type: Type of event (e.g., "workout.created")
+            data: Event data dictionary
+            organization_id: Optional organization ID (uses getter if not provided)
+            timeout: Seconds to wait (defaults to ``config.confirm_timeout``)
+
+        Returns:
+            True if the broker acknowledged the event, False otherwise
+        """
+        if timeout is None:
+            timeout = self.config.confirm_timeout
+        try:
+            return bool(self.publish(event_type, data, organization_id).result(timeout))
+        except Exception as e:
+            logger.error(f"Confirmed publish of {event_type} failed: {str(e)}")
+            return False
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every published event has been confirmed or failed.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            True if nothing is pending, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.pending_confirms:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def _ensure_io_thread(self):
+        """Start the I/O thread and its event loop on first use."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run_loop, name="fitviz-events-confirms", daemon=True
+            )
+            self._thread.start()
+            self._started.wait()
+
+    def _run_loop(self):
+        """Body of the I/O thread."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        wakeup = asyncio.Event()
+        self._loop, self._wakeup = loop, wakeup
+        self._started.set()
+        try:
+            loop.run_until_complete(self._drain(wakeup))
+        finally:
+            loop.close()
+
+    def _wake(self):
+        """Wake the I/O thread to write queued messages, or to stop once closed."""
+        loop, wakeup = self._loop, self._wakeup
+        if loop is not None and wakeup is not None:
+            loop.call_soon_threadsafe(wakeup.set)
+
+    async def _drain(self, wakeup: asyncio.Event):
+        """Write queued messages to the channel as they arrive."""
+        while not self._is_closed:
+            await wakeup.wait()
+            wakeup.clear()
+
+            if self._outbox and not await self._publisher.connect():
+                self._fail_outbox(EventPublishError("Failed to connect to RabbitMQ"))
+
+            while self._outbox:
+                event_type, message_body, content_encoding, future = self._outbox.popleft()
+                if future.cancelled():
+                    continue
+                try:
+                    self._publisher._send(event_type, message_body, future, content_encoding)
+                except Exception as e:
+                    resolve_future(future, exception=e)
+
+        await self._publisher.close()
+
+    def _fail_outbox(self, error: BaseException):
+        """Fail every message still waiting to be written."""
+        while self._outbox:
+            resolve_future(self._outbox.popleft()[3], exception=error)
+
+    def close(self, timeout: Optional[float] = None):
+        """Wait for outstanding confirms, then close the connection.
+
+        Args:
+            timeout: Seconds to wait for confirms (defaults to ``config.confirm_timeout``)
+        """
+        if self._is_closed:
+            return
+        if timeout is None:
+            timeout = self.config.confirm_timeout
+        self.flush(timeout)
+        self._is_closed = True
+
+        if self._thread is not None:
+            self._wake()
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logger.warning("Confirm I/O thread did not stop in time")
+        self._fail_outbox(EventPublishError("Publisher is closed"))
+        logger.info("Confirming publisher closed")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+        return False
@@ -0,0 +1,100 @@
+"""Delivery tracking for batched RabbitMQ publisher confirms."""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import InvalidStateError
+from typing import Any, Optional
+
+
+def resolve_future(future: Any, result: Any = None, exception: Optional[BaseException] = None):
+    """Complete a future unless it is already done or was cancelled."""
+    if future.done():
+        return
+    try:
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    except (InvalidStateError, asyncio.InvalidStateError):
+        pass
+
+
+class DeliveryTracker:
+    """Outstanding publisher confirms keyed by delivery tag.
+
+    Delivery tags increase monotonically per channel, so pending futures are
+    kept in tag order and a ``multiple`` ack or nack resolves every tag up to
+    the acknowledged one in a single pass without scanning the rest.
+
+    Works with both ``asyncio.Future`` and ``concurrent.futures.Future``.
+    """
+
+    def __init__(self):
+        self._pending: "OrderedDict[int, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_tag = 1
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def register(self, future: Any) -> int:
+        """Register the future for the next published message.
+
+        Must be called once per ``basic_publish`` on the confirm-mode channel,
+        in publish order.
+
+        Returns:
+            The delivery tag assigned to the message
+        """
+        with self._lock:
+            tag = self._next_tag
+            self._next_tag += 1
+            self._pending[tag] = future
+            return tag
+
+    def confirm(self, delivery_tag: int, multiple: bool = False, acked: bool = True) -> int:
+        """Resolve futures for a Basic.Ack or Basic.Nack.
+
+        Args:
+            delivery_tag: Delivery tag from the broker
+            multiple: Whether the confirm covers every tag up to ``delivery_tag``
+            acked: True for an ack, False for a nack
+
+        Returns:
+            Number of futures resolved
+        """
+        resolved = []
+        with self._lock:
+            if multiple:
+                while self._pending:
+                    tag = next(iter(self._pending))
+                    if tag > delivery_tag:
+                        break
+                    resolved.append(self._pending.popitem(last=False)[1])
+            else:
+                future = self._pending.pop(delivery_tag, None)
+                if future is not None:
+                    resolved.append(future)
+
+        for future in resolved:
+            resolve_future(future, acked)
+        return len(resolved)
+
+    def on_delivery_confirmation(self, method_frame):
+        """pika ``ack_nack_callback`` resolving futures from a method frame."""
+        method = method_frame.method
+        self.confirm(
+            method.delivery_tag,
+            multiple=method.multiple,
+            acked=method.NAME == "Basic.Ack",
+        )
+
+    def fail_all(self, error: BaseException):
+        """Fail every outstanding future and restart tags for a new channel."""
+        with self._lock:
+            pending, self._pending = self._pending, OrderedDict()
+            self._next_tag = 1
+
+        for future in pending.values():
+            resolve_future(future, exception=error)
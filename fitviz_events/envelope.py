@@ -0,0 +1,144 @@
+"""Validation and envelope helpers shared by every FitViz publisher."""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Union
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from fitviz_events.exceptions import EventValidationError
+from fitviz_events.validation import (
+    dump_event_data,
+    dump_event_data_json,
+    validate_event_model,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_organization_id(
+    organization_id: Optional[Union[str, UUID]] = None,
+    organization_id_getter: Optional[Callable[[], Optional[UUID]]] = None,
+) -> Optional[str]:
+    """Get organization ID from parameter or getter.
+
+    Args:
+        organization_id: Explicit organization ID
+        organization_id_getter: Callable that returns current organization ID
+
+    Returns:
+        Organization ID as string or None
+    """
+    if organization_id:
+        return str(organization_id)
+
+    if organization_id_getter:
+        org_id = organization_id_getter()
+        return str(org_id) if org_id else None
+
+    return None
+
+
+def validate_event(event_type: str, data: Dict[str, Any]) -> Optional[BaseModel]:
+    """Validate event data using the compiled schema for its event type.
+
+    Args:
+        event_type: Type of the event
+        data: Event data dictionary
+
+    Returns:
+        Validated data model, or None for event types without a schema
+
+    Raises:
+        EventValidationError: If validation fails
+    """
+    try:
+        validated_data = validate_event_model(event_type, data)
+        if validated_data is None:
+            logger.warning(f"No validation schema for event type: {event_type}")
+        return validated_data
+
+    except Exception as e:
+        raise EventValidationError(
+            f"Event validation failed for {event_type}: {str(e)}",
+            event_type=event_type,
+            validation_errors=[str(e)],
+        )
+
+
+def _envelope_header(
+    event_type: str, organization_id: str, event_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build the envelope fields that surround the event data."""
+    return {
+        "event_id": event_id or str(uuid4()),
+        "event_type": event_type,
+        "organization_id": organization_id,
+        "timestamp": datetime.now(timezone.utc),
+    }
+
+
+def build_event_payload(
+    event_type: str,
+    data: Dict[str, Any],
+    organization_id: str,
+    validated_data: Optional[BaseModel] = None,
+    event_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build the event envelope as a dictionary for non-JSON codecs.
+
+    Values are left as Python objects (``datetime``, ``UUID``), so the codec
+    decides how to encode them.
+
+    Args:
+        event_type: Type of the event
+        data: Event data dictionary
+        organization_id: Organization ID
+        validated_data: Model returned by ``validate_event``, if validation ran
+        event_id: Event ID to use (a new UUID if omitted)
+
+    Returns:
+        Event envelope dictionary
+    """
+    payload = _envelope_header(event_type, organization_id, event_id)
+    if validated_data is None:
+        payload["data"] = data
+    else:
+        payload["data"] = dump_event_data(event_type, data, validated_data)
+    return payload
+
+
+def serialize_event(
+    event_type: str,
+    data: Dict[str, Any],
+    organization_id: str,
+    validated_data: Optional[BaseModel] = None,
+    event_id: Optional[str] = None,
+) -> bytes:
+    """Serialize the event envelope sent to the notification service.
+
+    The envelope is written to JSON bytes by pydantic-core in a single pass.
+    A validated data model is serialized directly, so the schema's coercions
+    are kept and no intermediate dict is built; keys the schema does not
+    declare are passed through. Unvalidated data is written as-is, including
+    ``datetime``, ``date`` and ``UUID`` values. The timestamp is in UTC.
+
+    Args:
+        event_type: Type of the event
+        data: Event data dictionary
+        organization_id: Organization ID
+        validated_data: Model returned by ``validate_event``, if validation ran
+        event_id: Event ID to use (a new UUID if omitted)
+
+    Returns:
+        UTF-8 encoded JSON envelope
+    """
+    header = to_json(_envelope_header(event_type, organization_id, event_id))
+    if validated_data is None:
+        body = to_json(data)
+    else:
+        body = dump_event_data_json(event_type, data, validated_data)
+
+    return b"".join((header[:-1], b',"data":', body, b"}"))
@@ -1,7 +1,7 @@
 """Event schema definitions for FitViz domain events."""
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Type
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -241,7 +241,7 @@ class ClassCancelledEvent(BaseEvent):
     data: ClassData
 
 
-EVENT_TYPE_MAP = {
+EVENT_TYPE_MAP: Dict[str, Type[BaseEvent]] = {
     "workout.created": WorkoutCreatedEvent,
     "workout.updated": WorkoutUpdatedEvent,
     "workout.deleted": WorkoutDeletedEvent,
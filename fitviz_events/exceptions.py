@@ -1,10 +1,17 @@
 """Custom exceptions for FitViz event publisher."""
 
+from typing import Optional
+
 
 class EventPublishError(Exception):
     """Raised when event publishing fails."""
 
-    def __init__(self, message: str, event_type: str = None, original_error: Exception = None):
+    def __init__(
+        self,
+        message: str,
+        event_type: Optional[str] = None,
+        original_error: Optional[Exception] = None,
+    ):
         self.event_type = event_type
         self.original_error = original_error
         super().__init__(message)
@@ -13,7 +20,12 @@ class EventPublishError(Exception):
 class EventValidationError(Exception):
     """Raised when event validation fails."""
 
-    def __init__(self, message: str, event_type: str = None, validation_errors: list = None):
+    def __init__(
+        self,
+        message: str,
+        event_type: Optional[str] = None,
+        validation_errors: Optional[list] = None,
+    ):
         self.event_type = event_type
         self.validation_errors = validation_errors or []
         super().__init__(message)
@@ -22,7 +34,30 @@ class EventValidationError(Exception):
 class ConnectionError(Exception):
     """Raised when RabbitMQ connection fails."""
 
-    def __init__(self, message: str, rabbitmq_url: str = None, original_error: Exception = None):
+    def __init__(
+        self,
+        message: str,
+        rabbitmq_url: Optional[str] = None,
+        original_error: Optional[Exception] = None,
+    ):
         self.rabbitmq_url = rabbitmq_url
         self.original_error = original_error
         super().__init__(message)
+
+
+class CircuitOpenError(EventPublishError):
+    """Raised when a circuit breaker rejects a publish without trying the broker."""
+
+
+class ClaimCheckError(Exception):
+    """Raised when an offloaded payload cannot be stored, fetched or verified."""
+
+    def __init__(
+        self,
+        message: str,
+        reference: Optional[str] = None,
+        original_error: Optional[Exception] = None,
+    ):
+        self.reference = reference
+        self.original_error = original_error
+        super().__init__(message)
@@ -0,0 +1,281 @@
+"""Publish every event to several publishers at once."""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID
+
+from fitviz_events.config import FanoutConfig
+from fitviz_events.envelope import build_event_payload, resolve_organization_id, validate_event
+from fitviz_events.exceptions import EventValidationError
+from fitviz_events.forking import register_fork_handlers
+
+logger = logging.getLogger(__name__)
+
+
+class SinkStats:
+    """Publish outcomes and latency for one sink."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.published = 0
+        self.failed = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def record(self, success: bool, latency: float):
+        with self._lock:
+            if success:
+                self.published += 1
+            else:
+                self.failed += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            calls = self.published + self.failed
+            return {
+                "published": self.published,
+                "failed": self.failed,
+                "avg_latency": self.total_latency / calls if calls else 0.0,
+                "max_latency": self.max_latency,
+            }
+
+
+class FanoutPublisher:
+    """Deliver every event to a set of named publishers concurrently.
+
+    The event is validated once and its envelope built once, so every sink
+    sends the same ``event_id`` and timestamp. Sinks with ``publish_encoded``
+    (``EventPublisher``, ``SNSEventPublisher``) receive the envelope encoded
+    once per codec; other synchronous publishers get the event data through
+    ``publish``. The primary sink is called on the publishing thread while the
+    others run in parallel on a shared pool, so a publish takes as long as the
+    slowest sink the success policy waits for rather than the sum of all, and
+    the primary never queues behind other requests for a pool thread.
+
+    Example:
+        publisher = FanoutPublisher(
+            {
+                "rabbitmq": EventPublisher(rabbitmq_url="amqp://localhost:5672"),
+                "sns": SNSEventPublisher(config=sns_config),
+            },
+            config=FanoutConfig(success_policy="primary", primary="rabbitmq"),
+            organization_id_getter=get_current_organization_id,
+        )
+
+        publisher.publish("workout.created", {...})
+        publisher.stats()  # {"rabbitmq": {"published": 1, ...}, "sns": {...}}
+    """
+
+    def __init__(
+        self,
+        sinks: Dict[str, Any],
+        config: Optional[FanoutConfig] = None,
+        organization_id_getter: Optional[Callable[[], Optional[UUID]]] = None,
+    ):
+        """Initialize the fan-out publisher.
+
+        Args:
+            sinks: Publishers keyed by the name used in stats and ``FanoutConfig.primary``
+            config: FanoutConfig instance (defaults used if omitted)
+            organization_id_getter: Callable that returns current organization ID
+                (defaults to the primary sink's)
+
+        Raises:
+            ValueError: If there are no sinks or the primary is not one of them
+        """
+        if not sinks:
+            raise ValueError("At least one sink is required")
+
+        self.config = config or FanoutConfig()
+        self.sinks = dict(sinks)
+        self.organization_id_getter = organization_id_getter
+
+        self._primary = self.config.primary or next(iter(self.sinks))
+        if self._primary not in self.sinks:
+            raise ValueError(f"Primary sink {self._primary!r} is not one of the sinks")
+
+        self._stats = {name: SinkStats() for name in self.sinks}
+        self._is_closed = False
+        self._init_process_state()
+        register_fork_handlers(self)
+
+    def _init_process_state(self):
+        """Create the dispatch threads owned by this process."""
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.max_workers or max(4 * (len(self.sinks) - 1), 1),
+            thread_name_prefix="fitviz-events-fanout",
+        )
+
+    def _after_fork(self):
+        """Replace the dispatch threads, which do not exist in a forked child."""
+        self._init_process_state()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-sink publish counts and latency in seconds.
+
+        Returns:
+            Dictionary mapping sink name to ``published``, ``failed``,
+            ``avg_latency`` and ``max_latency``
+        """
+        return {name: stats.snapshot() for name, stats in self._stats.items()}
+
+    def _get_organization_id(self, organization_id: Optional[UUID] = None) -> Optional[str]:
+        """Get organization ID from parameter, getter or the primary sink."""
+        if self.organization_id_getter is not None or organization_id:
+            return resolve_organization_id(organization_id, self.organization_id_getter)
+        org_id: Optional[str] = self.sinks[self._primary]._get_organization_id(organization_id)
+        return org_id
+
+    def publish(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        organization_id: Optional[UUID] = None,
+    ) -> bool:
+        """Publish an event to every sink.
+
+        Args:
+            event_type: Type of event (e.g., "workout.created")
+            data: Event data dictionary
+            organization_id: Optional organization ID (uses getter if not provided)
+
+        Returns:
+            True if the sinks required by the success policy published the event,
+            False otherwise
+        """
+        if self._is_closed:
+            logger.warning("Publisher is closed, cannot publish event")
+            return False
+
+        try:
+            org_id = self._get_organization_id(organization_id)
+            if not org_id:
+                logger.warning("No organization ID available, skipping event publish")
+                return False
+
+            validated_data = None
+            if self.config.enable_validation:
+                validated_data = validate_event(event_type, data)
+            payload = build_event_payload(event_type, data, org_id, validated_data)
+
+            bodies: Dict[type, bytes] = {}
+            futures: Dict[str, Future] = {}
+            primary_body = None
+            for name, sink in self.sinks.items():
+                body = None
+                codec = getattr(sink, "codec", None)
+                if codec is not None and hasattr(sink, "publish_encoded"):
+                    body = bodies.get(type(codec))
+                    if body is None:
+                        body = bodies[type(codec)] = codec.encode(payload)
+                if name == self._primary:
+                    primary_body = body
+                else:
+                    futures[name] = self._executor.submit(
+                        self._send, name, sink, event_type, data, org_id, body
+                    )
+
+        except EventValidationError as e:
+            logger.error(f"Event validation failed: {str(e)}")
+            return False
+
+        except Exception as e:
+            logger.error(f"Unexpected error fanning out event: {str(e)}")
+            return False
+
+        primary_success = self._send(
+            self._primary, self.sinks[self._primary], event_type, data, org_id, primary_body
+        )
+        return self._outcome(primary_success, futures)
+
+    async def async_publish(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        organization_id: Optional[UUID] = None,
+    ) -> bool:
+        """Publish an event to every sink asynchronously.
+
+        Args:
+            event_type: Type of event (e.g., "workout.created")
+            data: Event data dictionary
+            organization_id: Optional organization ID
+
+        Returns:
+            True if the sinks required by the success policy published the event,
+            False otherwise
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.publish, event_type, data, organization_id)
+
+    def _send(
+        self,
+        name: str,
+        sink: Any,
+        event_type: str,
+        data: Dict[str, Any],
+        org_id: str,
+        body: Optional[bytes],
+    ) -> bool:
+        """Publish to one sink and record the outcome."""
+        start = time.monotonic()
+        try:
+            if body is not None:
+                success = bool(sink.publish_encoded(event_type, body, organization_id=org_id))
+            else:
+                success = bool(sink.publish(event_type, data, organization_id=org_id))
+        except Exception as e:
+            logger.error(f"Unexpected error publishing to sink {name}: {str(e)}")
+            success = False
+
+        self._stats[name].record(success, time.monotonic() - start)
+        if not success:
+            logger.warning(f"Sink {name} failed to publish event: {event_type}")
+        return success
+
+    def _outcome(self, primary_success: bool, futures: Dict[str, Future]) -> bool:
+        """Wait for the other sinks the success policy needs and apply it."""
+        policy = self.config.success_policy
+        if policy == "primary":
+            return primary_success
+        if policy == "all":
+            return all([primary_success] + [future.result() for future in futures.values()])
+        if primary_success:
+            return True
+
+        pending = set(futures.values())
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            if any(future.result() for future in done):
+                return True
+        return False
+
+    def close(self):
+        """Wait for in-flight publishes and close every sink."""
+        if self._is_closed:
+            return
+        self._is_closed = True
+
+        self._executor.shutdown(wait=True)
+        for name, sink in self.sinks.items():
+            try:
+                sink.close()
+            except Exception as e:
+                logger.error(f"Error closing sink {name}: {str(e)}")
+
+        logger.info("Fan-out publisher closed")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+        return False
@@ -0,0 +1,186 @@
+"""Flask extension that batches a request's events until the response is sent."""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+try:
+    from flask import Flask, Response, g, has_request_context
+except ImportError as e:
+    raise ImportError("The Flask extension requires Flask: pip install fitviz-events[flask]") from e
+
+logger = logging.getLogger(__name__)
+
+EXTENSION_NAME = "fitviz_events"
+
+
+class RequestBatch:
+    """Events collected during one request."""
+
+    def __init__(self):
+        self.events: List[Tuple[str, Dict[str, Any], str]] = []
+
+    def discard(self):
+        """Drop the collected events."""
+        self.events = []
+
+
+class FitVizEvents:
+    """Collect events published during a request and flush them after the response.
+
+    Events published through the extension inside a request are kept in ``g``
+    and sent as one batch once the response has been sent to the client, using
+    ``publish_many`` when the publisher has it (``SNSEventPublisher``) and
+    ``publish`` for each event otherwise. If the request raises an exception or
+    returns an error response (status 400 or above, by default), the events are
+    discarded, so consumers never see events for changes that were rolled back
+    or rejected. Outside a request, events are published immediately.
+
+    Example:
+        events = FitVizEvents(app, EventPublisher(
+            rabbitmq_url=app.config["RABBITMQ_URL"],
+            organization_id_getter=lambda: g.get("organization_id"),
+        ))
+
+        @app.route("/workouts", methods=["POST"])
+        def create_workout():
+            events.publish("workout.created", {...})  # sent after the response
+            return jsonify(workout), 201
+    """
+
+    def __init__(
+        self,
+        app: Optional[Flask] = None,
+        publisher: Any = None,
+        discard_status: Optional[int] = 400,
+    ):
+        """Initialize the extension.
+
+        Args:
+            app: Flask application (or call ``init_app`` later)
+            publisher: Publisher the batches are flushed through
+            discard_status: Lowest response status whose events are discarded
+                (e.g. 500 to keep events of 4xx responses, None to only discard
+                when the request raises)
+        """
+        self.publisher = publisher
+        self.discard_status = discard_status
+        if app is not None:
+            self.init_app(app, publisher)
+
+    def init_app(self, app: Flask, publisher: Any = None):
+        """Register the extension's request hooks on an application.
+
+        Args:
+            app: Flask application
+            publisher: Publisher to use (defaults to the one passed to the constructor)
+
+        Raises:
+            ValueError: If no publisher was given
+        """
+        if publisher is not None:
+            self.publisher = publisher
+        if self.publisher is None:
+            raise ValueError("A publisher is required")
+
+        app.extensions[EXTENSION_NAME] = self
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+
+    def publish(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        organization_id: Optional[UUID] = None,
+    ) -> bool:
+        """Queue an event for the current request's batch.
+
+        The organization ID is resolved now, while the request context is
+        still available to the publisher's getter.
+
+        Args:
+            event_type: Type of event (e.g., "workout.created")
+            data: Event data dictionary
+            organization_id: Optional organization ID (uses getter if not provided)
+
+        Returns:
+            True if the event was queued (or published, outside a request),
+            False otherwise
+        """
+        if not has_request_context():
+            return bool(self.publisher.publish(event_type, data, organization_id=organization_id))
+
+        org_id = self.publisher._get_organization_id(organization_id)
+        if not org_id:
+            logger.warning("No organization ID available, skipping event publish")
+            return False
+
+        self._batch().events.append((event_type, data, org_id))
+        return True
+
+    @property
+    def pending(self) -> int:
+        """Number of events queued in the current request."""
+        if not has_request_context():
+            return 0
+        batch = g.get("_fitviz_events_batch")
+        return len(batch.events) if batch is not None else 0
+
+    def _batch(self) -> RequestBatch:
+        batch: Optional[RequestBatch] = g.get("_fitviz_events_batch")
+        if batch is None:
+            batch = g._fitviz_events_batch = RequestBatch()
+        return batch
+
+    def _after_request(self, response: Response) -> Response:
+        batch = g.get("_fitviz_events_batch")
+        if batch is None or not batch.events:
+            return response
+
+        if self.discard_status is not None and response.status_code >= self.discard_status:
+            logger.info(
+                f"Discarding {len(batch.events)} events for failed request "
+                f"({response.status_code})"
+            )
+            batch.discard()
+            return response
+
+        response.call_on_close(lambda: self._flush(batch))
+        return response
+
+    def _teardown_request(self, error: Optional[BaseException] = None):
+        batch = g.get("_fitviz_events_batch")
+        if error is not None and batch is not None and batch.events:
+            logger.info(f"Discarding {len(batch.events)} events for failed request: {str(error)}")
+            batch.discard()
+
+    def _flush(self, batch: RequestBatch) -> List[bool]:
+        """Publish a request's events after its response was sent.
+
+        Args:
+            batch: Events collected during the request
+
+        Returns:
+            List of per-event results, True if published successfully
+        """
+        events, batch.events = batch.events, []
+        if not events:
+            return []
+
+        results: List[bool]
+        try:
+            if hasattr(self.publisher, "publish_many"):
+                results = self.publisher.publish_many(events)
+            else:
+                results = [
+                    self.publisher.publish(event_type, data, organization_id=org_id)
+                    for event_type, data, org_id in events
+                ]
+        except Exception as e:
+            logger.error(f"Unexpected error flushing request events: {str(e)}")
+            return [False] * len(events)
+
+        failed = results.count(False)
+        if failed:
+            logger.error(f"Failed to publish {failed} of {len(events)} request events")
+        return results
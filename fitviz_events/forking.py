@@ -0,0 +1,44 @@
+"""Reset publisher state in processes forked from the one that created it."""
+
+import logging
+import os
+import weakref
+
+logger = logging.getLogger(__name__)
+
+_registered: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def register_fork_handlers(obj):
+    """Run an object's fork handlers around every ``os.fork()``.
+
+    Sockets, boto3 clients, locks and background threads do not survive a
+    fork intact: a forked child shares the parent's sockets and gets copies of
+    locks that may be held by threads that no longer exist. A registered
+    object's ``_before_fork()`` runs in the parent just before the fork and its
+    ``_after_fork()`` runs in the child, where it should drop inherited state
+    and rebuild it on next use. Either method may be omitted. Objects are held
+    weakly, so registering does not keep them alive.
+
+    Args:
+        obj: Object defining ``_before_fork()`` and/or ``_after_fork()``
+    """
+    _registered.add(obj)
+
+
+def _run_handlers(name: str):
+    for obj in list(_registered):
+        handler = getattr(obj, name, None)
+        if handler is None:
+            continue
+        try:
+            handler()
+        except Exception as e:
+            logger.error(f"{type(obj).__name__}.{name} failed: {str(e)}")
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=lambda: _run_handlers("_before_fork"),
+        after_in_child=lambda: _run_handlers("_after_fork"),
+    )
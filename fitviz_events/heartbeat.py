@@ -0,0 +1,109 @@
+"""Background pump that services idle pika BlockingConnections."""
+
+import logging
+import threading
+from typing import Callable, List, Optional
+
+from fitviz_events.channel_pool import PooledConnection
+
+logger = logging.getLogger(__name__)
+
+
+class HeartbeatPump:
+    """Periodically lets idle BlockingConnections process heartbeats.
+
+    A BlockingConnection only reads from its socket when it is used, so a
+    publisher that sits idle longer than the negotiated heartbeat timeout has
+    its connection dropped by the broker. The pump calls
+    ``process_data_events(time_limit=0)`` on every pooled connection each
+    ``interval`` seconds. It takes the connection's lock without blocking and
+    skips connections a publisher is using, since publishing services them
+    anyway.
+
+    Example:
+        pump = HeartbeatPump(lambda: pool.connections, interval=30)
+        pump.start()
+    """
+
+    def __init__(
+        self,
+        connections: Callable[[], List[PooledConnection]],
+        interval: float,
+        on_connection_lost: Optional[Callable[[], None]] = None,
+        name: str = "fitviz-events-heartbeat",
+    ):
+        """Initialize the pump.
+
+        Args:
+            connections: Callable returning the connections to service
+            interval: Seconds between passes
+            on_connection_lost: Called after a pass that found a closed connection
+            name: Name of the pump thread
+        """
+        self._connections = connections
+        self._interval = interval
+        self._on_connection_lost = on_connection_lost
+        self._name = name
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the pump thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the pump thread unless already running or closed."""
+        with self._lock:
+            if self.is_running or self._stopped.is_set():
+                return
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+
+    def pump_once(self) -> int:
+        """Service every idle connection once.
+
+        Returns:
+            Number of connections that processed data events
+        """
+        serviced = 0
+        lost = False
+
+        for pooled in self._connections():
+            if not pooled.is_open:
+                lost = True
+                continue
+            if not pooled.lock.acquire(blocking=False):
+                continue
+
+            try:
+                pooled.connection.process_data_events(time_limit=0)
+                serviced += 1
+            except Exception as e:
+                logger.warning(f"Heartbeat failed on idle connection: {str(e)}")
+                lost = True
+            finally:
+                pooled.lock.release()
+
+        if lost and self._on_connection_lost is not None:
+            self._on_connection_lost()
+        return serviced
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            try:
+                self.pump_once()
+            except Exception as e:
+                logger.error(f"Unexpected error in heartbeat pump: {str(e)}")
+
+    def close(self, timeout: Optional[float] = None):
+        """Stop the pump.
+
+        Args:
+            timeout: Seconds to wait for the current pass to finish
+        """
+        self._stopped.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
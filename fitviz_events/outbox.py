@@ -0,0 +1,445 @@
+"""Durable local outbox for events that could not reach the broker."""
+
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from pydantic_core import from_json, to_json
+
+from fitviz_events.config import OutboxConfig
+from fitviz_events.forking import register_fork_handlers
+
+logger = logging.getLogger(__name__)
+
+# Each record is framed as <payload length><crc32 of payload><payload>; the
+# payload is a length-prefixed JSON header ([event_type, headers]) followed by
+# the raw message body.
+_FRAME = struct.Struct("<II")
+_HEADER_LENGTH = struct.Struct("<I")
+_SEGMENT_SUFFIX = ".seg"
+_CHECKPOINT = "checkpoint"
+
+
+class OutboxRecord(NamedTuple):
+    """An encoded event stored in the outbox."""
+
+    offset: int
+    event_type: str
+    body: bytes
+    headers: Dict[str, str]
+
+
+def _encode_record(event_type: str, body: bytes, headers: Dict[str, str]) -> bytes:
+    header = to_json([event_type, headers])
+    payload = b"".join((_HEADER_LENGTH.pack(len(header)), header, body))
+    return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def _decode_payload(offset: int, payload: bytes) -> OutboxRecord:
+    (header_length,) = _HEADER_LENGTH.unpack_from(payload)
+    header_end = _HEADER_LENGTH.size + header_length
+    event_type, headers = from_json(payload[_HEADER_LENGTH.size : header_end])
+    return OutboxRecord(offset, event_type, payload[header_end:], headers)
+
+
+def _iter_frames(buffer, position: int) -> Iterator[Tuple[bytes, int]]:
+    """Yield ``(payload, end position)`` for each intact frame from ``position``.
+
+    Stops at the first truncated or corrupt frame, which marks the end of the
+    valid data in a segment.
+    """
+    size = len(buffer)
+    while position + _FRAME.size <= size:
+        length, crc = _FRAME.unpack_from(buffer, position)
+        start = position + _FRAME.size
+        end = start + length
+        if end > size:
+            return
+        payload = buffer[start:end]
+        if zlib.crc32(payload) != crc:
+            return
+        yield payload, end
+        position = end
+
+
+class SegmentLog:
+    """Append-only log of encoded events split into segment files.
+
+    Appends go through a buffered file and are fsynced in batches every
+    ``fsync_interval`` seconds by a background thread, so writers never wait
+    on the disk. Records are read back through memory maps of the segment
+    files. ``commit`` records the replay position in a checkpoint file and
+    deletes segments that have been fully replayed.
+
+    Records are identified by a monotonically increasing offset. A single
+    reader is supported; any number of threads may append.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        segment_bytes: int = 64 * 1024 * 1024,
+        fsync_interval: float = 0.05,
+    ):
+        self.path = path
+        self._segment_bytes = segment_bytes
+        self._fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._unsynced = False
+        self._read_positions: Dict[int, Tuple[int, int]] = {}
+
+        os.makedirs(path, exist_ok=True)
+        self._recover()
+        register_fork_handlers(self)
+
+        self._flusher: Optional[threading.Thread] = None
+        if fsync_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._run_flusher, name="fitviz-events-outbox-fsync", daemon=True
+            )
+            self._flusher.start()
+
+    def __len__(self) -> int:
+        """Number of appended records not yet committed."""
+        return self._next_offset - self._committed
+
+    def _segment_path(self, base: int) -> str:
+        return os.path.join(self.path, f"{base:020d}{_SEGMENT_SUFFIX}")
+
+    def _recover(self):
+        """Rebuild offsets from disk, dropping any torn write at the tail."""
+        self._segments: List[int] = sorted(
+            int(name[: -len(_SEGMENT_SUFFIX)])
+            for name in os.listdir(self.path)
+            if name.endswith(_SEGMENT_SUFFIX)
+        )
+        checkpoint = self._read_checkpoint()
+        if not self._segments:
+            self._segments.append(checkpoint or 0)
+
+        active = self._segments[-1]
+        count, valid_end = self._scan(active)
+        active_path = self._segment_path(active)
+        if os.path.exists(active_path) and os.path.getsize(active_path) > valid_end:
+            logger.warning(f"Truncating torn write at end of outbox segment {active_path}")
+            with open(active_path, "r+b") as f:
+                f.truncate(valid_end)
+
+        self._next_offset = active + count
+        self._committed = min(
+            max(checkpoint if checkpoint is not None else self._segments[0], self._segments[0]),
+            self._next_offset,
+        )
+        self._compact()
+
+        base = max(b for b in self._segments if b <= self._committed)
+        _, position = self._scan(base, limit=self._committed - base)
+        self._cursor = (base, position)
+
+        self._file = open(active_path, "ab")
+        self._size = valid_end
+
+    def _scan(self, base: int, limit: Optional[int] = None) -> Tuple[int, int]:
+        """Count intact records in a segment.
+
+        Returns:
+            Tuple of the record count and the end position of the last one
+        """
+        count = position = 0
+        if limit == 0:
+            return count, position
+
+        buffer = self._map(base)
+        try:
+            for _, position in _iter_frames(buffer, 0):
+                count += 1
+                if limit is not None and count >= limit:
+                    break
+        finally:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+        return count, position
+
+    def _map(self, base: int):
+        """Memory-map a segment for reading."""
+        try:
+            with open(self._segment_path(base), "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return b""
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return b""
+
+    def _read_checkpoint(self) -> Optional[int]:
+        try:
+            with open(os.path.join(self.path, _CHECKPOINT)) as f:
+                return int(f.read().strip())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_checkpoint(self):
+        path = os.path.join(self.path, _CHECKPOINT)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(str(self._committed))
+        os.replace(tmp_path, path)
+
+    def _compact(self):
+        """Delete sealed segments whose records have all been committed."""
+        while len(self._segments) > 1 and self._segments[1] <= self._committed:
+            base = self._segments.pop(0)
+            try:
+                os.remove(self._segment_path(base))
+            except FileNotFoundError:
+                pass
+
+    def append(self, event_type: str, body: bytes, headers: Optional[Dict[str, str]] = None) -> int:
+        """Append an encoded event.
+
+        Args:
+            event_type: Routing key or event type
+            body: Encoded message body
+            headers: Transport headers needed to replay the message
+
+        Returns:
+            Offset of the new record
+
+        Raises:
+            OSError: If the record cannot be written
+        """
+        frame = _encode_record(event_type, body, headers or {})
+        with self._lock:
+            if self._closed.is_set():
+                raise OSError("Outbox is closed")
+
+            self._file.write(frame)
+            self._size += len(frame)
+            offset = self._next_offset
+            self._next_offset += 1
+            self._unsynced = True
+
+            if self._fsync_interval <= 0:
+                self._sync_locked()
+            if self._size >= self._segment_bytes:
+                self._roll_locked()
+            return offset
+
+    def _roll_locked(self):
+        """Seal the active segment and start a new one."""
+        self._sync_locked()
+        self._file.close()
+        self._segments.append(self._next_offset)
+        self._file = open(self._segment_path(self._next_offset), "ab")
+        self._size = 0
+
+    def _sync_locked(self):
+        if self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = False
+
+    def sync(self):
+        """Flush and fsync appended records now."""
+        with self._lock:
+            if not self._file.closed:
+                self._sync_locked()
+
+    def _run_flusher(self):
+        while not self._closed.wait(self._fsync_interval):
+            try:
+                self.sync()
+            except OSError as e:
+                logger.error(f"Failed to fsync outbox: {str(e)}")
+
+    def read(self, limit: int) -> List[OutboxRecord]:
+        """Read the oldest uncommitted records without committing them.
+
+        Args:
+            limit: Maximum number of records to return
+
+        Returns:
+            Records in append order
+        """
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+            segments = list(self._segments)
+            next_offset = self._next_offset
+
+        base, position = self._cursor
+        offset = self._committed
+        records: List[OutboxRecord] = []
+        self._read_positions = {}
+
+        while len(records) < limit and offset < next_offset:
+            buffer = self._map(base)
+            try:
+                for payload, end in _iter_frames(buffer, position):
+                    records.append(_decode_payload(offset, payload))
+                    self._read_positions[offset] = (base, end)
+                    offset += 1
+                    position = end
+                    if len(records) >= limit or offset >= next_offset:
+                        break
+            finally:
+                if isinstance(buffer, mmap.mmap):
+                    buffer.close()
+
+            later = [b for b in segments if b > base]
+            if len(records) >= limit or offset >= next_offset or not later:
+                break
+            base, position = later[0], 0
+
+        return records
+
+    def commit(self, offset: int):
+        """Mark every record up to and including ``offset`` as delivered.
+
+        Args:
+            offset: Offset of the last delivered record from the latest ``read``
+        """
+        base, position = self._read_positions[offset]
+        with self._lock:
+            self._cursor = (base, position)
+            self._committed = offset + 1
+            self._write_checkpoint()
+            self._compact()
+
+    def _before_fork(self):
+        """Flush buffered records so a forked child cannot write them a second time."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self):
+        """Fsync outstanding records and close the active segment."""
+        with self._lock:
+            if self._closed.is_set():
+                return
+            self._closed.set()
+            self._sync_locked()
+            self._file.close()
+
+        if self._flusher is not None:
+            self._flusher.join()
+
+
+class Outbox:
+    """Durable local outbox replayed to the transport in order.
+
+    Publishers write encoded events here when the broker cannot be reached.
+    A worker thread replays them oldest first through ``send`` and stops at
+    the first failure, retrying after ``replay_interval`` seconds, so events
+    are delivered in order and at least once. Events left over from a
+    previous process are replayed on startup.
+
+    Example:
+        outbox = Outbox(OutboxConfig(path="/var/lib/fitviz/outbox"), send=deliver)
+        outbox.append("workout.created", body, {"content_type": "application/json"})
+    """
+
+    def __init__(self, config: OutboxConfig, send: Callable[[OutboxRecord], bool]):
+        """Initialize the outbox.
+
+        Args:
+            config: OutboxConfig instance
+            send: Delivers a record to the transport, returning True on success
+        """
+        self.config = config
+        self._send = send
+        self._log = SegmentLog(config.path, config.segment_bytes, config.fsync_interval)
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._is_closed = False
+
+        if self.pending:
+            logger.info(f"Replaying {self.pending} events left in outbox {config.path}")
+            self._ensure_worker()
+
+    @property
+    def pending(self) -> int:
+        """Number of events waiting to be replayed."""
+        return len(self._log)
+
+    def append(
+        self, event_type: str, body: bytes, headers: Optional[Dict[str, str]] = None
+    ) -> bool:
+        """Store an encoded event for replay.
+
+        Args:
+            event_type: Routing key or event type
+            body: Encoded message body
+            headers: Transport headers needed to replay the message
+
+        Returns:
+            True if the event was written, False otherwise
+        """
+        if self._is_closed:
+            logger.warning("Outbox is closed, cannot store event")
+            return False
+
+        try:
+            self._log.append(event_type, body, headers)
+        except OSError as e:
+            logger.error(f"Failed to write event to outbox: {str(e)}")
+            return False
+
+        self._ensure_worker()
+        self._wakeup.set()
+        return True
+
+    def _ensure_worker(self):
+        with self._thread_lock:
+            if self._thread is None and not self._is_closed:
+                self._thread = threading.Thread(
+                    target=self._run, name="fitviz-events-outbox-replay", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while not self._is_closed:
+            self._wakeup.clear()
+            records = self._log.read(self.config.replay_batch_size)
+            if not records:
+                self._wakeup.wait(self.config.replay_interval)
+                continue
+
+            delivered = None
+            for record in records:
+                if self._is_closed:
+                    break
+                try:
+                    success = self._send(record)
+                except Exception as e:
+                    logger.error(f"Unexpected error replaying outbox event: {str(e)}")
+                    success = False
+                if not success:
+                    break
+                delivered = record.offset
+
+            if delivered is not None:
+                self._log.commit(delivered)
+
+            if delivered != records[-1].offset:
+                logger.warning(f"Outbox replay paused with {self.pending} events pending")
+                self._stopped.wait(self.config.replay_interval)
+
+    def close(self, timeout: Optional[float] = None):
+        """Stop replaying and close the log; pending events stay on disk.
+
+        Args:
+            timeout: Seconds to wait for an in-progress replay to stop
+        """
+        self._is_closed = True
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._log.close()
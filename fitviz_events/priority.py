@@ -0,0 +1,109 @@
+"""Priority lanes for queued events."""
+
+from collections import deque
+from typing import Any, Callable, Dict, Generic, Hashable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class PriorityLanes(Generic[T]):
+    """Queue with one lane per priority, drained highest priority first.
+
+    Lower lanes are not starved: once a waiting lane has been passed over
+    ``starvation_limit`` times in a row, it is served next. Each lane is a
+    ``deque`` or any queue from ``lane_factory`` with the same ``append`` and
+    ``popleft`` methods (e.g. a ``FairQueue``). Not thread-safe; callers hold
+    their own lock.
+
+    Example:
+        lanes = PriorityLanes(lambda event: priorities.get(event.event_type, 0))
+        lanes.append(event)
+        event = lanes.popleft()
+    """
+
+    def __init__(
+        self,
+        priority: Callable[[T], int],
+        starvation_limit: int = 10,
+        lane_factory: Callable[[], Any] = deque,
+    ):
+        """Initialize the lanes.
+
+        Args:
+            priority: Returns an item's priority; higher values are served first
+            starvation_limit: Times a waiting lane may be passed over before it
+                is served
+            lane_factory: Creates the queue used for each lane
+        """
+        if starvation_limit < 1:
+            raise ValueError("starvation_limit must be at least 1")
+
+        self._priority = priority
+        self._starvation_limit = starvation_limit
+        self._lane_factory = lane_factory
+        self._lanes: Dict[int, Any] = {}
+        self._order: List[int] = []
+        self._skipped: Dict[int, int] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def depths(self) -> Dict[int, int]:
+        """Number of queued items per priority."""
+        return {priority: len(self._lanes[priority]) for priority in self._order}
+
+    def append(self, item: T):
+        """Queue an item in the lane for its priority."""
+        priority = self._priority(item)
+        lane = self._lanes.get(priority)
+        if lane is None:
+            lane = self._lanes[priority] = self._lane_factory()
+            self._skipped[priority] = 0
+            self._order = sorted(self._lanes, reverse=True)
+        lane.append(item)
+        self._size += 1
+
+    def popleft(self, ready: Optional[Callable[[Hashable], bool]] = None) -> Optional[T]:
+        """Dequeue the next item.
+
+        Args:
+            ready: Passed on to lanes that support it (see ``FairQueue.popleft``)
+
+        Returns:
+            The next item, or None if the queue is empty or no lane has a ready item
+        """
+        waiting = [priority for priority in self._order if self._lanes[priority]]
+        starved = [p for p in waiting if self._skipped[p] >= self._starvation_limit]
+
+        for priority in starved + [p for p in waiting if p not in starved]:
+            lane = self._lanes[priority]
+            item: Optional[T] = lane.popleft() if ready is None else lane.popleft(ready)
+            if item is None:
+                continue
+
+            self._size -= 1
+            self._skipped[priority] = 0
+            for other in waiting:
+                if other < priority:
+                    self._skipped[other] += 1
+            return item
+
+        return None
+
+    def evict(self) -> Optional[T]:
+        """Remove an item from the lowest-priority lane that has one.
+
+        Returns:
+            The removed item, or None if the queue is empty
+        """
+        for priority in reversed(self._order):
+            lane = self._lanes[priority]
+            if lane:
+                self._size -= 1
+                evicted: Optional[T] = lane.evict() if hasattr(lane, "evict") else lane.popleft()
+                return evicted
+        return None
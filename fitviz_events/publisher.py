@@ -1,24 +1,35 @@
 """Event publisher for RabbitMQ integration."""
 
 import asyncio
-import json
 import logging
+import os
 import threading
 import time
-from datetime import datetime
-from typing import Any, Callable, Dict, Optional
-from uuid import UUID, uuid4
+from typing import Any, Callable, Dict, Optional, Union
+from uuid import UUID
 
 import pika
 from pika.exceptions import AMQPChannelError, AMQPConnectionError
+from pydantic import BaseModel
 
+from fitviz_events.channel_pool import ChannelPool
+from fitviz_events.circuit_breaker import CircuitBreaker
+from fitviz_events.claim_check import offload_body
+from fitviz_events.codecs import Codec, get_codec
+from fitviz_events.compression import compress_body, get_compressor
 from fitviz_events.config import EventPublisherConfig
-from fitviz_events.events import EVENT_TYPE_MAP, BaseEvent
+from fitviz_events.envelope import resolve_organization_id, validate_event
 from fitviz_events.exceptions import (
+    CircuitOpenError,
     ConnectionError,
     EventPublishError,
     EventValidationError,
 )
+from fitviz_events.forking import register_fork_handlers
+from fitviz_events.heartbeat import HeartbeatPump
+from fitviz_events.outbox import Outbox, OutboxRecord
+from fitviz_events.rate_limit import TokenBucketLimiter
+from fitviz_events.reconnect import ReconnectSupervisor, backoff_delay
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +38,9 @@ class EventPublisher:
     """Event publisher for FitViz notification service.
 
     Thread-safe publisher that handles RabbitMQ connections, retries,
-    and event validation for Flask applications.
+    and event validation for Flask applications. Publishes are spread over a
+    bounded pool of channels (see ``EventPublisherConfig.channel_pool_size``)
+    so concurrent request threads do not serialize on a single channel.
 
     Example:
         publisher = EventPublisher(
@@ -44,13 +57,13 @@ class EventPublisher:
 
     def __init__(
         self,
-        rabbitmq_url: str = None,
+        rabbitmq_url: Optional[str] = None,
         exchange_name: str = "fitviz.events",
-        organization_id_getter: Callable[[], Optional[UUID]] = None,
+        organization_id_getter: Optional[Callable[[], Optional[UUID]]] = None,
         retry_attempts: int = 3,
         retry_delay: float = 1.0,
         enable_validation: bool = True,
-        config: EventPublisherConfig = None,
+        config: Optional[EventPublisherConfig] = None,
     ):
         """Initialize the event publisher.
 
@@ -77,12 +90,76 @@ class EventPublisher:
             )
 
         self.organization_id_getter = organization_id_getter
+        self._codec = get_codec(self.config.codec)
+        self._compressor = get_compressor(self.config.compression)
+        self._is_closed = False
+        self._init_process_state()
+        self._outbox: Optional[Outbox] = None
+        if self.config.outbox is not None:
+            self._outbox = Outbox(self.config.outbox, self._replay)
+        register_fork_handlers(self)
+
+    def _init_process_state(self):
+        """Create the connection state and helper threads owned by this process."""
+        self._pid = os.getpid()
         self._connection = None
         self._channel = None
+        self._pool: Optional[ChannelPool] = None
         self._lock = threading.Lock()
-        self._is_closed = False
-
-    def _get_organization_id(self, organization_id: Optional[UUID] = None) -> Optional[str]:
+        self._supervisor = ReconnectSupervisor(
+            self._connect_once,
+            base_delay=self.config.retry_delay,
+            max_delay=self.config.max_backoff,
+            name="fitviz-events-rabbitmq-reconnect",
+        )
+        self._pump: Optional[HeartbeatPump] = None
+        if self.config.heartbeat_pump_interval is not None:
+            self._pump = HeartbeatPump(
+                self._pooled_connections,
+                self.config.heartbeat_pump_interval,
+                on_connection_lost=self._on_connection_lost,
+            )
+        self._breaker: Optional[CircuitBreaker] = None
+        if self.config.circuit_breaker is not None:
+            self._breaker = CircuitBreaker(self.config.circuit_breaker, name="RabbitMQ")
+        self._limiter: Optional[TokenBucketLimiter] = None
+        if self.config.rate_limit is not None:
+            self._limiter = TokenBucketLimiter(self.config.rate_limit)
+
+    def _after_fork(self):
+        """Drop state inherited from the parent process after ``os.fork()``.
+
+        The inherited connections are abandoned rather than closed, since
+        closing them would send AMQP close frames on sockets the parent still
+        uses; the child connects on its next publish. The outbox stays with
+        the parent, because its log must only have one writer.
+        """
+        self._init_process_state()
+        if self._outbox is not None:
+            logger.warning(
+                "Outbox disabled in forked process; create the publisher after fork "
+                "(e.g. in a gunicorn post_fork hook) to give each worker its own outbox"
+            )
+            self._outbox = None
+
+    def _check_fork(self):
+        """Reset inherited state if this process was forked without running the fork hooks."""
+        if self._pid != os.getpid():
+            self._after_fork()
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Circuit breaker guarding publishes, for health checks (None if disabled)."""
+        return self._breaker
+
+    @property
+    def codec(self) -> Codec:
+        """Codec used to encode event envelopes."""
+        return self._codec
+
+    def _get_organization_id(
+        self, organization_id: Optional[Union[str, UUID]] = None
+    ) -> Optional[str]:
         """Get organization ID from parameter or getter.
 
         Args:
@@ -91,18 +168,11 @@ class EventPublisher:
         Returns:
             Organization ID as string or None
         """
-        if organization_id:
-            return str(organization_id)
-
-        if self.organization_id_getter:
-            org_id = self.organization_id_getter()
-            return str(org_id) if org_id else None
-
-        return None
+        return resolve_organization_id(organization_id, self.organization_id_getter)
 
     def _validate_event(
         self, event_type: str, data: Dict[str, Any], organization_id: str
-    ) -> BaseEvent:
+    ) -> Optional[BaseModel]:
         """Validate event data using Pydantic schemas.
 
         Args:
@@ -111,7 +181,7 @@ class EventPublisher:
             organization_id: Organization ID
 
         Returns:
-            Validated BaseEvent instance
+            Validated data model, or None if not validated
 
         Raises:
             EventValidationError: If validation fails
@@ -119,29 +189,109 @@ class EventPublisher:
         if not self.config.enable_validation:
             return None
 
+        return validate_event(event_type, data)
+
+    def _priority(self, event_type: str) -> Optional[int]:
+        """AMQP message priority configured for an event type, if any."""
+        priorities = self.config.event_priorities
+        return priorities.get(event_type) if priorities else None
+
+    def _open_connection(self):
+        """Open a new BlockingConnection using the configured parameters.
+
+        Returns:
+            Open pika BlockingConnection
+        """
+        params = pika.URLParameters(self.config.rabbitmq_url)
+        params_dict = self.config.to_pika_params()
+        for key, value in params_dict.items():
+            if value is not None:
+                setattr(params, key, value)
+
+        return pika.BlockingConnection(params)
+
+    def _declare_exchange(self, channel):
+        """Declare the events exchange on a channel.
+
+        Args:
+            channel: Open pika channel
+        """
+        channel.exchange_declare(
+            exchange=self.config.exchange_name,
+            exchange_type="topic",
+            durable=True,
+        )
+
+    def _is_connected(self) -> bool:
+        """Whether the channel pool and primary connection are open."""
+        connection = self._connection
+        return bool(self._pool and connection and connection.is_open)
+
+    def _connect_once(self) -> bool:
+        """Make a single connection attempt without sleeping.
+
+        Only one thread connects at a time. Callers that find a connect already
+        in progress return at once instead of queueing behind it.
+
+        Returns:
+            True if connected, False otherwise
+        """
+        if self._is_closed:
+            return False
+
+        if not self._lock.acquire(blocking=False):
+            return self._is_connected()
+
         try:
-            event_class = EVENT_TYPE_MAP.get(event_type)
-            if not event_class:
-                logger.warning(f"No validation schema for event type: {event_type}")
-                return None
-
-            event = event_class(
-                event_id=str(uuid4()),
-                event_type=event_type,
-                organization_id=organization_id,
-                data=data,
-            )
-            return event
+            if self._is_connected():
+                return True
 
-        except Exception as e:
-            raise EventValidationError(
-                f"Event validation failed for {event_type}: {str(e)}",
-                event_type=event_type,
-                validation_errors=[str(e)],
-            )
+            if self._pool:
+                self._close_connection()
+
+            try:
+                self._connection = self._open_connection()
+                self._channel = self._connection.channel()
+                self._declare_exchange(self._channel)
+
+                self._pool = ChannelPool(
+                    open_connection=self._open_connection,
+                    size=self.config.channel_pool_size,
+                    max_connections=self.config.pool_connections,
+                    setup_channel=self._declare_exchange,
+                    checkout_timeout=self.config.channel_checkout_timeout,
+                )
+                self._pool.seed(self._connection, self._channel)
+                if self._pump is not None:
+                    self._pump.start()
+
+                logger.info("Successfully connected to RabbitMQ")
+                return True
+
+            except AMQPConnectionError as e:
+                logger.warning(f"Connection attempt failed: {str(e)}")
+
+            except Exception as e:
+                logger.error(f"Unexpected error during connection: {str(e)}")
+
+            if self._connection is not None and self._pool is None:
+                try:
+                    self._connection.close()
+                except Exception:
+                    pass
+                self._connection = None
+                self._channel = None
+            return False
+
+        finally:
+            self._lock.release()
 
     def _connect(self) -> bool:
-        """Establish RabbitMQ connection with retry logic.
+        """Connect, blocking for up to ``retry_attempts`` attempts with backoff.
+
+        Publishing never calls this; it uses ``_ensure_connected``, which does
+        not wait. This is for callers that want to block until connected, such
+        as tests and scripts that connect before publishing.
 
         Returns:
             True if connection successful, False otherwise
@@ -150,53 +300,61 @@ class EventPublisher:
             logger.warning("Publisher is closed, cannot connect")
             return False
 
-        with self._lock:
-            if self._connection and self._connection.is_open:
+        for attempt in range(1, self.config.retry_attempts + 1):
+            if self._is_connected():
                 return True
 
-            for attempt in range(1, self.config.retry_attempts + 1):
-                try:
-                    logger.info(
-                        f"Connecting to RabbitMQ (attempt {attempt}/{self.config.retry_attempts})"
-                    )
-
-                    params = pika.URLParameters(self.config.rabbitmq_url)
-                    params_dict = self.config.to_pika_params()
-                    for key, value in params_dict.items():
-                        if value is not None:
-                            setattr(params, key, value)
-
-                    self._connection = pika.BlockingConnection(params)
-                    self._channel = self._connection.channel()
-
-                    self._channel.exchange_declare(
-                        exchange=self.config.exchange_name,
-                        exchange_type="topic",
-                        durable=True,
-                    )
-
-                    logger.info("Successfully connected to RabbitMQ")
-                    return True
-
-                except AMQPConnectionError as e:
-                    logger.warning(f"Connection attempt {attempt} failed: {str(e)}")
-                    if attempt < self.config.retry_attempts:
-                        time.sleep(self.config.retry_delay * attempt)
-                    else:
-                        logger.error("All connection attempts failed")
-                        return False
-
-                except Exception as e:
-                    logger.error(f"Unexpected error during connection: {str(e)}")
-                    return False
+            logger.info(f"Connecting to RabbitMQ (attempt {attempt}/{self.config.retry_attempts})")
+            if self._connect_once():
+                return True
+
+            if attempt < self.config.retry_attempts:
+                time.sleep(backoff_delay(attempt, self.config.retry_delay, self.config.max_backoff))
+
+        logger.error("All connection attempts failed")
+        return False
+
+    def _pooled_connections(self):
+        """Connections currently owned by the channel pool."""
+        pool = self._pool
+        return pool.connections if pool is not None else []
 
+    def _on_connection_lost(self):
+        """Reconnect in the background when the heartbeat pump finds the connection closed."""
+        if not self._is_closed and not self._is_connected():
+            logger.warning("RabbitMQ connection lost while idle, reconnecting in the background")
+            self._supervisor.start()
+
+    def _ensure_connected(self) -> bool:
+        """Get a connection for publishing without waiting on retries.
+
+        When the connection is down, the first caller makes one immediate
+        attempt; if that fails the reconnect supervisor takes over in the
+        background and every caller fails fast until it succeeds. Callers that
+        arrive while that attempt is in progress fail fast too.
+
+        Returns:
+            True if connected, False otherwise
+        """
+        if self._is_connected():
+            return True
+
+        if self._is_closed or self._supervisor.is_reconnecting or self._lock.locked():
+            # Another thread is connecting; don't wait for it
             return False
 
+        if self._connect_once():
+            return True
+
+        logger.warning("RabbitMQ unavailable, reconnecting in the background")
+        self._supervisor.start()
+        return False
+
     def publish(
         self,
         event_type: str,
         data: Dict[str, Any],
-        organization_id: Optional[UUID] = None,
+        organization_id: Optional[Union[str, UUID]] = None,
     ) -> bool:
         """Publish an event to RabbitMQ (synchronous).
 
@@ -212,51 +370,17 @@ class EventPublisher:
             logger.warning("Publisher is closed, cannot publish event")
             return False
 
+        self._check_fork()
+
         try:
-            org_id = self._get_organization_id(organization_id)
+            org_id = self._admit(event_type, organization_id)
             if not org_id:
-                logger.warning("No organization ID available, skipping event publish")
                 return False
 
-            validated_event = self._validate_event(event_type, data, org_id)
+            validated_data = self._validate_event(event_type, data, org_id)
 
-            if not self._connect():
-                logger.error("Failed to connect to RabbitMQ")
-                return False
-
-            event_payload = {
-                "event_id": str(uuid4()),
-                "event_type": event_type,
-                "organization_id": org_id,
-                "timestamp": (
-                    validated_event.timestamp.isoformat()
-                    if validated_event
-                    else datetime.utcnow().isoformat()
-                ),
-                "data": data,
-            }
-
-            message_body = json.dumps(event_payload)
-
-            with self._lock:
-                try:
-                    self._channel.basic_publish(
-                        exchange=self.config.exchange_name,
-                        routing_key=event_type,
-                        body=message_body,
-                        properties=pika.BasicProperties(
-                            delivery_mode=2,
-                            content_type="application/json",
-                        ),
-                    )
-
-                    logger.info(f"Published event: {event_type} (org: {org_id})")
-                    return True
-
-                except AMQPChannelError as e:
-                    logger.error(f"Channel error during publish: {str(e)}")
-                    self._close_connection()
-                    return False
+            message_body = self._codec.encode_event(event_type, data, org_id, validated_data)
+            return self._publish_body(event_type, message_body, org_id)
 
         except EventValidationError as e:
             logger.error(f"Event validation failed: {str(e)}")
@@ -266,6 +390,236 @@ class EventPublisher:
             logger.error(f"Unexpected error publishing event: {str(e)}")
             return False
 
+    def publish_encoded(
+        self,
+        event_type: str,
+        message_body: bytes,
+        organization_id: Optional[Union[str, UUID]] = None,
+    ) -> bool:
+        """Publish an event envelope already encoded with this publisher's codec.
+
+        Skips validation and encoding, so ``FanoutPublisher`` can do both once
+        for several publishers. Rate limits, compression, the circuit breaker
+        and the outbox still apply.
+
+        Args:
+            event_type: Type of event (e.g., "workout.created")
+            message_body: Envelope encoded with ``self.codec``
+            organization_id: Optional organization ID (uses getter if not provided)
+
+        Returns:
+            True if published successfully, False otherwise
+        """
+        if self._is_closed:
+            logger.warning("Publisher is closed, cannot publish event")
+            return False
+
+        self._check_fork()
+
+        try:
+            org_id = self._admit(event_type, organization_id)
+            if not org_id:
+                return False
+            return self._publish_body(event_type, message_body, org_id)
+
+        except Exception as e:
+            logger.error(f"Unexpected error publishing event: {str(e)}")
+            return False
+
+    def _admit(self, event_type: str, organization_id: Optional[Union[str, UUID]]) -> Optional[str]:
+        """Resolve the organization ID and apply its rate limit.
+
+        Returns:
+            Organization ID, or None if the event must not be published
+        """
+        org_id = self._get_organization_id(organization_id)
+        if not org_id:
+            logger.warning("No organization ID available, skipping event publish")
+            return None
+
+        if self._limiter is not None and not self._limiter.try_acquire(org_id):
+            logger.warning(f"Rate limit exceeded for org {org_id}, dropping event: {event_type}")
+            return None
+        return org_id
+
+    def _publish_body(self, event_type: str, message_body: bytes, org_id: str) -> bool:
+        """Compress, offload and deliver an encoded envelope, falling back to the outbox.
+
+        Returns:
+            True if published (or stored in the outbox), False otherwise
+        """
+        message_body, content_encoding = compress_body(
+            message_body, self._compressor, self.config.compression_threshold
+        )
+        if self.config.claim_check is not None:
+            message_body, content_encoding = offload_body(
+                self.config.claim_check,
+                self._codec,
+                event_type,
+                org_id,
+                message_body,
+                content_encoding,
+            )
+
+        if self._outbox is not None and self._outbox.pending:
+            # Queue behind the events already waiting so delivery stays in order
+            return self._write_outbox(event_type, message_body, content_encoding)
+
+        try:
+            if self._deliver(event_type, message_body, self._codec.content_type, content_encoding):
+                logger.info(f"Published event: {event_type} (org: {org_id})")
+                return True
+
+        except CircuitOpenError:
+            if self._outbox is not None:
+                return self._write_outbox(event_type, message_body, content_encoding)
+            return self._reject(event_type, message_body, content_encoding)
+
+        if self._outbox is not None:
+            return self._write_outbox(event_type, message_body, content_encoding)
+        return False
+
+    def _deliver(
+        self,
+        event_type: str,
+        message_body: bytes,
+        content_type: str,
+        content_encoding: Optional[str] = None,
+    ) -> bool:
+        """Send a message through the circuit breaker, if one is configured.
+
+        Returns:
+            True if published successfully, False otherwise
+
+        Raises:
+            CircuitOpenError: If the breaker rejected the message
+        """
+        if self._breaker is None:
+            return self._send_message(event_type, message_body, content_type, content_encoding)
+
+        self._breaker.acquire(event_type)
+        success = False
+        try:
+            success = self._send_message(event_type, message_body, content_type, content_encoding)
+        finally:
+            self._breaker.record(success)
+        return success
+
+    def _send_message(
+        self,
+        event_type: str,
+        message_body: bytes,
+        content_type: str,
+        content_encoding: Optional[str] = None,
+    ) -> bool:
+        """Publish an encoded message on a pooled channel.
+
+        Args:
+            event_type: Routing key for the message
+            message_body: Encoded event envelope
+            content_type: Codec content type
+            content_encoding: Compression applied to ``message_body``, if any
+
+        Returns:
+            True if published successfully, False otherwise
+        """
+        if not self._ensure_connected():
+            logger.error("Failed to connect to RabbitMQ")
+            return False
+
+        pool = self._pool
+        if pool is None:
+            logger.error("Failed to connect to RabbitMQ")
+            return False
+
+        try:
+            pooled = pool.checkout()
+        except EventPublishError as e:
+            logger.error(f"No channel available for publish: {str(e)}")
+            return False
+
+        # Any failure leaves the channel in an unknown state, so it is discarded
+        discard = True
+        try:
+            with pooled.lock:
+                pooled.channel.basic_publish(
+                    exchange=self.config.exchange_name,
+                    routing_key=event_type,
+                    body=message_body,
+                    properties=pika.BasicProperties(
+                        delivery_mode=2,
+                        content_type=content_type,
+                        content_encoding=content_encoding,
+                        priority=self._priority(event_type),
+                    ),
+                )
+            discard = False
+
+        except (AMQPChannelError, AMQPConnectionError) as e:
+            logger.error(f"Channel error during publish: {str(e)}")
+            return False
+
+        except Exception as e:
+            logger.error(f"Unexpected error during publish: {str(e)}")
+            return False
+
+        finally:
+            pool.checkin(pooled, discard=discard)
+
+        return True
+
+    def _record_headers(self, content_encoding: Optional[str]) -> Dict[str, str]:
+        """Message properties stored alongside an encoded body."""
+        headers = {"content_type": self._codec.content_type}
+        if content_encoding:
+            headers["content_encoding"] = content_encoding
+        return headers
+
+    def _write_outbox(
+        self, event_type: str, message_body: bytes, content_encoding: Optional[str]
+    ) -> bool:
+        """Store an encoded message in the outbox for replay."""
+        if self._outbox is None:
+            return False
+        headers = self._record_headers(content_encoding)
+        if not self._outbox.append(event_type, message_body, headers):
+            return False
+        logger.warning(f"Stored event in outbox for replay: {event_type}")
+        return True
+
+    def _reject(
+        self, event_type: str, message_body: bytes, content_encoding: Optional[str]
+    ) -> bool:
+        """Hand a message rejected by the open circuit breaker to the fallback sink."""
+        breaker_config = self.config.circuit_breaker
+        fallback = breaker_config.fallback if breaker_config is not None else None
+        if fallback is None:
+            logger.error(f"Circuit breaker open, dropped event: {event_type}")
+            return False
+
+        try:
+            headers = self._record_headers(content_encoding)
+            stored = bool(fallback(event_type, message_body, headers))
+        except Exception as e:
+            logger.error(f"Circuit breaker fallback failed for {event_type}: {str(e)}")
+            return False
+
+        if stored:
+            logger.warning(f"Circuit breaker open, sent event to fallback: {event_type}")
+        return stored
+
+    def _replay(self, record: OutboxRecord) -> bool:
+        """Deliver an outbox record to RabbitMQ."""
+        try:
+            return self._deliver(
+                record.event_type,
+                record.body,
+                record.headers.get("content_type", self._codec.content_type),
+                record.headers.get("content_encoding"),
+            )
+        except CircuitOpenError:
+            return False
+
     async def async_publish(
         self,
         event_type: str,
@@ -286,24 +640,26 @@ class EventPublisher:
         return await loop.run_in_executor(None, self.publish, event_type, data, organization_id)
 
     def _close_connection(self):
-        """Close the RabbitMQ connection."""
-        try:
-            if self._channel and self._channel.is_open:
-                self._channel.close()
-        except Exception as e:
-            logger.warning(f"Error closing channel: {str(e)}")
-
-        try:
-            if self._connection and self._connection.is_open:
-                self._connection.close()
-        except Exception as e:
-            logger.warning(f"Error closing connection: {str(e)}")
+        """Close the channel pool and every RabbitMQ connection it owns."""
+        if self._pool:
+            self._pool.close()
 
+        self._pool = None
         self._channel = None
         self._connection = None
 
     def close(self):
-        """Close the publisher and release resources."""
+        """Close the publisher and release resources.
+
+        Events still in the outbox stay on disk and are replayed by the next
+        publisher that opens the same outbox path.
+        """
+        self._supervisor.close(timeout=self.config.connection_timeout)
+        if self._pump is not None:
+            self._pump.close(timeout=self.config.connection_timeout)
+        if self._outbox is not None:
+            self._outbox.close(timeout=self.config.connection_timeout)
+
         with self._lock:
             self._is_closed = True
             self._close_connection()
@@ -0,0 +1,189 @@
+"""Per-organization rate limiting and fair scheduling."""
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, Generic, Hashable, List, Optional, TypeVar
+
+from fitviz_events.config import RateLimitConfig
+
+T = TypeVar("T")
+
+
+class TokenBucketLimiter:
+    """Token bucket per key (organization ID), refilled at ``rate`` up to ``burst``.
+
+    Buckets live in an insertion-ordered dict that is kept in last-use order,
+    so each ``try_acquire`` is O(1): refill the caller's bucket, move it to the
+    end, and evict idle buckets from the front. A bucket is only evicted after
+    it has been idle long enough to refill completely, so eviction never
+    changes a decision.
+
+    Example:
+        limiter = TokenBucketLimiter(RateLimitConfig(rate=50, burst=200))
+        if not limiter.try_acquire(organization_id):
+            ...  # over the limit
+    """
+
+    def __init__(self, config: RateLimitConfig, clock: Callable[[], float] = time.monotonic):
+        """Initialize the limiter.
+
+        Args:
+            config: RateLimitConfig instance
+            clock: Monotonic time source in seconds
+        """
+        self.config = config
+        self._clock = clock
+        self._idle_ttl = max(config.idle_ttl, config.burst / config.rate)
+        self._buckets: "OrderedDict[Hashable, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    @property
+    def refill_interval(self) -> float:
+        """Seconds it takes to refill one token."""
+        return 1.0 / self.config.rate
+
+    def try_acquire(self, key: Hashable) -> bool:
+        """Take a token from ``key``'s bucket if one is available.
+
+        Args:
+            key: Organization ID
+
+        Returns:
+            True if a token was taken, False if ``key`` is over its rate
+        """
+        with self._lock:
+            now = self._clock()
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(self.config.burst), now]
+            else:
+                elapsed = now - bucket[1]
+                bucket[0] = min(float(self.config.burst), bucket[0] + elapsed * self.config.rate)
+                bucket[1] = now
+                self._buckets.move_to_end(key)
+
+            self._evict_idle(now)
+
+            if bucket[0] < 1:
+                return False
+            bucket[0] -= 1
+            return True
+
+    def _evict_idle(self, now: float):
+        """Drop buckets unused for ``idle_ttl``; they would be full again anyway."""
+        horizon = now - self._idle_ttl
+        while self._buckets:
+            key, bucket = next(iter(self._buckets.items()))
+            if bucket[1] > horizon:
+                return
+            del self._buckets[key]
+
+
+class FairQueue(Generic[T]):
+    """Queue that interleaves items from different keys by weighted round robin.
+
+    Items with the same key stay in FIFO order. Each turn, a key may dequeue
+    up to its weight (default 1) items before the next key with queued items
+    gets a turn, so a tenant with a large backlog cannot starve the others.
+    Not thread-safe; callers hold their own lock.
+
+    Example:
+        queue = FairQueue(key=lambda event: event.organization_id, weights={"org_big": 2})
+        queue.append(event)
+        event = queue.popleft()
+    """
+
+    def __init__(
+        self,
+        key: Callable[[T], Hashable],
+        weights: Optional[Dict[Any, int]] = None,
+    ):
+        """Initialize the queue.
+
+        Args:
+            key: Returns the key (organization ID) an item is scheduled under
+            weights: Items dequeued per turn for each key (others get 1)
+        """
+        self._key = key
+        self._weights = weights or {}
+        self._queues: Dict[Hashable, Deque[T]] = {}
+        self._active: Deque[Hashable] = deque()
+        self._served = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def append(self, item: T):
+        """Queue an item behind the other items with its key."""
+        key = self._key(item)
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = deque()
+            self._active.append(key)
+        queue.append(item)
+        self._size += 1
+
+    def popleft(self, ready: Optional[Callable[[Hashable], bool]] = None) -> Optional[T]:
+        """Dequeue the next item in weighted round-robin order.
+
+        Args:
+            ready: Called with a key before taking its item; keys it returns
+                False for (e.g. rate limited) lose their turn
+
+        Returns:
+            The next item, or None if the queue is empty or no key is ready
+        """
+        for _ in range(len(self._active)):
+            key = self._active[0]
+            if ready is not None and not ready(key):
+                self._next_turn()
+                continue
+
+            queue = self._queues[key]
+            item = queue.popleft()
+            self._size -= 1
+            self._served += 1
+            if not queue:
+                del self._queues[key]
+                self._active.popleft()
+                self._served = 0
+            elif self._served >= self._weights.get(key, 1):
+                self._next_turn()
+            return item
+
+        return None
+
+    def evict(self) -> Optional[T]:
+        """Remove the oldest item of the key with the most items queued.
+
+        Used when the queue is full, so the tenant causing the backlog loses
+        events rather than the others.
+
+        Returns:
+            The removed item, or None if the queue is empty
+        """
+        if not self._active:
+            return None
+
+        key = max(self._active, key=lambda k: len(self._queues[k]))
+        queue = self._queues[key]
+        item = queue.popleft()
+        self._size -= 1
+        if not queue:
+            del self._queues[key]
+            if self._active[0] == key:
+                self._served = 0
+            self._active.remove(key)
+        return item
+
+    def _next_turn(self):
+        self._active.rotate(-1)
+        self._served = 0
@@ -0,0 +1,104 @@
+"""Background reconnection with capped exponential backoff."""
+
+import logging
+import random
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Delay before retry ``attempt`` using exponential backoff with full jitter.
+
+    The delay is drawn uniformly from ``[0, min(cap, base * 2 ** (attempt - 1))]``
+    so clients that lost the broker at the same moment do not retry in step.
+
+    Args:
+        attempt: Retry number, starting at 1
+        base: Delay ceiling for the first retry in seconds
+        cap: Maximum delay ceiling in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    ceiling = min(cap, base * (2 ** min(attempt - 1, 32)))
+    return random.uniform(0, ceiling)
+
+
+class ReconnectSupervisor:
+    """Retries a connect function on a background thread until it succeeds.
+
+    Publish callers never wait on the retries: they check ``is_reconnecting``
+    and fail fast (or enqueue) while the supervisor is working, so an outage
+    does not pile request threads up behind a sleeping one.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], bool],
+        base_delay: float,
+        max_delay: float,
+        name: str = "fitviz-events-reconnect",
+    ):
+        """Initialize the supervisor.
+
+        Args:
+            connect: Makes one connection attempt, returning True on success
+            base_delay: Backoff ceiling for the first retry in seconds
+            max_delay: Maximum backoff ceiling in seconds
+            name: Name of the supervisor thread
+        """
+        self._connect = connect
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._name = name
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_reconnecting(self) -> bool:
+        """Whether a background reconnect is in progress."""
+        return self._thread is not None
+
+    def start(self):
+        """Start reconnecting in the background unless already running or closed."""
+        with self._lock:
+            if self._thread is not None or self._stopped.is_set():
+                return
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                delay = backoff_delay(attempt, self._base_delay, self._max_delay)
+                if self._stopped.wait(delay):
+                    return
+
+                try:
+                    connected = self._connect()
+                except Exception as e:
+                    logger.warning(f"Reconnect attempt {attempt} failed: {str(e)}")
+                    connected = False
+
+                if connected:
+                    logger.info(f"Reconnected after {attempt} attempts")
+                    return
+        finally:
+            with self._lock:
+                self._thread = None
+
+    def close(self, timeout: Optional[float] = None):
+        """Stop reconnecting.
+
+        Args:
+            timeout: Seconds to wait for an in-progress attempt to finish
+        """
+        self._stopped.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
@@ -1,7 +1,17 @@
 """Configuration for AWS SNS event publisher."""
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Union
+
+from fitviz_events.config import (
+    CircuitBreakerConfig,
+    ClaimCheckConfig,
+    OutboxConfig,
+    RateLimitConfig,
+)
+
+if TYPE_CHECKING:
+    from fitviz_events.codecs import Codec
 
 
 @dataclass
@@ -15,9 +25,38 @@ class SNSPublisherConfig:
         aws_secret_access_key: AWS secret access key (optional, uses boto3 defaults if not provided)
         use_localstack: Whether to use LocalStack for local development
         localstack_endpoint: LocalStack endpoint URL
-        retry_attempts: Number of retry attempts for failed publishes
-        retry_delay: Delay in seconds between retry attempts
+        retry_attempts: Attempts for publishes SNS answers with an error; a transient
+            error (SNS unavailable) fails the publish without retrying
+        retry_delay: Initial seconds publishes fail fast after SNS is found unavailable
+            (doubling, jittered, on each further outage)
+        max_backoff: Maximum seconds publishes fail fast after SNS is found unavailable
         enable_validation: Whether to validate events using Pydantic schemas
+        batch_linger: Seconds ``publish()`` waits to group concurrent events into one
+            PublishBatch call (None publishes each event on its own)
+        codec: Message codec name ("json", "orjson", "msgpack") or Codec instance;
+            sets the ``content_type`` message attribute, and binary codecs are
+            base64 encoded with a ``content_encoding`` attribute
+        compression: Compress message bodies with "gzip", "zlib" or "zstd"
+            (None disables compression); signalled via ``content_encoding``
+        compression_threshold: Minimum encoded body size in bytes worth compressing
+        outbox: Write events to a durable local outbox when SNS is unreachable and
+            replay them in order once it recovers (None disables the outbox)
+        circuit_breaker: Stop sending to SNS while the publish failure rate is too
+            high (None disables the breaker)
+        rate_limit: Reject publishes from organizations over their token-bucket
+            rate (None disables rate limiting)
+        message_group_field: Event data field used as the ``MessageGroupId`` on FIFO
+            topics (None groups by organization ID); events without the field fall
+            back to the organization ID
+        claim_check: Offload message bodies over a size threshold to a blob store
+            and send a reference instead, keeping large events under the SNS
+            size limit (None disables offloading)
+        max_pool_connections: HTTP connections the SNS client keeps open; caps
+            concurrent publishes from publishers sharing the client
+        connect_timeout: Seconds to wait for a connection to SNS
+        read_timeout: Seconds to wait for an SNS response
+        tcp_keepalive: Enable TCP keepalive on SNS connections, so idle pooled
+            connections are not silently dropped by NAT gateways and load balancers
     """
 
     topic_arn: str
@@ -28,7 +67,30 @@ class SNSPublisherConfig:
     localstack_endpoint: Optional[str] = None
     retry_attempts: int = 3
     retry_delay: float = 1.0
+    max_backoff: float = 30.0
     enable_validation: bool = True
+    batch_linger: Optional[float] = None
+    codec: Union[str, "Codec"] = "json"
+    compression: Optional[str] = None
+    compression_threshold: int = 4096
+    outbox: Optional[OutboxConfig] = None
+    circuit_breaker: Optional[CircuitBreakerConfig] = None
+    rate_limit: Optional[RateLimitConfig] = None
+    message_group_field: Optional[str] = None
+    claim_check: Optional[ClaimCheckConfig] = None
+    max_pool_connections: int = 50
+    connect_timeout: float = 5.0
+    read_timeout: float = 10.0
+    tcp_keepalive: bool = True
+
+    def __post_init__(self):
+        if self.max_pool_connections < 1:
+            raise ValueError("max_pool_connections must be at least 1")
+
+    @property
+    def fifo(self) -> bool:
+        """Whether the topic is a FIFO topic (its name ends in ".fifo")."""
+        return self.topic_arn.endswith(".fifo")
 
     def to_boto3_config(self) -> dict:
         """Convert config to boto3 client kwargs.
@@ -48,3 +110,16 @@ class SNSPublisherConfig:
             config["aws_secret_access_key"] = self.aws_secret_access_key
 
         return config
+
+    def to_botocore_config(self) -> dict:
+        """Convert config to ``botocore.config.Config`` kwargs.
+
+        Returns:
+            Dictionary of connection pool and timeout settings
+        """
+        return {
+            "max_pool_connections": self.max_pool_connections,
+            "connect_timeout": self.connect_timeout,
+            "read_timeout": self.read_timeout,
+            "tcp_keepalive": self.tcp_keepalive,
+        }
@@ -1,23 +1,186 @@
 """Event publisher for AWS SNS integration."""
 
 import asyncio
-import json
+import base64
 import logging
+import os
 import threading
 import time
-from datetime import datetime
-from typing import Any, Callable, Dict, Optional
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 from uuid import UUID, uuid4
 
-import boto3
 from botocore.exceptions import BotoCoreError, ClientError
-
-from fitviz_events.events import EVENT_TYPE_MAP, BaseEvent
-from fitviz_events.exceptions import EventValidationError
+from pydantic import BaseModel
+
+from fitviz_events.aws_clients import get_client
+from fitviz_events.circuit_breaker import CircuitBreaker
+from fitviz_events.claim_check import offload_body
+from fitviz_events.codecs import Codec, get_codec
+from fitviz_events.compression import compress_body, get_compressor
+from fitviz_events.envelope import resolve_organization_id, validate_event
+from fitviz_events.exceptions import CircuitOpenError, EventValidationError
+from fitviz_events.forking import register_fork_handlers
+from fitviz_events.outbox import Outbox, OutboxRecord
+from fitviz_events.rate_limit import TokenBucketLimiter
+from fitviz_events.reconnect import backoff_delay
 from fitviz_events.sns_config import SNSPublisherConfig
 
 logger = logging.getLogger(__name__)
 
+SNS_MAX_BATCH_ENTRIES = 10
+SNS_MAX_PAYLOAD_BYTES = 256 * 1024
+
+# Publish entry keys used by FIFO topics, kept with outbox records as headers
+_FIFO_FIELDS = ("MessageGroupId", "MessageDeduplicationId")
+
+# Error codes that indicate SNS itself is unavailable rather than a bad request
+_TRANSIENT_ERROR_CODES = {
+    "InternalError",
+    "InternalFailure",
+    "RequestTimeout",
+    "ServiceUnavailable",
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+}
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a publish error means SNS is unavailable (worth backing off)."""
+    if isinstance(error, ClientError):
+        response = error.response
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        return response.get("Error", {}).get("Code") in _TRANSIENT_ERROR_CODES or status >= 500
+    return isinstance(error, BotoCoreError)
+
+
+def _entry_size(entry: Dict[str, Any]) -> int:
+    """Size of a publish entry as counted against the SNS payload limit."""
+    size = len(entry["Message"].encode("utf-8"))
+    for name, attribute in entry.get("MessageAttributes", {}).items():
+        size += len(name.encode("utf-8")) + len(attribute["DataType"].encode("utf-8"))
+        size += len(attribute.get("StringValue", "").encode("utf-8"))
+    return size
+
+
+def _message_group(entry: Dict[str, Any]) -> Any:
+    """FIFO message group of an entry; on standard topics each entry is its own group."""
+    return entry.get("MessageGroupId", id(entry))
+
+
+def _entry_event_type(entry: Dict[str, Any]) -> str:
+    """Event type of a publish entry."""
+    event_type: str = entry["MessageAttributes"]["event_type"]["StringValue"]
+    return event_type
+
+
+def chunk_entries(
+    entries: Sequence[Dict[str, Any]],
+    max_entries: int = SNS_MAX_BATCH_ENTRIES,
+    max_bytes: int = SNS_MAX_PAYLOAD_BYTES,
+) -> List[List[int]]:
+    """Group publish entries into PublishBatch-sized chunks.
+
+    Chunks hold at most ``max_entries`` entries whose combined size stays within
+    ``max_bytes``. An entry larger than ``max_bytes`` on its own gets a chunk to
+    itself so SNS reports the failure for that entry only.
+
+    Args:
+        entries: Publish entries with ``Message`` and ``MessageAttributes``
+        max_entries: Maximum entries per chunk
+        max_bytes: Maximum combined payload size per chunk
+
+    Returns:
+        Lists of indexes into ``entries``, in order
+    """
+    chunks: List[List[int]] = []
+    current: List[int] = []
+    current_size = 0
+
+    for index, entry in enumerate(entries):
+        size = _entry_size(entry)
+        if current and (len(current) >= max_entries or current_size + size > max_bytes):
+            chunks.append(current)
+            current, current_size = [], 0
+        current.append(index)
+        current_size += size
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class _MicroBatcher:
+    """Groups concurrent publishes into PublishBatch calls.
+
+    Callers block on the returned future, so ``publish()`` still reports the
+    real outcome; a worker thread waits up to ``linger`` seconds after the
+    first pending entry for more to arrive before sending.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[List[Dict[str, Any]]], List[bool]],
+        linger: float,
+        max_entries: int = SNS_MAX_BATCH_ENTRIES,
+    ):
+        self._send = send
+        self._linger = linger
+        self._max_entries = max_entries
+        self._pending: List[Tuple[Dict[str, Any], Future, float]] = []
+        self._cond = threading.Condition()
+        self._is_closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="fitviz-events-sns-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, entry: Dict[str, Any]) -> Future:
+        """Queue a publish entry and return a future for its outcome."""
+        future: Future = Future()
+        with self._cond:
+            if self._is_closed:
+                future.set_result(False)
+                return future
+            self._pending.append((entry, future, time.monotonic()))
+            self._cond.notify()
+        return future
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._is_closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+
+                deadline = self._pending[0][2] + self._linger
+                while len(self._pending) < self._max_entries and not self._is_closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                batch = self._pending[: self._max_entries]
+                del self._pending[: self._max_entries]
+
+            try:
+                results = self._send([entry for entry, _, _ in batch])
+            except Exception as e:
+                logger.error(f"Unexpected error in SNS batch publish: {str(e)}")
+                results = [False] * len(batch)
+
+            for (_, future, _), success in zip(batch, results):
+                future.set_result(success)
+
+    def close(self, timeout: Optional[float] = None):
+        """Send pending entries and stop the worker thread."""
+        with self._cond:
+            self._is_closed = True
+            self._cond.notify()
+        self._thread.join(timeout)
+
 
 class SNSEventPublisher:
     """Event publisher for FitViz notification service using AWS SNS.
@@ -43,13 +206,13 @@ class SNSEventPublisher:
 
     def __init__(
         self,
-        topic_arn: str = None,
+        topic_arn: Optional[str] = None,
         aws_region: str = "us-east-2",
-        organization_id_getter: Callable[[], Optional[UUID]] = None,
+        organization_id_getter: Optional[Callable[[], Optional[UUID]]] = None,
         retry_attempts: int = 3,
         retry_delay: float = 1.0,
         enable_validation: bool = True,
-        config: SNSPublisherConfig = None,
+        config: Optional[SNSPublisherConfig] = None,
     ):
         """Initialize the SNS event publisher.
 
@@ -57,8 +220,8 @@ class SNSEventPublisher:
             topic_arn: SNS topic ARN for publishing events
             aws_region: AWS region for SNS service
             organization_id_getter: Callable that returns current organization ID
-            retry_attempts: Number of retry attempts for failed publishes
-            retry_delay: Delay between retries in seconds
+            retry_attempts: Attempts for publishes SNS answers with an error
+            retry_delay: Initial fail-fast backoff in seconds after SNS is unavailable
             enable_validation: Whether to validate events with Pydantic
             config: SNSPublisherConfig instance (overrides individual params)
         """
@@ -76,9 +239,62 @@ class SNSEventPublisher:
             )
 
         self.organization_id_getter = organization_id_getter
+        self._codec = get_codec(self.config.codec)
+        self._compressor = get_compressor(self.config.compression)
+        self._is_closed = False
+        self._init_process_state()
+        self._outbox: Optional[Outbox] = None
+        if self.config.outbox is not None:
+            self._outbox = Outbox(self.config.outbox, self._replay)
+        register_fork_handlers(self)
+
+    def _init_process_state(self):
+        """Create the SNS client state and helper threads owned by this process."""
+        self._pid = os.getpid()
         self._sns_client = None
         self._lock = threading.Lock()
-        self._is_closed = False
+        self._batcher: Optional[_MicroBatcher] = None
+        if self.config.batch_linger is not None:
+            self._batcher = _MicroBatcher(self._send_batched, self.config.batch_linger)
+        self._breaker: Optional[CircuitBreaker] = None
+        if self.config.circuit_breaker is not None:
+            self._breaker = CircuitBreaker(self.config.circuit_breaker, name="SNS")
+        self._limiter: Optional[TokenBucketLimiter] = None
+        if self.config.rate_limit is not None:
+            self._limiter = TokenBucketLimiter(self.config.rate_limit)
+        self._outages = 0
+        self._unavailable_until = 0.0
+
+    def _after_fork(self):
+        """Drop state inherited from the parent process after ``os.fork()``.
+
+        boto3 clients are not safe to share across processes, so the child
+        creates its own on the next publish. Entries the parent's batcher had
+        not sent yet are left to the parent. The outbox stays with the parent,
+        because its log must only have one writer.
+        """
+        self._init_process_state()
+        if self._outbox is not None:
+            logger.warning(
+                "Outbox disabled in forked process; create the publisher after fork "
+                "(e.g. in a gunicorn post_fork hook) to give each worker its own outbox"
+            )
+            self._outbox = None
+
+    def _check_fork(self):
+        """Reset inherited state if this process was forked without running the fork hooks."""
+        if self._pid != os.getpid():
+            self._after_fork()
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Circuit breaker guarding publishes, for health checks (None if disabled)."""
+        return self._breaker
+
+    @property
+    def codec(self) -> Codec:
+        """Codec used to encode event envelopes."""
+        return self._codec
 
     def _get_organization_id(self, organization_id: Optional[UUID] = None) -> Optional[str]:
         """Get organization ID from parameter or getter.
@@ -89,18 +305,11 @@ class SNSEventPublisher:
         Returns:
             Organization ID as string or None
         """
-        if organization_id:
-            return str(organization_id)
-
-        if self.organization_id_getter:
-            org_id = self.organization_id_getter()
-            return str(org_id) if org_id else None
-
-        return None
+        return resolve_organization_id(organization_id, self.organization_id_getter)
 
     def _validate_event(
         self, event_type: str, data: Dict[str, Any], organization_id: str
-    ) -> BaseEvent:
+    ) -> Optional[BaseModel]:
         """Validate event data using Pydantic schemas.
 
         Args:
@@ -109,7 +318,7 @@ class SNSEventPublisher:
             organization_id: Organization ID
 
         Returns:
-            Validated BaseEvent instance or None
+            Validated data model, or None if not validated
 
         Raises:
             EventValidationError: If validation fails
@@ -117,29 +326,10 @@ class SNSEventPublisher:
         if not self.config.enable_validation:
             return None
 
-        try:
-            event_class = EVENT_TYPE_MAP.get(event_type)
-            if not event_class:
-                logger.warning(f"No validation schema for event type: {event_type}")
-                return None
-
-            event = event_class(
-                event_id=str(uuid4()),
-                event_type=event_type,
-                organization_id=organization_id,
-                data=data,
-            )
-            return event
-
-        except Exception as e:
-            raise EventValidationError(
-                f"Event validation failed for {event_type}: {str(e)}",
-                event_type=event_type,
-                validation_errors=[str(e)],
-            )
+        return validate_event(event_type, data)
 
     def _get_sns_client(self):
-        """Get or create SNS client.
+        """Get the SNS client, shared with publishers using the same settings.
 
         Returns:
             boto3 SNS client instance
@@ -151,10 +341,8 @@ class SNSEventPublisher:
         with self._lock:
             if self._sns_client is None:
                 try:
-                    boto_config = self.config.to_boto3_config()
-                    self._sns_client = boto3.client("sns", **boto_config)
-                    logger.info(
-                        f"SNS client created for region {self.config.aws_region}"
+                    self._sns_client = get_client(
+                        "sns", self.config.to_botocore_config(), **self.config.to_boto3_config()
                     )
                 except Exception as e:
                     logger.error(f"Failed to create SNS client: {str(e)}")
@@ -162,6 +350,19 @@ class SNSEventPublisher:
 
             return self._sns_client
 
+    def warmup(self) -> bool:
+        """Create the SNS client ahead of the first publish.
+
+        Client construction resolves the endpoint and looks up credentials,
+        which otherwise delays the first publish. Call at application start,
+        after forking if the server forks workers.
+
+        Returns:
+            True if the client is ready, False otherwise
+        """
+        self._check_fork()
+        return self._get_sns_client() is not None
+
     def publish(
         self,
         event_type: str,
@@ -182,46 +383,150 @@ class SNSEventPublisher:
             logger.warning("Publisher is closed, cannot publish event")
             return False
 
+        self._check_fork()
+
+        try:
+            org_id = self._admit(event_type, organization_id)
+            if not org_id:
+                return False
+
+            validated_data = self._validate_event(event_type, data, org_id)
+
+            entry = self._build_entry(event_type, data, org_id, validated_data)
+            return self._publish_entry(event_type, entry)
+
+        except EventValidationError as e:
+            logger.error(f"Event validation failed: {str(e)}")
+            return False
+
+        except Exception as e:
+            logger.error(f"Unexpected error publishing event to SNS: {str(e)}")
+            return False
+
+    def publish_encoded(
+        self,
+        event_type: str,
+        message_body: bytes,
+        organization_id: Optional[UUID] = None,
+    ) -> bool:
+        """Publish an event envelope already encoded with this publisher's codec.
+
+        Skips validation and encoding, so ``FanoutPublisher`` can do both once
+        for several publishers. Rate limits, compression, batching, the circuit
+        breaker and the outbox still apply.
+
+        Args:
+            event_type: Type of event (e.g., "workout.created")
+            message_body: Envelope encoded with ``self.codec``
+            organization_id: Optional organization ID (uses getter if not provided)
+
+        Returns:
+            True if published successfully, False otherwise
+        """
+        if self._is_closed:
+            logger.warning("Publisher is closed, cannot publish event")
+            return False
+
+        self._check_fork()
+
         try:
-            org_id = self._get_organization_id(organization_id)
+            org_id = self._admit(event_type, organization_id)
             if not org_id:
-                logger.warning("No organization ID available, skipping event publish")
                 return False
 
-            validated_event = self._validate_event(event_type, data, org_id)
+            entry = self._entry_from_encoded(event_type, message_body, org_id)
+            return self._publish_entry(event_type, entry)
+
+        except Exception as e:
+            logger.error(f"Unexpected error publishing event to SNS: {str(e)}")
+            return False
+
+    def _admit(self, event_type: str, organization_id: Optional[UUID]) -> Optional[str]:
+        """Resolve the organization ID and apply its rate limit.
+
+        Returns:
+            Organization ID, or None if the event must not be published
+        """
+        org_id = self._get_organization_id(organization_id)
+        if not org_id:
+            logger.warning("No organization ID available, skipping event publish")
+            return None
+
+        if self._limiter is not None and not self._limiter.try_acquire(org_id):
+            logger.warning(f"Rate limit exceeded for org {org_id}, dropping event: {event_type}")
+            return None
+        return org_id
+
+    def _publish_entry(self, event_type: str, entry: Dict[str, Any]) -> bool:
+        """Send an entry, falling back to the outbox.
+
+        Returns:
+            True if published (or stored in the outbox), False otherwise
+        """
+        if self._outbox is not None and self._outbox.pending:
+            # Queue behind the events already waiting so delivery stays in order
+            return self._write_outbox(event_type, entry)
+
+        try:
+            if self._breaker is not None:
+                self._breaker.acquire(event_type)
+
+            if self._batcher is not None:
+                success = bool(self._batcher.submit(entry).result())
+            else:
+                success = self._send_entry(event_type, entry)
+
+        except CircuitOpenError:
+            if self._outbox is not None:
+                return self._write_outbox(event_type, entry)
+            return self._reject(event_type, entry)
+
+        if not success and self._outbox is not None:
+            return self._write_outbox(event_type, entry)
+        return success
+
+    def _send_entry(self, event_type: str, entry: Dict[str, Any]) -> bool:
+        """Publish a single entry.
+
+        A transient error fails the publish at once and starts the fail-fast
+        backoff instead of sleeping in the caller's thread; the outbox replays
+        the event in the background when configured. Other errors are retried
+        immediately up to ``retry_attempts`` times.
+
+        Args:
+            event_type: Type of the event
+            entry: Entry built by ``_build_entry``
+
+        Returns:
+            True if published successfully, False otherwise
+        """
+        # Outcome for the circuit breaker and backoff, recorded on every return
+        # path and on unexpected errors: None until SNS answers, False on an outage
+        available: Optional[bool] = None
+        try:
+            if self._is_backing_off():
+                logger.error("SNS unavailable, failing fast until the backoff expires")
+                return False
 
             sns_client = self._get_sns_client()
             if not sns_client:
                 logger.error("Failed to get SNS client")
                 return False
 
-            event_payload = {
-                "event_id": str(uuid4()),
-                "event_type": event_type,
-                "organization_id": org_id,
-                "timestamp": (
-                    validated_event.timestamp.isoformat()
-                    if validated_event
-                    else datetime.utcnow().isoformat()
-                ),
-                "data": data,
-            }
-
-            message_body = json.dumps(event_payload)
-
-            message_attributes = {
-                "event_type": {"DataType": "String", "StringValue": event_type},
-                "organization_id": {"DataType": "String", "StringValue": org_id},
-            }
+            message_attributes = entry["MessageAttributes"]
+            org_id = message_attributes["organization_id"]["StringValue"]
 
             for attempt in range(1, self.config.retry_attempts + 1):
+                available = None
                 try:
                     response = sns_client.publish(
                         TopicArn=self.config.topic_arn,
-                        Message=message_body,
+                        Message=entry["Message"],
                         MessageAttributes=message_attributes,
+                        **{key: entry[key] for key in _FIFO_FIELDS if key in entry},
                     )
 
+                    available = True
                     message_id = response.get("MessageId")
                     logger.info(
                         f"Published event to SNS: {event_type} (org: {org_id}, "
@@ -230,24 +535,437 @@ class SNSEventPublisher:
                     return True
 
                 except (BotoCoreError, ClientError) as e:
+                    if _is_transient(e):
+                        available = False
+                        logger.error(f"SNS publish failed, SNS unavailable: {str(e)}")
+                        return False
+
+                    # SNS answered; the request itself was bad
+                    available = True
                     logger.warning(
-                        f"SNS publish attempt {attempt}/{self.config.retry_attempts} failed: {str(e)}"
+                        f"SNS publish attempt {attempt}/{self.config.retry_attempts} "
+                        f"failed: {str(e)}"
                     )
-                    if attempt < self.config.retry_attempts:
-                        time.sleep(self.config.retry_delay * attempt)
-                    else:
+                    if attempt == self.config.retry_attempts:
                         logger.error(f"All SNS publish attempts failed: {str(e)}")
-                        return False
 
-        except EventValidationError as e:
-            logger.error(f"Event validation failed: {str(e)}")
             return False
 
+        finally:
+            if available is None:
+                self._record_failed_fast()
+            elif available:
+                self._record_available()
+            else:
+                self._record_outage()
+
+    def _is_backing_off(self) -> bool:
+        """Whether SNS recently failed and callers should fail fast."""
+        return time.monotonic() < self._unavailable_until
+
+    def _record_outage(self, calls: int = 1):
+        """Fail fast for a growing, jittered interval after SNS is unavailable.
+
+        Args:
+            calls: Breaker calls (entries) the outage failed
+        """
+        self._record_failed_fast(calls)
+
+        with self._lock:
+            self._outages += 1
+            delay = backoff_delay(self._outages, self.config.retry_delay, self.config.max_backoff)
+            self._unavailable_until = time.monotonic() + delay
+        logger.warning(f"SNS unavailable, failing fast for {delay:.2f}s")
+
+    def _record_available(self, calls: int = 1):
+        """Reset the outage backoff after SNS answered a publish.
+
+        Args:
+            calls: Breaker calls (entries) SNS answered
+        """
+        if self._breaker is not None:
+            for _ in range(calls):
+                self._breaker.record(True)
+
+        if self._outages:
+            with self._lock:
+                self._outages = 0
+                self._unavailable_until = 0.0
+
+    def _record_failed_fast(self, calls: int = 1):
+        """Count calls that failed without SNS answering as breaker failures.
+
+        Every entry the breaker let through must report an outcome, or a
+        half-open breaker's trial slots are used up until ``open_duration``.
+        """
+        if self._breaker is not None:
+            for _ in range(calls):
+                self._breaker.record(False)
+
+    @staticmethod
+    def _entry_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        """Message attributes and FIFO fields of a publish entry as plain strings."""
+        headers = {
+            name: attribute["StringValue"] for name, attribute in entry["MessageAttributes"].items()
+        }
+        headers.update((key, entry[key]) for key in _FIFO_FIELDS if key in entry)
+        return headers
+
+    def _write_outbox(self, event_type: str, entry: Dict[str, Any]) -> bool:
+        """Store a publish entry in the outbox for replay."""
+        if self._outbox is None:
+            return False
+        headers = self._entry_headers(entry)
+        if not self._outbox.append(event_type, entry["Message"].encode("utf-8"), headers):
+            return False
+        logger.warning(f"Stored event in outbox for replay: {event_type}")
+        return True
+
+    def _reject(self, event_type: str, entry: Dict[str, Any]) -> bool:
+        """Hand an entry rejected by the open circuit breaker to the fallback sink."""
+        breaker_config = self.config.circuit_breaker
+        fallback = breaker_config.fallback if breaker_config is not None else None
+        if fallback is None:
+            logger.error(f"Circuit breaker open, dropped event: {event_type}")
+            return False
+
+        try:
+            body = entry["Message"].encode("utf-8")
+            stored = bool(fallback(event_type, body, self._entry_headers(entry)))
         except Exception as e:
-            logger.error(f"Unexpected error publishing event to SNS: {str(e)}")
+            logger.error(f"Circuit breaker fallback failed for {event_type}: {str(e)}")
             return False
 
-        return False
+        if stored:
+            logger.warning(f"Circuit breaker open, sent event to fallback: {event_type}")
+        return stored
+
+    def _replay(self, record: OutboxRecord) -> bool:
+        """Deliver an outbox record to SNS."""
+        headers = dict(record.headers)
+        entry: Dict[str, Any] = {key: headers.pop(key) for key in _FIFO_FIELDS if key in headers}
+        entry["Message"] = record.body.decode("utf-8")
+        entry["MessageAttributes"] = {
+            name: {"DataType": "String", "StringValue": value} for name, value in headers.items()
+        }
+        try:
+            if self._breaker is not None:
+                self._breaker.acquire(record.event_type)
+        except CircuitOpenError:
+            return False
+        return self._send_entry(record.event_type, entry)
+
+    def _build_entry(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        org_id: str,
+        validated_data: Optional[BaseModel],
+    ) -> Dict[str, Any]:
+        """Build the SNS message body and attributes for an event.
+
+        SNS message bodies must be text, so compressed bodies and output from
+        binary codecs are base64 encoded; the ``content_encoding`` attribute lists
+        the encodings in the order they were applied (e.g. "gzip, base64").
+
+        On FIFO topics the entry also gets a ``MessageGroupId`` and a
+        ``MessageDeduplicationId`` (the event ID, so retries are not delivered twice).
+
+        Returns:
+            Dictionary with ``Message`` and ``MessageAttributes`` keys
+        """
+        if not self.config.fifo:
+            body = self._codec.encode_event(event_type, data, org_id, validated_data)
+            return self._entry_from_body(event_type, body, org_id)
+
+        event_id = str(uuid4())
+        body = self._codec.encode_event(event_type, data, org_id, validated_data, event_id)
+        entry = self._entry_from_body(event_type, body, org_id)
+        self._set_fifo_fields(entry, event_id, org_id, data)
+        return entry
+
+    def _set_fifo_fields(
+        self,
+        entry: Dict[str, Any],
+        event_id: str,
+        org_id: str,
+        data: Optional[Dict[str, Any]],
+    ):
+        """Set the FIFO message group and deduplication ID of an entry."""
+        group = org_id
+        field = self.config.message_group_field
+        if field is not None and data and data.get(field) is not None:
+            group = str(data[field])
+        entry["MessageGroupId"] = group
+        entry["MessageDeduplicationId"] = event_id
+
+    def _entry_from_encoded(
+        self, event_type: str, message_body: bytes, org_id: str
+    ) -> Dict[str, Any]:
+        """Build a publish entry for an encoded envelope, reading its event ID on FIFO topics."""
+        entry = self._entry_from_body(event_type, message_body, org_id)
+        if self.config.fifo:
+            payload = self._codec.decode(message_body)
+            self._set_fifo_fields(entry, payload["event_id"], org_id, payload.get("data"))
+        return entry
+
+    def _entry_from_body(self, event_type: str, body: bytes, org_id: str) -> Dict[str, Any]:
+        """Build the SNS message body and attributes for an encoded envelope."""
+        body, compression = compress_body(body, self._compressor, self.config.compression_threshold)
+        if self.config.claim_check is not None:
+            body, compression = offload_body(
+                self.config.claim_check, self._codec, event_type, org_id, body, compression
+            )
+        attributes = {
+            "event_type": {"DataType": "String", "StringValue": event_type},
+            "organization_id": {"DataType": "String", "StringValue": org_id},
+            "content_type": {"DataType": "String", "StringValue": self._codec.content_type},
+        }
+        if self._codec.binary or compression:
+            message = base64.b64encode(body).decode("ascii")
+            content_encoding = f"{compression}, base64" if compression else "base64"
+            attributes["content_encoding"] = {
+                "DataType": "String",
+                "StringValue": content_encoding,
+            }
+        else:
+            message = body.decode("utf-8")
+
+        return {"Message": message, "MessageAttributes": attributes}
+
+    def publish_many(
+        self,
+        events: Iterable[Tuple],
+        organization_id: Optional[UUID] = None,
+    ) -> List[bool]:
+        """Publish several events using SNS PublishBatch.
+
+        Events are grouped into batches of up to 10 entries that stay within the
+        256 KB payload limit. Entries that fail are retried individually; entries
+        SNS rejects as sender faults are not retried. With an outbox, entries
+        that still fail or that the circuit breaker rejects are stored for
+        replay, and while events wait there new entries are queued behind them.
+
+        Args:
+            events: ``(event_type, data)`` or ``(event_type, data, organization_id)`` tuples
+            organization_id: Organization ID for events that do not carry their own
+                (uses getter if not provided)
+
+        Returns:
+            List of per-event results, True if published successfully
+        """
+        events = list(events)
+        results = [False] * len(events)
+        if self._is_closed:
+            logger.warning("Publisher is closed, cannot publish events")
+            return results
+
+        self._check_fork()
+
+        entries: List[Dict[str, Any]] = []
+        positions: List[int] = []
+        for position, event in enumerate(events):
+            event_type, data = event[0], event[1]
+            try:
+                org_id = self._admit(event_type, event[2] if len(event) > 2 else organization_id)
+                if not org_id:
+                    continue
+
+                validated_data = self._validate_event(event_type, data, org_id)
+                entries.append(self._build_entry(event_type, data, org_id, validated_data))
+                positions.append(position)
+
+            except EventValidationError as e:
+                logger.error(f"Event validation failed: {str(e)}")
+
+            except Exception as e:
+                logger.error(f"Unexpected error preparing event for SNS: {str(e)}")
+
+        for position, success in zip(positions, self._publish_entries(entries)):
+            results[position] = success
+        return results
+
+    def publish_many_encoded(self, events: Iterable[Tuple]) -> List[bool]:
+        """Publish several envelopes already encoded with this publisher's codec.
+
+        The batched counterpart of ``publish_encoded``, used by ``OutboxRelay``
+        to send stored envelopes with PublishBatch. Batching, retries, the
+        circuit breaker and the outbox apply as in ``publish_many``.
+
+        Args:
+            events: ``(event_type, message_body, organization_id)`` tuples
+
+        Returns:
+            List of per-event results, True if published successfully
+        """
+        events = list(events)
+        results = [False] * len(events)
+        if self._is_closed:
+            logger.warning("Publisher is closed, cannot publish events")
+            return results
+
+        self._check_fork()
+
+        entries: List[Dict[str, Any]] = []
+        positions: List[int] = []
+        for position, (event_type, message_body, organization_id) in enumerate(events):
+            try:
+                org_id = self._admit(event_type, organization_id)
+                if not org_id:
+                    continue
+
+                entries.append(self._entry_from_encoded(event_type, message_body, org_id))
+                positions.append(position)
+
+            except Exception as e:
+                logger.error(f"Unexpected error preparing event for SNS: {str(e)}")
+
+        for position, success in zip(positions, self._publish_entries(entries)):
+            results[position] = success
+        return results
+
+    def _publish_entries(self, entries: List[Dict[str, Any]]) -> List[bool]:
+        """Send entries with PublishBatch, falling back to the outbox.
+
+        Returns:
+            Per-entry results in input order, True if published (or stored in the outbox)
+        """
+        results = [False] * len(entries)
+        if self._outbox is not None and self._outbox.pending:
+            # Queue behind the events already waiting so delivery stays in order
+            return [self._write_outbox(_entry_event_type(entry), entry) for entry in entries]
+
+        admitted = list(range(len(entries)))
+        if self._breaker is not None:
+            # The breaker admits each entry, as it does for single publishes
+            admitted = []
+            for index, entry in enumerate(entries):
+                if self._breaker.allow_request():
+                    admitted.append(index)
+                elif self._outbox is not None:
+                    results[index] = self._write_outbox(_entry_event_type(entry), entry)
+                else:
+                    results[index] = self._reject(_entry_event_type(entry), entry)
+
+        if not admitted:
+            return results
+
+        sent = self._send_batched([entries[index] for index in admitted])
+        for index, success in zip(admitted, sent):
+            entry = entries[index]
+            if not success and self._outbox is not None:
+                success = self._write_outbox(_entry_event_type(entry), entry)
+            results[index] = success
+        return results
+
+    def _send_batched(self, entries: List[Dict[str, Any]]) -> List[bool]:
+        """Send entries with PublishBatch, retrying failed entries individually.
+
+        Entries SNS fails in its response are retried at once. A transient
+        error from the PublishBatch call itself stops sending, fails the
+        entries not yet published and starts the fail-fast backoff, so the
+        caller does not sleep through an outage. On FIFO topics, once an
+        entry fails, later entries of its message group are held back for the
+        retry too, so the group stays in order. Each entry is one circuit
+        breaker call: callers admit entries one by one, and an outcome is
+        recorded for every entry on every return path.
+
+        Args:
+            entries: Entries built by ``_build_entry``
+
+        Returns:
+            Per-entry results in input order
+        """
+        results = [False] * len(entries)
+        # Whether SNS was reached; entries are recorded as failed fast otherwise,
+        # including when an unexpected error escapes
+        sent = False
+        outage = False
+        pending = list(range(len(entries)))
+        try:
+            if self._is_backing_off():
+                logger.error("SNS unavailable, failing fast until the backoff expires")
+                return results
+
+            sns_client = self._get_sns_client()
+            if not sns_client:
+                logger.error("Failed to get SNS client")
+                return results
+
+            for attempt in range(1, self.config.retry_attempts + 1):
+                retry: List[int] = []
+                # FIFO groups with an entry awaiting retry; their later entries wait too
+                blocked: Set[Any] = set()
+
+                for chunk in chunk_entries([entries[index] for index in pending]):
+                    batch = [pending[i] for i in chunk]
+                    if outage:
+                        retry.extend(batch)
+                        continue
+                    if blocked:
+                        held = [i for i in batch if _message_group(entries[i]) in blocked]
+                        retry.extend(held)
+                        batch = [i for i in batch if i not in held]
+                        if not batch:
+                            continue
+                    try:
+                        response = sns_client.publish_batch(
+                            TopicArn=self.config.topic_arn,
+                            PublishBatchRequestEntries=[
+                                dict(entries[index], Id=str(index)) for index in batch
+                            ],
+                        )
+                    except (BotoCoreError, ClientError) as e:
+                        logger.warning(
+                            f"SNS publish batch attempt {attempt}/{self.config.retry_attempts} "
+                            f"failed: {str(e)}"
+                        )
+                        outage = _is_transient(e)
+                        retry.extend(batch)
+                        blocked.update(_message_group(entries[i]) for i in batch)
+                        continue
+
+                    for success in response.get("Successful", []):
+                        results[int(success["Id"])] = True
+
+                    for failure in response.get("Failed", []):
+                        index = int(failure["Id"])
+                        if failure.get("SenderFault"):
+                            logger.error(
+                                f"SNS rejected batch entry: {failure.get('Code')} "
+                                f"{failure.get('Message', '')}"
+                            )
+                        else:
+                            retry.append(index)
+                            blocked.add(_message_group(entries[index]))
+
+                pending = sorted(retry)
+                if not pending:
+                    break
+                if outage:
+                    logger.error(f"SNS unavailable, failed {len(pending)} batch entries")
+                    break
+                if attempt == self.config.retry_attempts:
+                    logger.error(
+                        f"All SNS publish attempts failed for {len(pending)} batch entries"
+                    )
+
+            sent = True
+            published = sum(results)
+            logger.info(f"Published {published}/{len(entries)} events to SNS in batches")
+            return results
+
+        finally:
+            if not sent:
+                self._record_failed_fast(len(entries))
+            elif outage:
+                # Entries SNS answered before the outage still count as available
+                if self._breaker is not None:
+                    for _ in range(len(entries) - len(pending)):
+                        self._breaker.record(True)
+                self._record_outage(len(pending))
+            else:
+                self._record_available(len(entries))
 
     async def async_publish(
         self,
@@ -266,12 +984,19 @@ class SNSEventPublisher:
             True if published successfully, False otherwise
         """
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, self.publish, event_type, data, organization_id
-        )
+        return await loop.run_in_executor(None, self.publish, event_type, data, organization_id)
 
     def close(self):
-        """Close the publisher and release resources."""
+        """Close the publisher and release resources.
+
+        Events still in the outbox stay on disk and are replayed by the next
+        publisher that opens the same outbox path.
+        """
+        if self._batcher is not None:
+            self._batcher.close()
+        if self._outbox is not None:
+            self._outbox.close()
+
         with self._lock:
             self._is_closed = True
             self._sns_client = None
@@ -0,0 +1,388 @@
+"""Transactional outbox table written inside the application's DB transaction."""
+
+import json
+import logging
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from fitviz_events.codecs import JsonCodec
+from fitviz_events.config import TransactionalOutboxConfig
+from fitviz_events.envelope import resolve_organization_id, serialize_event, validate_event
+from fitviz_events.exceptions import EventPublishError
+from fitviz_events.forking import register_fork_handlers
+
+logger = logging.getLogger(__name__)
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$")
+_PLACEHOLDERS = {"qmark": "?", "format": "%s"}
+
+
+class TransactionalOutbox:
+    """Outbox table that stores events in the caller's database transaction.
+
+    ``add`` only inserts a row; the event becomes visible to the relay when the
+    caller commits, and disappears with a rollback, so an event is stored if
+    and only if the business change it describes is. The row holds the full
+    JSON envelope, so the ``event_id`` and ``timestamp`` are fixed in the
+    transaction and a row the relay sends twice can be deduplicated. Works
+    with any DB-API 2.0 connection (``sqlite3`` locally, psycopg or similar in
+    production).
+
+    Example:
+        outbox = TransactionalOutbox(organization_id_getter=lambda: g.organization_id)
+
+        with db:  # sqlite3 connection, commits on success
+            db.execute("UPDATE payments SET status = 'completed' WHERE id = ?", (payment_id,))
+            outbox.add(db, "payment.completed", {"payment_id": payment_id, ...})
+    """
+
+    def __init__(
+        self,
+        config: Optional[TransactionalOutboxConfig] = None,
+        organization_id_getter: Optional[Callable[[], Optional[UUID]]] = None,
+    ):
+        """Initialize the outbox.
+
+        Args:
+            config: TransactionalOutboxConfig instance (defaults used if omitted)
+            organization_id_getter: Callable that returns current organization ID
+
+        Raises:
+            ValueError: If the table name or paramstyle is invalid
+        """
+        self.config = config or TransactionalOutboxConfig()
+        if not _IDENTIFIER.match(self.config.table_name):
+            raise ValueError(f"Invalid outbox table name: {self.config.table_name!r}")
+        if self.config.paramstyle not in _PLACEHOLDERS:
+            raise ValueError(f"paramstyle must be one of {', '.join(_PLACEHOLDERS)}")
+
+        self.organization_id_getter = organization_id_getter
+        self.table_name = self.config.table_name
+        self._placeholder = _PLACEHOLDERS[self.config.paramstyle]
+
+    def create_table(self, connection):
+        """Create the outbox table if it does not exist (SQLite dialect).
+
+        Rows are relayed in primary-key order, so the integer primary key is the
+        only index the relay needs. Other databases can create an equivalent
+        table with an auto-incrementing ``id``.
+
+        Args:
+            connection: DB-API connection
+        """
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "event_type TEXT NOT NULL, "
+                "organization_id TEXT NOT NULL, "
+                "envelope TEXT NOT NULL, "
+                "created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+            )
+        finally:
+            cursor.close()
+        connection.commit()
+
+    def add(
+        self,
+        connection,
+        event_type: str,
+        data: Dict[str, Any],
+        organization_id: Optional[UUID] = None,
+    ):
+        """Insert an event envelope in the caller's open transaction.
+
+        Does not commit; the caller's commit or rollback decides whether the
+        event is relayed.
+
+        Args:
+            connection: DB-API connection holding the caller's transaction
+            event_type: Type of event (e.g., "payment.completed")
+            data: Event data dictionary
+            organization_id: Optional organization ID (uses getter if not provided)
+
+        Raises:
+            EventValidationError: If validation fails
+            EventPublishError: If no organization ID is available
+        """
+        org_id = resolve_organization_id(organization_id, self.organization_id_getter)
+        if not org_id:
+            raise EventPublishError("No organization ID available", event_type=event_type)
+
+        validated_data = validate_event(event_type, data) if self.config.enable_validation else None
+        envelope = serialize_event(event_type, data, org_id, validated_data)
+
+        p = self._placeholder
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                f"INSERT INTO {self.table_name} (event_type, organization_id, envelope) "
+                f"VALUES ({p}, {p}, {p})",
+                (event_type, org_id, envelope.decode("utf-8")),
+            )
+        finally:
+            cursor.close()
+
+    def fetch(self, connection, limit: int) -> List[Tuple[int, str, str, bytes]]:
+        """Read the oldest stored events.
+
+        Args:
+            connection: DB-API connection
+            limit: Maximum number of rows
+
+        Returns:
+            List of ``(id, event_type, organization_id, envelope)`` tuples in id
+            order, with the envelope as JSON bytes
+        """
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                f"SELECT id, event_type, organization_id, envelope FROM {self.table_name} "
+                f"ORDER BY id LIMIT {int(limit)}"
+            )
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+        return [(row[0], row[1], row[2], row[3].encode("utf-8")) for row in rows]
+
+    def delete(self, connection, ids: List[int]):
+        """Delete relayed rows in one statement; does not commit.
+
+        Args:
+            connection: DB-API connection
+            ids: Row IDs to delete
+        """
+        if not ids:
+            return
+        placeholders = ", ".join([self._placeholder] * len(ids))
+        cursor = connection.cursor()
+        try:
+            cursor.execute(f"DELETE FROM {self.table_name} WHERE id IN ({placeholders})", ids)
+        finally:
+            cursor.close()
+
+
+class OutboxRelay:
+    """Publishes rows from a TransactionalOutbox and deletes them once sent.
+
+    Each pass selects up to ``batch_size`` rows, publishes them in id order,
+    and deletes the published rows in a single statement. Publishers with
+    ``publish_encoded`` (``EventPublisher``, ``SNSEventPublisher``,
+    ``ShardedPublisher``) send the stored envelope, so a row sent again after a
+    crash keeps its ``event_id``; other publishers get its data through
+    ``publish``. Publishers with ``publish_many_encoded`` (``SNSEventPublisher``)
+    get the batch in PublishBatch-sized calls. Once a row fails, the
+    organization's later rows are held back until the next pass, so its events
+    stay in order. Delivery is at least once.
+
+    Example:
+        relay = OutboxRelay(outbox, lambda: sqlite3.connect("app.db"), publisher)
+        relay.start()
+    """
+
+    def __init__(
+        self,
+        outbox: TransactionalOutbox,
+        connect: Callable[[], Any],
+        publisher: Any,
+    ):
+        """Initialize the relay.
+
+        Args:
+            outbox: Outbox whose table is relayed
+            connect: Callable returning a new DB-API connection for the relay
+            publisher: EventPublisher, SNSEventPublisher or any object with
+                ``publish_encoded(event_type, body, organization_id)`` or
+                ``publish(event_type, data, organization_id)``
+        """
+        self.outbox = outbox
+        self.config = outbox.config
+        self.publisher = publisher
+        self._connect = connect
+        self._init_process_state()
+        register_fork_handlers(self)
+
+    def _init_process_state(self):
+        """Create the DB connection and thread state owned by this process."""
+        self._connection = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _after_fork(self):
+        """Drop state inherited from the parent process after ``os.fork()``.
+
+        The relay thread does not exist in the child and the DB connection is
+        abandoned rather than closed, since the parent still uses its socket.
+        The child does not relay unless ``start()`` or ``relay_once()`` is
+        called there, so a pre-fork server keeps a single relay.
+        """
+        self._init_process_state()
+
+    def _publish(self, rows: List[Tuple[int, str, str, bytes]]) -> List[bool]:
+        """Publish rows in order, skipping an organization's rows after its first failure."""
+        if not hasattr(self.publisher, "publish_encoded"):
+            return self._publish_each(rows, [row[3] for row in rows])
+
+        envelopes = self._encode(rows)
+        if hasattr(self.publisher, "publish_many_encoded"):
+            return self._publish_batched(rows, envelopes)
+        return self._publish_each(rows, envelopes)
+
+    def _encode(self, rows: List[Tuple[int, str, str, bytes]]) -> List[Optional[bytes]]:
+        """Re-encode a batch's JSON envelopes with the publisher's codec.
+
+        Returns:
+            Encoded envelopes in row order, None for rows that could not be encoded
+        """
+        codec = self.publisher.codec
+        if codec.content_type == JsonCodec.content_type:
+            return [row[3] for row in rows]
+
+        envelopes: List[Optional[bytes]] = []
+        for _, event_type, _, envelope in rows:
+            try:
+                envelopes.append(codec.encode(json.loads(envelope)))
+            except Exception as e:
+                logger.error(f"Failed to encode outbox event {event_type}: {str(e)}")
+                envelopes.append(None)
+        return envelopes
+
+    def _publish_each(
+        self, rows: List[Tuple[int, str, str, bytes]], envelopes: List[Optional[bytes]]
+    ) -> List[bool]:
+        """Publish rows one at a time with ``publish_encoded`` or ``publish``."""
+        results = []
+        failed_orgs = set()
+        for (_, event_type, org_id, _), envelope in zip(rows, envelopes):
+            success = (
+                org_id not in failed_orgs
+                and envelope is not None
+                and self._publish_row(event_type, org_id, envelope)
+            )
+            if not success:
+                failed_orgs.add(org_id)
+            results.append(success)
+        return results
+
+    def _publish_row(self, event_type: str, org_id: str, envelope: bytes) -> bool:
+        """Publish one envelope, already encoded with the publisher's codec."""
+        try:
+            if not hasattr(self.publisher, "publish_encoded"):
+                data = json.loads(envelope)["data"]
+                return bool(self.publisher.publish(event_type, data, organization_id=org_id))
+            return bool(
+                self.publisher.publish_encoded(event_type, envelope, organization_id=org_id)
+            )
+
+        except Exception as e:
+            logger.error(f"Unexpected error relaying outbox event: {str(e)}")
+            return False
+
+    def _publish_batched(
+        self, rows: List[Tuple[int, str, str, bytes]], envelopes: List[Optional[bytes]]
+    ) -> List[bool]:
+        """Publish rows with ``publish_many_encoded``.
+
+        Rows go out in rounds holding at most one row per organization, so an
+        organization's next row is only sent once its previous one was
+        published, and its later rows are held back after a failure.
+        """
+        results = [False] * len(rows)
+        queues: Dict[str, List[int]] = {}
+        for index, row in enumerate(rows):
+            queues.setdefault(row[2], []).append(index)
+
+        while queues:
+            batch = [indexes[0] for indexes in queues.values()]
+            events = [(rows[i][1], envelopes[i], rows[i][2]) for i in batch]
+            try:
+                sent = self.publisher.publish_many_encoded(
+                    [event for event in events if event[1] is not None]
+                )
+            except Exception as e:
+                logger.error(f"Unexpected error relaying outbox events: {str(e)}")
+                return results
+
+            outcomes = iter(sent)
+            for index, (_, envelope, org_id) in zip(batch, events):
+                results[index] = envelope is not None and next(outcomes)
+                if results[index]:
+                    queues[org_id].pop(0)
+                if not results[index] or not queues[org_id]:
+                    del queues[org_id]
+        return results
+
+    def relay_once(self) -> Tuple[int, int]:
+        """Publish one batch of stored events.
+
+        Returns:
+            Tuple of (rows published, rows that failed and remain stored)
+        """
+        if self._connection is None:
+            self._connection = self._connect()
+        connection = self._connection
+
+        try:
+            rows = self.outbox.fetch(connection, self.config.batch_size)
+            if not rows:
+                connection.rollback()
+                return 0, 0
+
+            results = self._publish(rows)
+            published = [row[0] for row, success in zip(rows, results) if success]
+            self.outbox.delete(connection, published)
+            connection.commit()
+
+        except Exception:
+            self._discard_connection()
+            raise
+
+        failed = len(rows) - len(published)
+        if failed:
+            logger.warning(f"Outbox relay failed to publish {failed}/{len(rows)} events")
+        return len(published), failed
+
+    def _discard_connection(self):
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+            self._connection = None
+
+    def run(self):
+        """Relay until ``close()`` is called, polling every ``poll_interval`` when idle."""
+        while not self._stopped.is_set():
+            try:
+                published, failed = self.relay_once()
+            except Exception as e:
+                logger.error(f"Outbox relay error: {str(e)}")
+                published, failed = 0, 1
+
+            if failed or published < self.config.batch_size:
+                self._stopped.wait(self.config.poll_interval)
+
+        self._discard_connection()
+
+    def start(self):
+        """Run the relay on a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self.run, name="fitviz-events-outbox-relay", daemon=True
+            )
+            self._thread.start()
+
+    def close(self, timeout: Optional[float] = None):
+        """Stop relaying.
+
+        Args:
+            timeout: Seconds to wait for the current batch to finish
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        else:
+            self._discard_connection()
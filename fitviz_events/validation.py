@@ -0,0 +1,156 @@
+"""Compiled, cached validators for event data payloads."""
+
+import threading
+from typing import Any, Dict, Optional, Type
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json, to_jsonable_python
+
+from fitviz_events.events import EVENT_TYPE_MAP
+
+_validators: Dict[str, TypeAdapter] = {}
+_validators_lock = threading.Lock()
+
+
+def _compile(event_type: str) -> Optional[TypeAdapter]:
+    """Build the TypeAdapter for an event type's ``data`` schema."""
+    event_class: Optional[Type[BaseModel]] = EVENT_TYPE_MAP.get(event_type)
+    if event_class is None:
+        return None
+    annotation: Any = event_class.model_fields["data"].annotation
+    return TypeAdapter(annotation)
+
+
+def get_data_validator(event_type: str) -> Optional[TypeAdapter]:
+    """Get the compiled validator for an event type's data payload.
+
+    Validators are built once per event type and reused; event types added to
+    ``EVENT_TYPE_MAP`` later are compiled on first use.
+
+    Args:
+        event_type: Type of the event
+
+    Returns:
+        TypeAdapter for the ``data`` schema, or None if the event type has no schema
+    """
+    validator = _validators.get(event_type)
+    if validator is not None:
+        return validator
+
+    with _validators_lock:
+        validator = _validators.get(event_type)
+        if validator is None:
+            validator = _compile(event_type)
+            if validator is not None:
+                _validators[event_type] = validator
+        return validator
+
+
+def _get_known_validator(event_type: str) -> TypeAdapter:
+    """Validator of an event type whose data has already been validated."""
+    validator = get_data_validator(event_type)
+    if validator is None:
+        raise ValueError(f"No schema for event type: {event_type}")
+    return validator
+
+
+def validate_event_model(event_type: str, data: Dict[str, Any]) -> Optional[BaseModel]:
+    """Validate an event's data payload into its schema model.
+
+    Only the ``data`` schema runs; no event wrapper model, event ID or
+    timestamp is built.
+
+    Args:
+        event_type: Type of the event
+        data: Event data dictionary
+
+    Returns:
+        Validated data model, or None if the event type has no schema
+
+    Raises:
+        pydantic.ValidationError: If the data does not match the schema
+    """
+    validator = get_data_validator(event_type)
+    if validator is None:
+        return None
+
+    validated_data: BaseModel = validator.validate_python(data)
+    return validated_data
+
+
+def _extra_fields(data: Dict[str, Any], validated_data: BaseModel) -> Dict[str, Any]:
+    """Caller's keys the schema does not declare, which validation does not keep."""
+    fields_set = validated_data.model_fields_set
+    if data.keys() <= fields_set:
+        return {}
+    return {key: value for key, value in data.items() if key not in fields_set}
+
+
+def dump_event_data_json(event_type: str, data: Dict[str, Any], validated_data: BaseModel) -> bytes:
+    """Serialize a validated data model straight to JSON bytes.
+
+    Only fields the caller set are written, with the schema's coercions
+    applied. Keys the schema does not declare are passed through unchanged.
+
+    Args:
+        event_type: Type of the event
+        data: Event data dictionary that was validated
+        validated_data: Model returned by ``validate_event_model``
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    validator = _get_known_validator(event_type)
+    extra = _extra_fields(data, validated_data)
+    if not extra:
+        return validator.dump_json(validated_data, exclude_unset=True)
+    return to_json({**validator.dump_python(validated_data, exclude_unset=True), **extra})
+
+
+def dump_event_data(
+    event_type: str, data: Dict[str, Any], validated_data: BaseModel
+) -> Dict[str, Any]:
+    """Convert a validated data model to a dictionary of Python values.
+
+    Args:
+        event_type: Type of the event
+        data: Event data dictionary that was validated
+        validated_data: Model returned by ``validate_event_model``
+
+    Returns:
+        Dictionary of the fields the caller set, with coerced values, plus any
+        keys the schema does not declare
+    """
+    dumped = _get_known_validator(event_type).dump_python(validated_data, exclude_unset=True)
+    return {**dumped, **_extra_fields(data, validated_data)}
+
+
+def validate_event_data(event_type: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Validate an event's data payload and return it as a normalized dict.
+
+    Args:
+        event_type: Type of the event
+        data: Event data dictionary
+
+    Returns:
+        Normalized, JSON-compatible data dictionary containing the fields the
+        caller set (including keys the schema does not declare), or None if
+        the event type has no schema
+
+    Raises:
+        pydantic.ValidationError: If the data does not match the schema
+    """
+    validated_data = validate_event_model(event_type, data)
+    if validated_data is None:
+        return None
+
+    dumped = _get_known_validator(event_type).dump_python(
+        validated_data, mode="json", exclude_unset=True
+    )
+    return {**dumped, **to_jsonable_python(_extra_fields(data, validated_data))}
+
+
+# Compile every known event type up front so the first publish of each type
+# does not pay the schema build.
+for _event_type in EVENT_TYPE_MAP:
+    get_data_validator(_event_type)
@@ -1,4 +1,4 @@
-from setuptools import setup, find_packages
+from setuptools import find_packages, setup
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -31,6 +31,10 @@ setup(
         "boto3>=1.26.0",
     ],
     extras_require={
+        "orjson": ["orjson>=3.8.0"],
+        "msgpack": ["msgpack>=1.0.0"],
+        "zstd": ["zstandard>=0.19.0"],
+        "flask": ["flask>=2.0.0"],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
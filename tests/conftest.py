@@ -0,0 +1,23 @@
+"""Shared test fixtures."""
+
+import time
+
+import pytest
+
+from fitviz_events.aws_clients import clear_clients
+
+
+@pytest.fixture(autouse=True)
+def shared_aws_clients():
+    """Give each test its own boto3 clients, so patched clients do not leak between tests."""
+    clear_clients()
+    yield
+    clear_clients()
+
+
+def wait_until(predicate, timeout=2.0):
+    """Poll until ``predicate`` is true."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met"
+        time.sleep(0.001)
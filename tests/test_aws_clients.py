@@ -0,0 +1,70 @@
+"""Tests for the shared boto3 client registry."""
+
+from unittest.mock import MagicMock, patch
+
+from fitviz_events.aws_clients import ClientRegistry, clear_clients, get_client
+
+
+@patch("fitviz_events.aws_clients.boto3.client")
+def test_same_settings_share_a_client(mock_client):
+    """Test clients are created once per service and settings."""
+    mock_client.side_effect = lambda *args, **kwargs: MagicMock()
+
+    first = get_client("sns", region_name="us-east-2")
+    second = get_client("sns", region_name="us-east-2")
+
+    assert first is second
+    mock_client.assert_called_once_with("sns", region_name="us-east-2")
+
+
+@patch("fitviz_events.aws_clients.boto3.client")
+def test_different_settings_get_their_own_client(mock_client):
+    """Test region, credentials, service and botocore settings are all part of the key."""
+    mock_client.side_effect = lambda *args, **kwargs: MagicMock()
+
+    clients = [
+        get_client("sns", region_name="us-east-2"),
+        get_client("sns", region_name="us-west-2"),
+        get_client("sns", region_name="us-east-2", aws_access_key_id="other"),
+        get_client("s3", region_name="us-east-2"),
+        get_client("sns", {"max_pool_connections": 50}, region_name="us-east-2"),
+    ]
+
+    assert len({id(client) for client in clients}) == len(clients)
+
+
+@patch("fitviz_events.aws_clients.boto3.client")
+def test_botocore_config_is_applied(mock_client):
+    """Test connection pool and timeout settings reach botocore."""
+    get_client(
+        "sns",
+        {"max_pool_connections": 64, "connect_timeout": 2.0, "tcp_keepalive": True},
+        region_name="us-east-2",
+    )
+
+    config = mock_client.call_args[1]["config"]
+    assert config.max_pool_connections == 64
+    assert config.connect_timeout == 2.0
+    assert config.tcp_keepalive is True
+
+
+@patch("fitviz_events.aws_clients.boto3.client")
+def test_clear_forgets_clients(mock_client):
+    """Test clearing the registry creates new clients on next use."""
+    mock_client.side_effect = lambda *args, **kwargs: MagicMock()
+    first = get_client("sns", region_name="us-east-2")
+
+    clear_clients()
+
+    assert get_client("sns", region_name="us-east-2") is not first
+
+
+@patch("fitviz_events.aws_clients.boto3.client")
+def test_registry_is_emptied_after_fork(mock_client):
+    """Test a forked child does not reuse the parent's clients."""
+    registry = ClientRegistry()
+    registry.get("sns", region_name="us-east-2")
+
+    registry._after_fork()
+
+    assert len(registry) == 0
@@ -0,0 +1,269 @@
+"""Tests for BackgroundPublisher."""
+
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+
+from fitviz_events import BackgroundPublisher, BackgroundPublisherConfig
+
+
+class BlockingPublisher:
+    """Publisher double whose publishes wait until ``release`` is set."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.published = []
+        self.close = MagicMock()
+
+    def _get_organization_id(self, organization_id=None):
+        return str(organization_id) if organization_id else "org_123"
+
+    def publish(self, event_type, data, organization_id=None):
+        self.started.set()
+        self.release.wait(5)
+        self.published.append((event_type, data, organization_id))
+        return True
+
+
+@pytest.fixture
+def inner():
+    """Wrapped publisher double."""
+    return BlockingPublisher()
+
+
+def fill_queue(publisher, inner, count):
+    """Occupy the worker with one event, then queue ``count`` more."""
+    publisher.publish("workout.updated", {"n": 0})
+    assert inner.started.wait(1)
+    return [publisher.publish("workout.updated", {"n": i}) for i in range(1, count + 1)]
+
+
+def test_config_rejects_unknown_policy():
+    """Test an unknown overflow policy is rejected."""
+    with pytest.raises(ValueError, match="overflow_policy"):
+        BackgroundPublisherConfig(overflow_policy="explode")
+
+
+def test_config_spill_requires_path():
+    """Test the spill policy requires a spill path."""
+    with pytest.raises(ValueError, match="spill_path"):
+        BackgroundPublisherConfig(overflow_policy="spill")
+
+
+def test_publish_is_queued_and_delivered(inner):
+    """Test publish returns immediately and the worker delivers the event."""
+    publisher = BackgroundPublisher(inner)
+
+    assert publisher.publish("workout.created", {"workout_id": "1"}) is True
+    inner.release.set()
+    assert publisher.flush(timeout=1) is True
+
+    assert inner.published == [("workout.created", {"workout_id": "1"}, "org_123")]
+    assert publisher.stats()["published"] == 1
+
+
+def test_organization_id_resolved_on_calling_thread():
+    """Test the organization getter runs on the caller's thread."""
+    inner = BlockingPublisher()
+    callers = []
+    inner._get_organization_id = (
+        lambda organization_id=None: callers.append(threading.current_thread()) or "org_1"
+    )
+    inner.release.set()
+    publisher = BackgroundPublisher(inner)
+
+    publisher.publish("workout.created", {})
+    publisher.flush(timeout=1)
+
+    assert callers == [threading.current_thread()]
+    assert inner.published[0][2] == "org_1"
+
+
+def test_publish_without_organization_id(inner):
+    """Test events without an organization ID are rejected up front."""
+    inner._get_organization_id = lambda organization_id=None: None
+    publisher = BackgroundPublisher(inner)
+
+    assert publisher.publish("workout.created", {}) is False
+    assert publisher.stats()["enqueued"] == 0
+
+
+def test_drop_newest_policy(inner):
+    """Test drop_newest rejects events once the queue is full."""
+    config = BackgroundPublisherConfig(max_queue_size=2, overflow_policy="drop_newest")
+    publisher = BackgroundPublisher(inner, config=config)
+
+    assert fill_queue(publisher, inner, 3) == [True, True, False]
+    inner.release.set()
+    publisher.flush(timeout=1)
+
+    assert [data["n"] for _, data, _ in inner.published] == [0, 1, 2]
+    assert publisher.stats()["dropped"] == 1
+
+
+def test_drop_oldest_policy(inner):
+    """Test drop_oldest evicts the oldest queued event."""
+    config = BackgroundPublisherConfig(max_queue_size=2, overflow_policy="drop_oldest")
+    publisher = BackgroundPublisher(inner, config=config)
+
+    assert fill_queue(publisher, inner, 3) == [True, True, True]
+    inner.release.set()
+    publisher.flush(timeout=1)
+
+    assert [data["n"] for _, data, _ in inner.published] == [0, 2, 3]
+    assert publisher.stats()["dropped"] == 1
+
+
+def test_block_policy_times_out(inner):
+    """Test block drops the event once block_timeout expires."""
+    config = BackgroundPublisherConfig(
+        max_queue_size=1, overflow_policy="block", block_timeout=0.05
+    )
+    publisher = BackgroundPublisher(inner, config=config)
+
+    assert fill_queue(publisher, inner, 2) == [True, False]
+    assert publisher.stats()["dropped"] == 1
+    inner.release.set()
+
+
+def test_block_policy_waits_for_space(inner):
+    """Test block waits for the worker to free space."""
+    config = BackgroundPublisherConfig(max_queue_size=1, overflow_policy="block", block_timeout=2)
+    publisher = BackgroundPublisher(inner, config=config)
+    threading.Timer(0.05, inner.release.set).start()
+
+    assert fill_queue(publisher, inner, 2) == [True, True]
+    publisher.flush(timeout=1)
+    assert len(inner.published) == 3
+
+
+def test_spill_policy_replays_from_disk(inner, tmp_path):
+    """Test spilled events are written to disk and published later."""
+    spill_path = tmp_path / "spill.jsonl"
+    config = BackgroundPublisherConfig(
+        max_queue_size=1, overflow_policy="spill", spill_path=str(spill_path)
+    )
+    publisher = BackgroundPublisher(inner, config=config)
+
+    assert fill_queue(publisher, inner, 3) == [True, True, True]
+    assert publisher.stats()["spill_depth"] == 2
+    assert len(spill_path.read_text().splitlines()) == 2
+
+    inner.release.set()
+    assert publisher.flush(timeout=1) is True
+
+    assert [data["n"] for _, data, _ in inner.published] == [0, 1, 2, 3]
+    assert spill_path.read_text() == ""
+
+
+def test_spill_policy_keeps_order_while_replaying(tmp_path):
+    """Test events published while the spill file holds data are not sent ahead of it."""
+    inner = BlockingPublisher()
+    inner.release.set()
+    steps = threading.Semaphore(0)
+    publish = inner.publish
+
+    def publish_one_step_at_a_time(event_type, data, organization_id=None):
+        inner.started.set()
+        assert steps.acquire(timeout=5)
+        return publish(event_type, data, organization_id)
+
+    inner.publish = publish_one_step_at_a_time
+    config = BackgroundPublisherConfig(
+        max_queue_size=2, overflow_policy="spill", spill_path=str(tmp_path / "spill.jsonl")
+    )
+    publisher = BackgroundPublisher(inner, config=config)
+    fill_queue(publisher, inner, 3)
+    assert publisher.stats()["spill_depth"] == 1
+
+    # Let the worker publish 0 and take 1, leaving room in the queue while 3 is on disk
+    steps.release()
+    deadline = time.monotonic() + 1
+    while publisher.depth != 1:
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+    assert publisher.publish("workout.updated", {"n": 4}) is True
+
+    for _ in range(4):
+        steps.release()
+    assert publisher.flush(timeout=1) is True
+    assert [data["n"] for _, data, _ in inner.published] == [0, 1, 2, 3, 4]
+
+
+def test_spill_file_writes_values_like_the_envelope(inner, tmp_path):
+    """Test datetimes and UUIDs are spilled in the form the publisher sends them."""
+    spill_path = tmp_path / "spill.jsonl"
+    config = BackgroundPublisherConfig(
+        max_queue_size=1, overflow_policy="spill", spill_path=str(spill_path)
+    )
+    publisher = BackgroundPublisher(inner, config=config)
+    data = {"when": datetime(2025, 1, 15, 10, 0, tzinfo=timezone.utc), "id": UUID(int=1)}
+
+    fill_queue(publisher, inner, 1)
+    publisher.publish("workout.updated", data)
+
+    spilled = json.loads(spill_path.read_text())
+    assert spilled["data"] == {"when": "2025-01-15T10:00:00Z", "id": str(UUID(int=1))}
+    inner.release.set()
+    assert publisher.flush(timeout=1) is True
+
+
+def test_flush_replays_spill_left_by_earlier_process(inner, tmp_path):
+    """Test flush starts the worker to replay a spill file found at startup."""
+    spill_path = tmp_path / "spill.jsonl"
+    spill_path.write_text(
+        '{"event_type": "workout.updated", "data": {"n": 1}, "organization_id": "org_1"}\n'
+    )
+    inner.release.set()
+    publisher = BackgroundPublisher(
+        inner,
+        BackgroundPublisherConfig(overflow_policy="spill", spill_path=str(spill_path)),
+    )
+
+    assert publisher.flush(timeout=1) is True
+    assert inner.published == [("workout.updated", {"n": 1}, "org_1")]
+
+
+def test_close_flushes_and_closes_publisher(inner):
+    """Test close publishes queued events and closes the wrapped publisher."""
+    publisher = BackgroundPublisher(inner)
+    for i in range(5):
+        publisher.publish("workout.updated", {"n": i})
+    inner.release.set()
+
+    publisher.close()
+
+    assert len(inner.published) == 5
+    inner.close.assert_called_once()
+    assert publisher.publish("workout.updated", {}) is False
+
+
+def test_close_stops_worker_after_timeout(inner):
+    """Test close does not keep draining the queue once its timeout has passed."""
+    publisher = BackgroundPublisher(inner)
+    fill_queue(publisher, inner, 3)
+
+    publisher.close(timeout=0.01)
+    inner.release.set()
+    publisher._worker.join(1)
+
+    assert not publisher._worker.is_alive()
+    assert [data["n"] for _, data, _ in inner.published] == [0]
+    inner.close.assert_called_once()
+
+
+def test_failed_publishes_counted(inner):
+    """Test failed publishes are counted."""
+    inner.publish = MagicMock(side_effect=[False, RuntimeError("boom")])
+    publisher = BackgroundPublisher(inner)
+    publisher.publish("workout.updated", {})
+    publisher.publish("workout.updated", {})
+    publisher.flush(timeout=1)
+
+    assert publisher.stats()["failed"] == 2
@@ -0,0 +1,202 @@
+"""Tests for ChannelPool."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fitviz_events import EventPublisher, EventPublisherConfig
+from fitviz_events.channel_pool import ChannelPool
+from fitviz_events.exceptions import EventPublishError
+
+
+def make_connection():
+    """Create a mock connection whose channels are distinct open mocks."""
+    connection = MagicMock()
+    connection.is_open = True
+
+    def new_channel():
+        channel = MagicMock()
+        channel.is_open = True
+        return channel
+
+    connection.channel.side_effect = new_channel
+    return connection
+
+
+@pytest.fixture
+def open_connection():
+    """Factory returning a fresh mock connection per call."""
+    return MagicMock(side_effect=make_connection)
+
+
+class TestChannelPool:
+    """Test channel checkout, checkin and health checks."""
+
+    def test_checkout_opens_channel_lazily(self, open_connection):
+        """Test channels are only opened on first checkout."""
+        pool = ChannelPool(open_connection, size=2)
+        assert open_connection.call_count == 0
+
+        pooled = pool.checkout()
+        assert pooled.is_open
+        assert pool.in_use == 1
+        assert open_connection.call_count == 1
+
+    def test_checkin_reuses_channel(self, open_connection):
+        """Test a checked-in channel is handed out again."""
+        pool = ChannelPool(open_connection, size=2)
+        first = pool.checkout()
+        pool.checkin(first)
+
+        second = pool.checkout()
+        assert second is first
+        assert open_connection.call_count == 1
+
+    def test_one_connection_per_channel_by_default(self, open_connection):
+        """Test concurrent checkouts get separate connections by default."""
+        pool = ChannelPool(open_connection, size=3)
+        channels = [pool.checkout() for _ in range(3)]
+
+        assert open_connection.call_count == 3
+        assert len({id(pooled.connection) for pooled in channels}) == 3
+
+    def test_channels_share_limited_connections(self, open_connection):
+        """Test channels are spread over at most max_connections connections."""
+        pool = ChannelPool(open_connection, size=4, max_connections=2)
+        channels = [pool.checkout() for _ in range(4)]
+
+        assert open_connection.call_count == 2
+        assert all(pooled.connection.channel_count == 2 for pooled in channels)
+
+    def test_setup_channel_called_for_new_channels(self, open_connection):
+        """Test setup callback runs once per opened channel."""
+        setup = MagicMock()
+        pool = ChannelPool(open_connection, size=2, setup_channel=setup)
+        pool.checkin(pool.checkout())
+        pool.checkout()
+
+        assert setup.call_count == 1
+
+    def test_closed_channel_replaced_on_checkout(self, open_connection):
+        """Test a channel closed while idle is discarded and replaced."""
+        pool = ChannelPool(open_connection, size=1)
+        pooled = pool.checkout()
+        pool.checkin(pooled)
+        pooled.channel.is_open = False
+
+        replacement = pool.checkout()
+        assert replacement is not pooled
+        assert replacement.is_open
+
+    def test_discarded_channel_frees_slot(self, open_connection):
+        """Test discarding a channel lets a new one be opened."""
+        pool = ChannelPool(open_connection, size=1, checkout_timeout=0.01)
+        pooled = pool.checkout()
+        pool.checkin(pooled, discard=True)
+
+        assert pool.checkout() is not pooled
+        pooled.channel.close.assert_called_once()
+
+    def test_checkout_times_out_when_exhausted(self, open_connection):
+        """Test checkout raises when every channel stays checked out."""
+        pool = ChannelPool(open_connection, size=1, checkout_timeout=0.01)
+        pool.checkout()
+
+        with pytest.raises(EventPublishError, match="Timed out"):
+            pool.checkout()
+
+    def test_checkout_waits_for_checkin(self, open_connection):
+        """Test a blocked checkout is woken by a checkin."""
+        pool = ChannelPool(open_connection, size=1)
+        pooled = pool.checkout()
+        timer = threading.Timer(0.05, pool.checkin, args=(pooled,))
+        timer.start()
+
+        assert pool.checkout(timeout=1.0) is pooled
+        timer.join()
+
+    def test_close_closes_connections(self, open_connection):
+        """Test closing the pool closes its connections and rejects checkouts."""
+        pool = ChannelPool(open_connection, size=2)
+        pooled = pool.checkout()
+        pool.close()
+
+        pooled.connection.connection.close.assert_called_once()
+        with pytest.raises(EventPublishError, match="closed"):
+            pool.checkout()
+
+
+class TestPublisherChannelPool:
+    """Test EventPublisher publishing through the channel pool."""
+
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
+    def test_concurrent_publishes_use_separate_channels(self, mock_blocking_connection):
+        """Test concurrent publishes are not serialized on one channel."""
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_publish(**kwargs):
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.05)
+            with lock:
+                in_flight.pop()
+
+        def connection_with_slow_channels(params):
+            connection = make_connection()
+            make_channel = connection.channel.side_effect
+
+            def new_channel():
+                channel = make_channel()
+                channel.basic_publish.side_effect = slow_publish
+                return channel
+
+            connection.channel.side_effect = new_channel
+            return connection
+
+        mock_blocking_connection.side_effect = connection_with_slow_channels
+        config = EventPublisherConfig(rabbitmq_url="amqp://localhost:5672", channel_pool_size=4)
+        publisher = EventPublisher(config=config, organization_id_getter=lambda: "org_1")
+        # Publishes racing the first connect fail fast, so connect up front
+        assert publisher._connect() is True
+
+        data = {"workout_id": "1", "title": "Test", "created_by": "user"}
+        results = []
+
+        def publish():
+            results.append(publisher.publish("workout.created", data))
+
+        threads = [threading.Thread(target=publish) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [True] * 4
+        assert max(peak) > 1
+        assert publisher._pool.in_use == 0
+
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
+    def test_unexpected_publish_error_returns_channel(self, mock_blocking_connection):
+        """Test a non-AMQP error from basic_publish does not leak the pooled channel."""
+        connection = make_connection()
+        mock_blocking_connection.return_value = connection
+        config = EventPublisherConfig(
+            rabbitmq_url="amqp://localhost:5672", channel_checkout_timeout=0.1
+        )
+        publisher = EventPublisher(config=config, organization_id_getter=lambda: "org_1")
+        assert publisher._connect() is True
+        data = {"workout_id": "1", "title": "Test", "created_by": "user"}
+
+        pooled = publisher._pool.checkout()
+        pooled.channel.basic_publish.side_effect = ValueError("bad property")
+        publisher._pool.checkin(pooled)
+
+        assert publisher.publish("workout.created", data) is False
+        assert publisher._pool.in_use == 0
+        assert publisher.publish("workout.created", data) is True
+        publisher.close()
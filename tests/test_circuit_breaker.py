@@ -0,0 +1,363 @@
+"""Tests for the publish circuit breaker."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+from pika.exceptions import AMQPConnectionError
+
+from fitviz_events import (
+    CircuitBreakerConfig,
+    EventPublisher,
+    EventPublisherConfig,
+    SNSEventPublisher,
+    SNSPublisherConfig,
+)
+from fitviz_events.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from fitviz_events.config import OutboxConfig
+from fitviz_events.exceptions import CircuitOpenError
+
+WORKOUT = {"workout_id": "123", "title": "Morning Yoga", "created_by": "user_456"}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_breaker(clock, **overrides):
+    options = dict(failure_rate_threshold=0.5, minimum_calls=4, window=10, open_duration=5)
+    options.update(overrides)
+    return CircuitBreaker(CircuitBreakerConfig(**options), name="test", clock=clock)
+
+
+class TestCircuitBreaker:
+    """Test state transitions."""
+
+    def test_opens_at_failure_rate_threshold(self, clock):
+        """Test the breaker opens once enough calls fail."""
+        breaker = make_breaker(clock)
+        for success in (True, False, True):
+            breaker.record(success)
+        assert breaker.state == CLOSED
+
+        breaker.record(False)
+        assert breaker.state == OPEN
+        assert breaker.allow_request() is False
+        assert breaker.snapshot()["rejected"] == 1
+
+    def test_waits_for_minimum_calls(self, clock):
+        """Test a few failures do not open the breaker on their own."""
+        breaker = make_breaker(clock)
+        for _ in range(3):
+            breaker.record(False)
+        assert breaker.state == CLOSED
+
+    def test_old_outcomes_leave_the_window(self, clock):
+        """Test failures older than the window no longer count."""
+        breaker = make_breaker(clock)
+        for _ in range(3):
+            breaker.record(False)
+
+        clock.now += 11
+        breaker.record(False)
+        assert breaker.state == CLOSED
+        assert breaker.snapshot()["calls"] == 1
+
+    def test_half_open_trial_closes_on_success(self, clock):
+        """Test a successful trial call closes the breaker."""
+        breaker = make_breaker(clock)
+        for _ in range(4):
+            breaker.record(False)
+
+        clock.now += 5
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+
+        breaker.record(True)
+        assert breaker.state == CLOSED
+        assert breaker.snapshot()["calls"] == 0
+
+    def test_half_open_trial_reopens_on_failure(self, clock):
+        """Test a failed trial call opens the breaker again."""
+        breaker = make_breaker(clock)
+        for _ in range(4):
+            breaker.record(False)
+
+        clock.now += 5
+        breaker.acquire()
+        breaker.record(False)
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire("workout.created")
+
+    def test_lost_trial_call_is_replaced(self, clock):
+        """Test a trial call that never reports back does not wedge the breaker."""
+        breaker = make_breaker(clock)
+        for _ in range(4):
+            breaker.record(False)
+
+        clock.now += 5
+        assert breaker.allow_request() is True
+        clock.now += 5
+        assert breaker.allow_request() is True
+
+    def test_invalid_config(self):
+        """Test out-of-range settings are rejected."""
+        with pytest.raises(ValueError):
+            CircuitBreakerConfig(failure_rate_threshold=0)
+        with pytest.raises(ValueError):
+            CircuitBreakerConfig(minimum_calls=0)
+
+
+def open_breaker(publisher):
+    for _ in range(publisher.circuit_breaker.config.minimum_calls):
+        publisher.circuit_breaker.record(False)
+    assert publisher.circuit_breaker.state == OPEN
+
+
+class TestEventPublisherCircuitBreaker:
+    """Test the breaker in the RabbitMQ publish path."""
+
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
+    def test_failures_open_breaker_and_skip_broker(self, mock_blocking_connection):
+        """Test failed publishes open the breaker and later ones skip the broker."""
+        mock_blocking_connection.side_effect = AMQPConnectionError("down")
+        publisher = EventPublisher(
+            config=EventPublisherConfig(
+                rabbitmq_url="amqp://localhost",
+                circuit_breaker=CircuitBreakerConfig(minimum_calls=2),
+            ),
+            organization_id_getter=lambda: "org_123",
+        )
+        publisher._supervisor.start = MagicMock()
+
+        assert publisher.publish("workout.created", WORKOUT) is False
+        assert publisher.publish("workout.created", WORKOUT) is False
+        assert publisher.circuit_breaker.state == OPEN
+
+        attempts = mock_blocking_connection.call_count
+        assert publisher.publish("workout.created", WORKOUT) is False
+        assert mock_blocking_connection.call_count == attempts
+        assert publisher.circuit_breaker.snapshot()["rejected"] == 1
+        publisher.close()
+
+    def test_rejected_events_go_to_fallback(self):
+        """Test events rejected while open are handed to the fallback sink."""
+        fallback = MagicMock(return_value=True)
+        publisher = EventPublisher(
+            config=EventPublisherConfig(
+                rabbitmq_url="amqp://localhost",
+                compression="gzip",
+                compression_threshold=0,
+                circuit_breaker=CircuitBreakerConfig(minimum_calls=1, fallback=fallback),
+            ),
+            organization_id_getter=lambda: "org_123",
+        )
+        open_breaker(publisher)
+
+        assert publisher.publish("workout.created", WORKOUT) is True
+        event_type, body, headers = fallback.call_args[0]
+        assert event_type == "workout.created"
+        assert headers == {"content_type": "application/json", "content_encoding": "gzip"}
+        assert body[:2] == b"\x1f\x8b"
+        publisher.close()
+
+    def test_rejected_events_go_to_outbox(self, tmp_path):
+        """Test the outbox takes rejected events when configured."""
+        publisher = EventPublisher(
+            config=EventPublisherConfig(
+                rabbitmq_url="amqp://localhost",
+                outbox=OutboxConfig(path=str(tmp_path), replay_interval=60),
+                circuit_breaker=CircuitBreakerConfig(minimum_calls=1),
+            ),
+            organization_id_getter=lambda: "org_123",
+        )
+        open_breaker(publisher)
+
+        assert publisher.publish("workout.created", WORKOUT) is True
+        assert publisher._outbox.pending == 1
+        publisher.close()
+
+
+class TestSNSCircuitBreaker:
+    """Test the breaker in the SNS publish path."""
+
+    @pytest.fixture
+    def sns_client(self):
+        with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+            client = MagicMock()
+            mock_client.return_value = client
+            yield client
+
+    def make_publisher(self, **breaker_options):
+        return SNSEventPublisher(
+            config=SNSPublisherConfig(
+                topic_arn="arn:aws:sns:us-east-2:1:t",
+                retry_attempts=1,
+                max_backoff=0,
+                circuit_breaker=CircuitBreakerConfig(**breaker_options),
+            ),
+            organization_id_getter=lambda: "org_123",
+        )
+
+    def test_outages_open_breaker(self, sns_client):
+        """Test transient SNS failures open the breaker."""
+        sns_client.publish.side_effect = ClientError(
+            {"Error": {"Code": "ServiceUnavailable", "Message": "down"}}, "publish"
+        )
+        publisher = self.make_publisher(minimum_calls=2)
+
+        assert publisher.publish("workout.created", WORKOUT) is False
+        assert publisher.publish("workout.created", WORKOUT) is False
+        assert publisher.circuit_breaker.state == OPEN
+
+        assert publisher.publish("workout.created", WORKOUT) is False
+        assert sns_client.publish.call_count == 2
+
+    def test_bad_requests_do_not_open_breaker(self, sns_client):
+        """Test requests SNS rejects as invalid count as SNS being available."""
+        sns_client.publish.side_effect = ClientError(
+            {"Error": {"Code": "InvalidParameter", "Message": "bad"}}, "publish"
+        )
+        publisher = self.make_publisher(minimum_calls=2)
+
+        for _ in range(3):
+            assert publisher.publish("workout.created", WORKOUT) is False
+        assert publisher.circuit_breaker.state == CLOSED
+
+    def test_publish_many_rejected_to_fallback(self, sns_client):
+        """Test batch publishes are rejected as a whole while open."""
+        fallback = MagicMock(return_value=True)
+        publisher = self.make_publisher(minimum_calls=1, fallback=fallback)
+        open_breaker(publisher)
+
+        deleted = {"workout_id": "1", "deleted_by": "u"}
+        events = [("workout.created", WORKOUT), ("workout.deleted", deleted)]
+        results = publisher.publish_many(events)
+        assert results == [True, True]
+        sns_client.publish_batch.assert_not_called()
+        assert [c[0][0] for c in fallback.call_args_list] == ["workout.created", "workout.deleted"]
+        assert fallback.call_args_list[0][0][2]["organization_id"] == "org_123"
+
+    def test_publish_many_rejected_to_outbox(self, sns_client, tmp_path):
+        """Test the outbox takes rejected batch entries instead of the fallback."""
+        fallback = MagicMock(return_value=True)
+        publisher = SNSEventPublisher(
+            config=SNSPublisherConfig(
+                topic_arn="arn:aws:sns:us-east-2:1:t",
+                outbox=OutboxConfig(path=str(tmp_path), replay_interval=60),
+                circuit_breaker=CircuitBreakerConfig(minimum_calls=1, fallback=fallback),
+            ),
+            organization_id_getter=lambda: "org_123",
+        )
+        open_breaker(publisher)
+
+        assert publisher.publish_many([("workout.created", WORKOUT)] * 2) == [True, True]
+        assert publisher._outbox.pending == 2
+        sns_client.publish_batch.assert_not_called()
+        fallback.assert_not_called()
+        publisher.close()
+
+    def test_batched_entries_are_recorded_one_by_one(self, sns_client, clock):
+        """Test micro-batched publishes report an outcome for every admitted entry."""
+        sns_client.publish_batch.return_value = {"Successful": [{"Id": "0"}, {"Id": "1"}]}
+        publisher = SNSEventPublisher(
+            config=SNSPublisherConfig(
+                topic_arn="arn:aws:sns:us-east-2:1:t",
+                batch_linger=0.5,
+                circuit_breaker=CircuitBreakerConfig(
+                    minimum_calls=1, open_duration=5, half_open_max_calls=2
+                ),
+            ),
+            organization_id_getter=lambda: "org_123",
+        )
+        publisher.circuit_breaker._clock = clock
+        open_breaker(publisher)
+        clock.now += 5
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(publisher.publish("workout.created", WORKOUT))
+            )
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [True, True]
+        sns_client.publish_batch.assert_called_once()
+        assert publisher.circuit_breaker.state == CLOSED
+        publisher.close()
+
+    def test_failing_fast_records_the_trial_call(self, sns_client, clock):
+        """Test a trial call that fails fast during the backoff re-opens the breaker."""
+        publisher = self.make_publisher(minimum_calls=1, open_duration=5)
+        publisher.circuit_breaker._clock = clock
+        open_breaker(publisher)
+        clock.now += 5
+        publisher._unavailable_until = time.monotonic() + 60
+
+        assert publisher.publish("workout.created", WORKOUT) is False
+        sns_client.publish.assert_not_called()
+        assert publisher.circuit_breaker.state == OPEN
+
+    def test_unexpected_errors_record_the_trial_call(self, sns_client, clock):
+        """Test a trial call that fails with a non-boto error still re-opens the breaker."""
+        sns_client.publish.side_effect = RuntimeError("unexpected")
+        sns_client.publish_batch.side_effect = RuntimeError("unexpected")
+        single = self.make_publisher(minimum_calls=1, open_duration=5)
+        batched = SNSEventPublisher(
+            config=SNSPublisherConfig(
+                topic_arn="arn:aws:sns:us-east-2:1:t",
+                batch_linger=0.001,
+                circuit_breaker=CircuitBreakerConfig(minimum_calls=1, open_duration=5),
+            ),
+            organization_id_getter=lambda: "org_123",
+        )
+
+        for publisher in (single, batched):
+            publisher.circuit_breaker._clock = clock
+            open_breaker(publisher)
+            clock.now += 5
+
+            assert publisher.publish("workout.created", WORKOUT) is False
+            assert publisher.circuit_breaker.state == OPEN
+        batched.close()
+
+    def test_publish_many_admits_entries_one_by_one(self, sns_client, clock):
+        """Test a half-open breaker lets only its trial calls' worth of entries through."""
+        sns_client.publish_batch.return_value = {"Successful": [{"Id": "0"}]}
+        fallback = MagicMock(return_value=True)
+        publisher = self.make_publisher(
+            minimum_calls=1, open_duration=5, half_open_max_calls=1, fallback=fallback
+        )
+        publisher.circuit_breaker._clock = clock
+        open_breaker(publisher)
+        clock.now += 5
+
+        deleted = {"workout_id": "1", "deleted_by": "u"}
+        events = [("workout.created", WORKOUT), ("workout.deleted", deleted)]
+        results = publisher.publish_many(events)
+
+        assert results == [True, True]
+        entries = sns_client.publish_batch.call_args[1]["PublishBatchRequestEntries"]
+        assert len(entries) == 1
+        assert [c[0][0] for c in fallback.call_args_list] == ["workout.deleted"]
+        assert publisher.circuit_breaker.state == CLOSED
@@ -0,0 +1,299 @@
+"""Tests for claim-check offload of oversized payloads."""
+
+import io
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fitviz_events import (
+    ClaimCheckConfig,
+    ClaimCheckError,
+    ClaimCheckResolver,
+    EventPublisher,
+    EventPublisherConfig,
+    FileBlobStore,
+    S3BlobStore,
+    SNSEventPublisher,
+    SNSPublisherConfig,
+    decode_event,
+    get_codec,
+)
+from fitviz_events.claim_check import offload_body
+
+CANCELLED = {
+    "class_id": "class_1",
+    "class_name": "Spin",
+    "scheduled_time": "2026-03-01T09:00:00Z",
+    "cancellation_reason": "Instructor ill",
+    "affected_users": [f"user_{n}" for n in range(5000)],
+}
+
+
+def encode(data):
+    return get_codec().encode_event("class.cancelled", data, "org_123")
+
+
+class TestFileBlobStore:
+    """Test the local-filesystem store."""
+
+    def test_put_and_get(self, tmp_path):
+        """Test a stored body is read back through its reference."""
+        store = FileBlobStore(str(tmp_path))
+
+        reference = store.put("org_123/class.cancelled/abc", b"payload")
+
+        assert reference.startswith("file://")
+        assert store.get(reference) == b"payload"
+        assert (tmp_path / "org_123" / "class.cancelled" / "abc").read_bytes() == b"payload"
+
+    def test_rejects_references_outside_its_directory(self, tmp_path):
+        """Test references to other files are refused."""
+        store = FileBlobStore(str(tmp_path / "claims"))
+        (tmp_path / "secret").write_bytes(b"secret")
+
+        with pytest.raises(ClaimCheckError, match="outside"):
+            store.get(f"file://{tmp_path}/secret")
+        with pytest.raises(ClaimCheckError, match="file reference"):
+            store.get("s3://bucket/key")
+
+    def test_rejects_keys_that_escape_its_directory(self, tmp_path):
+        """Test keys with path traversal segments are not written."""
+        store = FileBlobStore(str(tmp_path / "claims"))
+
+        for key in ("../outside/class.cancelled/abc", "org/../../abc", "/abs/x/abc", "a//b"):
+            with pytest.raises(ClaimCheckError, match="Invalid blob key"):
+                store.put(key, b"payload")
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["claims"]
+
+    def test_offload_with_hostile_organization_id(self, tmp_path):
+        """Test an organization ID with a traversal segment fails the offload."""
+        config = ClaimCheckConfig(store=FileBlobStore(str(tmp_path / "claims")), threshold=1)
+
+        with pytest.raises(ClaimCheckError):
+            offload_body(config, get_codec(), "class.cancelled", "../..", b"body")
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["claims"]
+
+
+class TestS3BlobStore:
+    """Test the S3 store against a client double."""
+
+    def test_put_and_get(self):
+        """Test bodies are written under the prefix and read back by URI."""
+        client = MagicMock()
+        client.get_object.return_value = {"Body": io.BytesIO(b"payload")}
+        store = S3BlobStore("claims", prefix="events/", client=client)
+
+        reference = store.put("org_123/class.cancelled/abc", b"payload")
+
+        assert reference == "s3://claims/events/org_123/class.cancelled/abc"
+        assert client.put_object.call_args[1]["Key"] == "events/org_123/class.cancelled/abc"
+        assert store.get(reference) == b"payload"
+        client.get_object.assert_called_once_with(
+            Bucket="claims", Key="events/org_123/class.cancelled/abc"
+        )
+
+    def test_rejects_other_buckets(self):
+        """Test references to another bucket are refused."""
+        store = S3BlobStore("claims", client=MagicMock())
+
+        with pytest.raises(ClaimCheckError, match="bucket"):
+            store.get("s3://elsewhere/key")
+
+
+class TestOffload:
+    """Test replacing large bodies with a claim check."""
+
+    def test_small_bodies_are_sent_inline(self, tmp_path):
+        """Test bodies under the threshold are left alone."""
+        config = ClaimCheckConfig(store=FileBlobStore(str(tmp_path)), threshold=1024)
+        body = encode({"class_id": "class_1"})
+
+        assert offload_body(config, get_codec(), "class.cancelled", "org_123", body) == (
+            body,
+            None,
+        )
+        assert list(tmp_path.iterdir()) == []
+
+    def test_large_bodies_are_replaced_by_a_reference(self, tmp_path):
+        """Test the message carries only a reference and digest, and resolves back."""
+        config = ClaimCheckConfig(store=FileBlobStore(str(tmp_path)), threshold=1024)
+        body = encode(CANCELLED)
+
+        stub, content_encoding = offload_body(
+            config, get_codec(), "class.cancelled", "org_123", body
+        )
+
+        assert content_encoding is None
+        assert len(stub) < 1024
+        claim = json.loads(stub)["claim_check"]
+        assert claim["digest"].startswith("sha256:")
+        assert claim["size"] == len(body)
+
+        resolver = ClaimCheckResolver(config.store)
+        assert resolver.decode(stub) == json.loads(body)
+
+    def test_identical_payloads_share_a_blob(self, tmp_path):
+        """Test keys are content addressed, so a retried event is stored once."""
+        config = ClaimCheckConfig(store=FileBlobStore(str(tmp_path)), threshold=1024)
+        body = encode(CANCELLED)
+
+        first, _ = offload_body(config, get_codec(), "class.cancelled", "org_123", body)
+        second, _ = offload_body(config, get_codec(), "class.cancelled", "org_123", body)
+
+        assert first == second
+        assert len(list((tmp_path / "org_123" / "class.cancelled").iterdir())) == 1
+
+    def test_store_failure_raises(self):
+        """Test a failed store write surfaces as ClaimCheckError."""
+        store = MagicMock()
+        store.put.side_effect = OSError("disk full")
+        config = ClaimCheckConfig(store=store, threshold=1)
+
+        with pytest.raises(ClaimCheckError, match="disk full"):
+            offload_body(config, get_codec(), "class.cancelled", "org_123", b"body")
+
+    def test_config_validation(self):
+        """Test the threshold must be positive."""
+        with pytest.raises(ValueError, match="threshold"):
+            ClaimCheckConfig(store=MagicMock(), threshold=0)
+
+
+class TestResolver:
+    """Test resolving claim checks on the consumer side."""
+
+    def test_inline_events_pass_through(self):
+        """Test events without a claim check are returned unchanged."""
+        resolver = ClaimCheckResolver(MagicMock())
+        event = {"event_type": "class.cancelled", "data": {}}
+
+        assert resolver.resolve(event) is event
+
+    def test_fetches_are_cached(self, tmp_path):
+        """Test a payload is fetched from the store once."""
+        store = MagicMock(wraps=FileBlobStore(str(tmp_path)))
+        config = ClaimCheckConfig(store=store, threshold=1024)
+        stub, _ = offload_body(config, get_codec(), "class.cancelled", "org_123", encode(CANCELLED))
+        resolver = ClaimCheckResolver(store)
+
+        assert resolver.decode(stub) == resolver.decode(stub)
+        store.get.assert_called_once()
+
+    def test_cache_is_bounded_by_size(self, tmp_path):
+        """Test the least recently used bodies are evicted."""
+        store = FileBlobStore(str(tmp_path))
+        config = ClaimCheckConfig(store=store, threshold=1)
+        stubs = [
+            offload_body(config, get_codec(), "class.cancelled", "org_123", encode({"n": n}))[0]
+            for n in range(3)
+        ]
+        size = len(encode({"n": 0}))
+        resolver = ClaimCheckResolver(store, max_cache_bytes=2 * size)
+
+        for stub in stubs:
+            resolver.decode(stub)
+
+        assert len(resolver._cache) == 2
+        assert json.loads(stubs[0])["claim_check"]["reference"] not in resolver._cache
+
+    def test_digest_mismatch_is_rejected(self, tmp_path):
+        """Test a body that changed after it was stored is not trusted."""
+        store = FileBlobStore(str(tmp_path))
+        config = ClaimCheckConfig(store=store, threshold=1024)
+        stub, _ = offload_body(config, get_codec(), "class.cancelled", "org_123", encode(CANCELLED))
+        path = next((tmp_path / "org_123" / "class.cancelled").iterdir())
+        path.write_bytes(b"tampered")
+
+        with pytest.raises(ClaimCheckError, match="digest"):
+            ClaimCheckResolver(store).decode(stub)
+
+    def test_missing_blob_raises(self, tmp_path):
+        """Test a reference whose body is gone raises ClaimCheckError."""
+        store = FileBlobStore(str(tmp_path))
+        event = {
+            "claim_check": {
+                "reference": f"file://{tmp_path}/missing",
+                "digest": "sha256:0",
+            }
+        }
+
+        with pytest.raises(ClaimCheckError, match="Failed to fetch"):
+            ClaimCheckResolver(store).resolve(event)
+
+
+class TestPublishers:
+    """Test both transports offload oversized events."""
+
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
+    def test_rabbitmq_publish_offloads_compressed_body(self, mock_blocking_connection, tmp_path):
+        """Test the AMQP message carries the claim check, resolving to the full event."""
+        connection = MagicMock()
+        connection.is_open = True
+        mock_blocking_connection.return_value = connection
+        store = FileBlobStore(str(tmp_path))
+        publisher = EventPublisher(
+            config=EventPublisherConfig(
+                rabbitmq_url="amqp://localhost",
+                compression="gzip",
+                claim_check=ClaimCheckConfig(store=store, threshold=1024),
+            ),
+            organization_id_getter=lambda: "org_123",
+        )
+
+        assert publisher.publish("class.cancelled", CANCELLED) is True
+
+        kwargs = connection.channel().basic_publish.call_args[1]
+        assert kwargs["properties"].content_encoding is None
+        claim = json.loads(kwargs["body"])["claim_check"]
+        assert claim["content_encoding"] == "gzip"
+
+        event = ClaimCheckResolver(store).decode(kwargs["body"], kwargs["properties"].content_type)
+        assert event["data"]["affected_users"] == CANCELLED["affected_users"]
+        publisher.close()
+
+    @patch("fitviz_events.aws_clients.boto3.client")
+    def test_sns_publish_sends_reference(self, mock_boto_client, tmp_path):
+        """Test the SNS message is a small text claim check, resolving to the full event."""
+        sns_client = MagicMock()
+        sns_client.publish.return_value = {"MessageId": "msg-1"}
+        mock_boto_client.return_value = sns_client
+        store = FileBlobStore(str(tmp_path))
+        publisher = SNSEventPublisher(
+            config=SNSPublisherConfig(
+                topic_arn="arn:aws:sns:us-east-2:123456789:test-topic",
+                compression="gzip",
+                claim_check=ClaimCheckConfig(store=store, threshold=1024),
+            ),
+            organization_id_getter=lambda: "org_123",
+        )
+        assert publisher.publish("class.cancelled", CANCELLED) is True
+
+        kwargs = sns_client.publish.call_args[1]
+        assert len(kwargs["Message"]) < 1024
+        attributes = kwargs["MessageAttributes"]
+        assert "content_encoding" not in attributes
+        stub = decode_event(kwargs["Message"], attributes["content_type"]["StringValue"])
+        assert stub["claim_check"]["content_encoding"] == "gzip"
+        event = ClaimCheckResolver(store).resolve(stub)
+        assert event["data"]["affected_users"] == CANCELLED["affected_users"]
+        publisher.close()
+
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
+    def test_store_failure_fails_the_publish(self, mock_blocking_connection):
+        """Test an event that cannot be offloaded is not published."""
+        connection = MagicMock()
+        connection.is_open = True
+        mock_blocking_connection.return_value = connection
+        store = MagicMock()
+        store.put.side_effect = OSError("unreachable")
+        publisher = EventPublisher(
+            config=EventPublisherConfig(
+                rabbitmq_url="amqp://localhost",
+                claim_check=ClaimCheckConfig(store=store, threshold=1024),
+            ),
+            organization_id_getter=lambda: "org_123",
+        )
+
+        assert publisher.publish("class.cancelled", CANCELLED) is False
+        connection.channel().basic_publish.assert_not_called()
+        publisher.close()
@@ -0,0 +1,193 @@
+"""Tests for Coalescer."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from fitviz_events import Coalescer, CoalescerConfig
+
+
+class RecordingPublisher:
+    """Publisher double that records publishes."""
+
+    def __init__(self, result=True):
+        self.result = result
+        self.published = []
+        self.delivered = threading.Event()
+        self.close = MagicMock()
+
+    def _get_organization_id(self, organization_id=None):
+        return str(organization_id) if organization_id else "org_123"
+
+    def publish(self, event_type, data, organization_id=None):
+        self.published.append((event_type, data, organization_id))
+        self.delivered.set()
+        return self.result
+
+
+@pytest.fixture
+def inner():
+    """Wrapped publisher double."""
+    return RecordingPublisher()
+
+
+def make_coalescer(inner, **kwargs):
+    kwargs.setdefault("window", 60.0)
+    return Coalescer(inner, config=CoalescerConfig(**kwargs))
+
+
+def test_config_validation():
+    """Test invalid windows and limits are rejected."""
+    with pytest.raises(ValueError, match="window"):
+        CoalescerConfig(window=-1)
+    with pytest.raises(ValueError, match="max_pending"):
+        CoalescerConfig(max_pending=0)
+
+
+def test_keeps_last_update_per_entity(inner):
+    """Test repeated updates for an entity collapse into the last one."""
+    coalescer = make_coalescer(inner)
+
+    for n in range(5):
+        assert coalescer.publish("workout.updated", {"workout_id": "w1", "n": n}) is True
+    coalescer.publish("workout.updated", {"workout_id": "w2", "n": 0})
+
+    assert inner.published == []
+    assert coalescer.pending == 2
+
+    coalescer.flush()
+
+    assert inner.published == [
+        ("workout.updated", {"workout_id": "w1", "n": 4}, "org_123"),
+        ("workout.updated", {"workout_id": "w2", "n": 0}, "org_123"),
+    ]
+    assert coalescer.stats() == {
+        "coalesced": 4,
+        "superseded": 0,
+        "published": 2,
+        "failed": 0,
+        "pending": 0,
+    }
+
+
+def test_merge_combines_fields(inner):
+    """Test merge mode combines fields with later values winning."""
+    coalescer = make_coalescer(inner, merge=True)
+
+    coalescer.publish("workout.updated", {"workout_id": "w1", "name": "Legs", "sets": 3})
+    coalescer.publish("workout.updated", {"workout_id": "w1", "sets": 4})
+    coalescer.flush()
+
+    assert inner.published[0][1] == {"workout_id": "w1", "name": "Legs", "sets": 4}
+
+
+def test_entities_are_scoped_by_organization(inner):
+    """Test the same entity ID in two organizations is not coalesced."""
+    coalescer = make_coalescer(inner)
+
+    coalescer.publish("workout.updated", {"workout_id": "w1"}, organization_id="org_a")
+    coalescer.publish("workout.updated", {"workout_id": "w1"}, organization_id="org_b")
+    coalescer.flush()
+
+    assert [org for _, _, org in inner.published] == ["org_a", "org_b"]
+
+
+def test_delete_supersedes_pending_updates(inner):
+    """Test a delete discards pending updates and is published immediately."""
+    coalescer = make_coalescer(inner)
+
+    coalescer.publish("workout.updated", {"workout_id": "w1", "n": 1})
+    coalescer.publish("workout.updated", {"workout_id": "w2", "n": 1})
+    coalescer.publish("workout.deleted", {"workout_id": "w1", "deleted_by": "user_1"})
+
+    assert inner.published == [
+        ("workout.deleted", {"workout_id": "w1", "deleted_by": "user_1"}, "org_123")
+    ]
+    assert coalescer.pending == 1
+    assert coalescer.stats()["superseded"] == 1
+
+
+def test_other_events_pass_through(inner):
+    """Test events without an entity key, or without the entity field, are not held."""
+    coalescer = make_coalescer(inner)
+
+    coalescer.publish("workout.created", {"workout_id": "w1"})
+    coalescer.publish("workout.updated", {"name": "no id"})
+
+    assert [event_type for event_type, _, _ in inner.published] == [
+        "workout.created",
+        "workout.updated",
+    ]
+    assert coalescer.pending == 0
+
+
+def test_window_expiry_publishes(inner):
+    """Test the worker publishes once the window closes."""
+    coalescer = make_coalescer(inner, window=0.05)
+
+    coalescer.publish("workout.updated", {"workout_id": "w1", "n": 1})
+    coalescer.publish("workout.updated", {"workout_id": "w1", "n": 2})
+
+    assert inner.delivered.wait(2)
+    assert inner.published == [("workout.updated", {"workout_id": "w1", "n": 2}, "org_123")]
+    coalescer.close()
+
+
+def test_window_is_fixed_from_first_event(inner):
+    """Test later events do not extend the window."""
+    coalescer = make_coalescer(inner, window=0.2)
+
+    start = time.monotonic()
+    coalescer.publish("workout.updated", {"workout_id": "w1"})
+    while not inner.delivered.is_set() and time.monotonic() - start < 2:
+        coalescer.publish("workout.updated", {"workout_id": "w1"})
+        time.sleep(0.02)
+
+    assert inner.delivered.is_set()
+    coalescer.close()
+
+
+def test_max_pending_publishes_oldest(inner):
+    """Test exceeding max_pending publishes the oldest entity early."""
+    coalescer = make_coalescer(inner, max_pending=2)
+
+    for workout_id in ["w1", "w2", "w3"]:
+        coalescer.publish("workout.updated", {"workout_id": workout_id})
+
+    assert inner.published == [("workout.updated", {"workout_id": "w1"}, "org_123")]
+    assert coalescer.pending == 2
+
+
+def test_failed_publish_is_counted():
+    """Test failed deliveries are counted."""
+    inner = RecordingPublisher(result=False)
+    coalescer = make_coalescer(inner)
+
+    coalescer.publish("workout.updated", {"workout_id": "w1"})
+    coalescer.flush()
+
+    assert coalescer.stats()["failed"] == 1
+
+
+def test_close_flushes_and_closes_inner(inner):
+    """Test close publishes pending events and closes the wrapped publisher."""
+    with make_coalescer(inner) as coalescer:
+        coalescer.publish("workout.updated", {"workout_id": "w1"})
+
+    assert len(inner.published) == 1
+    inner.close.assert_called_once()
+    assert coalescer.publish("workout.updated", {"workout_id": "w1"}) is False
+
+
+def test_after_fork_drops_pending(inner):
+    """Test a forked child does not publish events pending in the parent."""
+    coalescer = make_coalescer(inner)
+    coalescer.publish("workout.updated", {"workout_id": "w1"})
+
+    coalescer._after_fork()
+    coalescer.flush()
+
+    assert coalescer.pending == 0
+    assert inner.published == []
@@ -0,0 +1,173 @@
+"""Tests for event envelope codecs."""
+
+import base64
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import pytest
+
+from fitviz_events import (
+    EventPublisher,
+    EventPublisherConfig,
+    SNSEventPublisher,
+    SNSPublisherConfig,
+)
+from fitviz_events.codecs import (
+    Codec,
+    JsonCodec,
+    OrjsonCodec,
+    codec_for_content_type,
+    decode_event,
+    get_codec,
+)
+from fitviz_events.envelope import validate_event
+
+WORKOUT = {
+    "workout_id": "123",
+    "title": "Morning Yoga",
+    "duration_minutes": "45",
+    "created_by": "user_456",
+}
+
+
+class HexCodec(Codec):
+    """Binary test codec that hex-encodes JSON."""
+
+    name = "hex"
+    content_type = "application/x-hex"
+    binary = True
+
+    def encode(self, payload):
+        return JsonCodec().encode(payload).hex().encode("ascii")
+
+    def decode(self, body):
+        return json.loads(bytes.fromhex(body.decode("ascii")))
+
+
+def encode_workout(codec):
+    return codec.encode_event(
+        "workout.created", WORKOUT, "org_123", validate_event("workout.created", WORKOUT)
+    )
+
+
+class TestCodecs:
+    """Test codec resolution and round trips."""
+
+    def test_default_codec_is_json(self):
+        """Test None resolves to the JSON codec."""
+        assert isinstance(get_codec(None), JsonCodec)
+        assert isinstance(get_codec("json"), JsonCodec)
+
+    def test_codec_instance_passes_through(self):
+        """Test a Codec instance is used as given."""
+        codec = HexCodec()
+        assert get_codec(codec) is codec
+
+    def test_unknown_codec_raises(self):
+        """Test unknown codec names raise ValueError."""
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+
+    @pytest.mark.parametrize("name", ["json", "orjson", "msgpack"])
+    def test_round_trip(self, name):
+        """Test each codec decodes what it encoded, with coerced data."""
+        if name in ("orjson", "msgpack"):
+            pytest.importorskip(name)
+        codec = get_codec(name)
+
+        payload = codec.decode(encode_workout(codec))
+        assert payload["event_type"] == "workout.created"
+        assert payload["data"] == {**WORKOUT, "duration_minutes": 45}
+        datetime.fromisoformat(payload["timestamp"])
+
+    def test_orjson_matches_json(self):
+        """Test orjson writes the same values as the default codec."""
+        pytest.importorskip("orjson")
+        data = {
+            "when": datetime(2025, 1, 15, 10, 0),
+            "at": datetime(2025, 1, 15, 10, 0, tzinfo=timezone.utc),
+            "id": UUID(int=1),
+        }
+
+        payload = OrjsonCodec().decode(OrjsonCodec().encode_event("unknown.event", data, "org"))
+        expected = JsonCodec().decode(JsonCodec().encode_event("unknown.event", data, "org"))
+        assert payload["data"] == expected["data"]
+        assert payload["data"]["at"] == "2025-01-15T10:00:00Z"
+        assert payload["timestamp"].endswith("Z")
+
+    def test_missing_dependency_raises_import_error(self):
+        """Test optional codecs explain how to install their dependency."""
+        with patch.dict("sys.modules", {"msgpack": None}):
+            with pytest.raises(ImportError, match="fitviz-events\\[msgpack\\]"):
+                get_codec("msgpack")
+
+
+class TestDecodeEvent:
+    """Test content-type negotiation for consumers."""
+
+    def test_missing_content_type_is_json(self):
+        """Test messages without a content type decode as JSON."""
+        body = encode_workout(JsonCodec())
+        assert decode_event(body)["event_type"] == "workout.created"
+        assert decode_event(body.decode("utf-8"), "application/json; charset=utf-8")
+
+    def test_msgpack_content_type(self):
+        """Test MessagePack bodies are decoded by content type."""
+        msgpack = pytest.importorskip("msgpack")
+        body = msgpack.packb({"event_type": "workout.created"})
+        assert decode_event(body, "application/msgpack") == {"event_type": "workout.created"}
+
+    def test_unsupported_content_type(self):
+        """Test unknown content types raise ValueError."""
+        with pytest.raises(ValueError):
+            codec_for_content_type("text/plain")
+
+    def test_base64_content_encoding(self):
+        """Test base64 bodies from SNS are decoded before the codec runs."""
+        body = base64.b64encode(encode_workout(JsonCodec())).decode("ascii")
+        assert decode_event(body, "application/json", "base64")["organization_id"] == "org_123"
+
+        with pytest.raises(ValueError):
+            decode_event("not base64!", "application/json", "base64")
+
+
+class TestPublisherCodecs:
+    """Test publishers use the configured codec."""
+
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
+    def test_rabbitmq_content_type(self, mock_blocking_connection):
+        """Test the AMQP content_type follows the codec."""
+        connection = MagicMock()
+        connection.is_open = True
+        mock_blocking_connection.return_value = connection
+        publisher = EventPublisher(
+            config=EventPublisherConfig(rabbitmq_url="amqp://localhost", codec=HexCodec()),
+            organization_id_getter=lambda: "org_123",
+        )
+
+        assert publisher.publish("workout.created", WORKOUT) is True
+        call_kwargs = connection.channel().basic_publish.call_args[1]
+        assert call_kwargs["properties"].content_type == "application/x-hex"
+        assert HexCodec().decode(call_kwargs["body"])["data"]["duration_minutes"] == 45
+
+    def test_sns_binary_codec_is_base64_encoded(self):
+        """Test binary codecs are base64 encoded with a content_encoding attribute."""
+        with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+            client = MagicMock()
+            client.publish.return_value = {"MessageId": "m1"}
+            mock_client.return_value = client
+            publisher = SNSEventPublisher(
+                config=SNSPublisherConfig(topic_arn="arn:aws:sns:us-east-2:1:t", codec=HexCodec()),
+                organization_id_getter=lambda: "org_123",
+            )
+
+            assert publisher.publish("workout.created", WORKOUT) is True
+
+        call_kwargs = client.publish.call_args[1]
+        attributes = call_kwargs["MessageAttributes"]
+        assert attributes["content_type"]["StringValue"] == "application/x-hex"
+        assert attributes["content_encoding"]["StringValue"] == "base64"
+        body = base64.b64decode(call_kwargs["Message"])
+        assert HexCodec().decode(body)["event_type"] == "workout.created"
@@ -0,0 +1,153 @@
+"""Tests for payload compression."""
+
+import base64
+import os
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fitviz_events import (
+    EventPublisher,
+    EventPublisherConfig,
+    SNSEventPublisher,
+    SNSPublisherConfig,
+    decode_event,
+)
+from fitviz_events.compression import compress_body, decompress, get_compressor
+
+CANCELLED = {
+    "class_id": "class_789",
+    "class_name": "Spin",
+    "scheduled_time": "2025-01-15T10:00:00Z",
+    "cancellation_reason": "Trainer sick",
+    "affected_users": [f"user_{i}" for i in range(2000)],
+}
+
+
+class TestCompressBody:
+    """Test threshold-based compression."""
+
+    def test_disabled_by_default(self):
+        """Test no compressor leaves bodies untouched."""
+        assert get_compressor(None) is None
+        assert compress_body(b"x" * 10000, None, 0) == (b"x" * 10000, None)
+
+    def test_small_bodies_not_compressed(self):
+        """Test bodies under the threshold are sent as-is."""
+        assert compress_body(b"x" * 100, get_compressor("gzip"), 1024) == (b"x" * 100, None)
+
+    @pytest.mark.parametrize("name", ["gzip", "zlib", "zstd"])
+    def test_round_trip(self, name):
+        """Test each algorithm compresses large bodies and decompresses them."""
+        if name == "zstd":
+            pytest.importorskip("zstandard")
+        body = b'{"affected_users": ["user_1", "user_2"]}' * 500
+
+        compressed, encoding = compress_body(body, get_compressor(name), 1024)
+        assert encoding == name
+        assert len(compressed) < len(body)
+        assert decompress(compressed, encoding) == body
+
+    def test_zstd_contexts_are_per_thread(self):
+        """Test threads never share a zstandard compressor or decompressor."""
+        created = []
+
+        class Context:
+            def __init__(self):
+                created.append(self)
+
+            def compress(self, body):
+                return body
+
+            decompress = compress
+
+        zstandard = MagicMock(ZstdCompressor=Context, ZstdDecompressor=Context)
+        with patch.dict(sys.modules, {"zstandard": zstandard}):
+            compressor = get_compressor("zstd")
+
+        def use():
+            for _ in range(3):
+                assert compressor.decompress(compressor.compress(b"body")) == b"body"
+
+        threads = [threading.Thread(target=use) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        use()
+
+        assert len(created) == 2 * (len(threads) + 1)
+
+    def test_incompressible_body_sent_uncompressed(self):
+        """Test compression is skipped when it would not shrink the body."""
+        body = os.urandom(2048)
+        assert compress_body(body, get_compressor("gzip"), 0) == (body, None)
+
+    def test_unknown_algorithm(self):
+        """Test unknown algorithms raise ValueError."""
+        with pytest.raises(ValueError):
+            get_compressor("lz4")
+
+    def test_corrupt_body(self):
+        """Test corrupt compressed bodies raise ValueError."""
+        with pytest.raises(ValueError):
+            decompress(b"not gzip", "gzip")
+
+
+class TestPublisherCompression:
+    """Test publishers compress large events and signal it."""
+
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
+    def test_rabbitmq_content_encoding(self, mock_blocking_connection):
+        """Test large RabbitMQ messages carry the content_encoding property."""
+        connection = MagicMock()
+        connection.is_open = True
+        mock_blocking_connection.return_value = connection
+        publisher = EventPublisher(
+            config=EventPublisherConfig(
+                rabbitmq_url="amqp://localhost", compression="gzip", compression_threshold=1024
+            ),
+            organization_id_getter=lambda: "org_123",
+        )
+
+        assert publisher.publish("class.cancelled", CANCELLED) is True
+        assert publisher.publish("class.cancelled", {**CANCELLED, "affected_users": []}) is True
+
+        large, small = [c[1] for c in connection.channel().basic_publish.call_args_list]
+        assert large["properties"].content_encoding == "gzip"
+        assert small["properties"].content_encoding is None
+
+        properties = large["properties"]
+        event = decode_event(large["body"], properties.content_type, properties.content_encoding)
+        assert event["data"]["affected_users"] == CANCELLED["affected_users"]
+
+    def test_sns_compressed_message_is_base64(self):
+        """Test compressed SNS messages are base64 encoded after compression."""
+        with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+            client = MagicMock()
+            client.publish.return_value = {"MessageId": "m1"}
+            mock_client.return_value = client
+            publisher = SNSEventPublisher(
+                config=SNSPublisherConfig(
+                    topic_arn="arn:aws:sns:us-east-2:1:t",
+                    compression="zlib",
+                    compression_threshold=1024,
+                ),
+                organization_id_getter=lambda: "org_123",
+            )
+
+            assert publisher.publish("class.cancelled", CANCELLED) is True
+
+        call_kwargs = client.publish.call_args[1]
+        attributes = call_kwargs["MessageAttributes"]
+        assert attributes["content_encoding"]["StringValue"] == "zlib, base64"
+        base64.b64decode(call_kwargs["Message"], validate=True)
+
+        event = decode_event(
+            call_kwargs["Message"],
+            attributes["content_type"]["StringValue"],
+            attributes["content_encoding"]["StringValue"],
+        )
+        assert event["data"]["affected_users"] == CANCELLED["affected_users"]
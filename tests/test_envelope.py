@@ -0,0 +1,78 @@
+"""Tests for event envelope serialization."""
+
+import json
+from datetime import datetime, timezone
+from uuid import UUID
+
+from fitviz_events.envelope import build_event_payload, serialize_event, validate_event
+
+
+def test_serialize_validated_event():
+    """Test the envelope carries the validated, coerced data."""
+    data = {
+        "workout_id": "123",
+        "title": "Morning Yoga",
+        "duration_minutes": "45",
+        "created_by": "user_456",
+    }
+    body = serialize_event(
+        "workout.created", data, "org_123", validate_event("workout.created", data)
+    )
+
+    payload = json.loads(body)
+    assert set(payload) == {"event_id", "event_type", "organization_id", "timestamp", "data"}
+    assert payload["event_type"] == "workout.created"
+    assert payload["organization_id"] == "org_123"
+    assert payload["data"] == {**data, "duration_minutes": 45}
+    UUID(payload["event_id"])
+    datetime.fromisoformat(payload["timestamp"].replace("Z", "+00:00"))
+
+
+def test_serialize_keeps_only_set_fields():
+    """Test schema defaults the caller did not set are not written."""
+    data = {"workout_id": "1", "deleted_by": "user_1"}
+    validated = validate_event("workout.deleted", data)
+    body = serialize_event("workout.deleted", data, "org_123", validated)
+    assert json.loads(body)["data"] == data
+
+
+def test_serialize_keeps_keys_outside_the_schema():
+    """Test keys the schema does not declare reach consumers unchanged."""
+    data = {
+        "workout_id": "123",
+        "title": "Morning Yoga",
+        "duration_minutes": "45",
+        "created_by": "user_456",
+        "tags": ["yoga", "morning"],
+    }
+    validated_data = validate_event("workout.created", data)
+
+    body = serialize_event("workout.created", data, "org_123", validated_data)
+    assert json.loads(body)["data"] == {**data, "duration_minutes": 45}
+
+    payload = build_event_payload("workout.created", data, "org_123", validated_data)
+    assert payload["data"] == {**data, "duration_minutes": 45}
+
+
+def test_timestamp_is_utc():
+    """Test the envelope timestamp is timezone-aware UTC."""
+    payload = build_event_payload("unknown.event", {}, "org_123")
+    assert payload["timestamp"].tzinfo is timezone.utc
+
+    timestamp = json.loads(serialize_event("unknown.event", {}, "org_123"))["timestamp"]
+    assert timestamp.endswith("Z")
+
+
+def test_serialize_unvalidated_data_with_datetimes():
+    """Test raw data containing datetimes and UUIDs serializes without validation."""
+    data = {
+        "when": datetime(2025, 1, 15, 10, 0),
+        "id": UUID("12345678-1234-5678-1234-567812345678"),
+        "name": "Zoë",
+    }
+    payload = json.loads(serialize_event("unknown.event", data, "org_123"))
+    assert payload["data"] == {
+        "when": "2025-01-15T10:00:00",
+        "id": "12345678-1234-5678-1234-567812345678",
+        "name": "Zoë",
+    }
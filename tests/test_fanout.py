@@ -0,0 +1,224 @@
+"""Tests for FanoutPublisher."""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fitviz_events import (
+    EventPublisher,
+    FanoutConfig,
+    FanoutPublisher,
+    SNSEventPublisher,
+    SNSPublisherConfig,
+)
+
+WORKOUT = {"workout_id": "123", "title": "Morning Yoga", "created_by": "user_456"}
+
+
+class FakeSink:
+    """Publisher double with a configurable result and delay."""
+
+    def __init__(self, result=True, delay=0.0):
+        self.result = result
+        self.delay = delay
+        self.published = []
+        self.close = MagicMock()
+
+    def _get_organization_id(self, organization_id=None):
+        return str(organization_id) if organization_id else "org_123"
+
+    def publish(self, event_type, data, organization_id=None):
+        time.sleep(self.delay)
+        self.published.append((event_type, data, organization_id))
+        return self.result
+
+
+def make_fanout(sinks, **kwargs):
+    return FanoutPublisher(sinks, config=FanoutConfig(**kwargs))
+
+
+def test_config_rejects_unknown_policy():
+    """Test an unknown success policy is rejected."""
+    with pytest.raises(ValueError, match="success_policy"):
+        FanoutConfig(success_policy="most")
+
+
+def test_requires_known_primary():
+    """Test the primary must name one of the sinks."""
+    with pytest.raises(ValueError, match="Primary"):
+        make_fanout({"a": FakeSink()}, primary="b")
+    with pytest.raises(ValueError, match="sink"):
+        FanoutPublisher({})
+
+
+def test_publishes_to_every_sink():
+    """Test every sink receives the event with the resolved organization."""
+    sinks = {"a": FakeSink(), "b": FakeSink()}
+    publisher = make_fanout(sinks)
+
+    assert publisher.publish("workout.created", WORKOUT) is True
+    for sink in sinks.values():
+        assert sink.published == [("workout.created", WORKOUT, "org_123")]
+
+
+def test_validates_once_before_dispatch():
+    """Test invalid events are rejected without reaching any sink."""
+    sink = FakeSink()
+    publisher = make_fanout({"a": sink})
+
+    assert publisher.publish("workout.created", {"title": "missing fields"}) is False
+    assert sink.published == []
+
+
+def test_sinks_run_concurrently():
+    """Test a publish takes about as long as the slowest sink, not the sum."""
+    publisher = make_fanout({"a": FakeSink(delay=0.2), "b": FakeSink(delay=0.2)})
+
+    start = time.monotonic()
+    assert publisher.publish("workout.created", WORKOUT) is True
+    assert time.monotonic() - start < 0.35
+
+
+@pytest.mark.parametrize(
+    "policy,results,expected",
+    [
+        ("all", (True, False), False),
+        ("all", (True, True), True),
+        ("any", (False, True), True),
+        ("any", (False, False), False),
+        ("primary", (True, False), True),
+        ("primary", (False, True), False),
+    ],
+)
+def test_success_policies(policy, results, expected):
+    """Test each success policy's verdict."""
+    sinks = {"primary": FakeSink(results[0]), "secondary": FakeSink(results[1])}
+    publisher = make_fanout(sinks, success_policy=policy)
+
+    assert publisher.publish("workout.created", WORKOUT) is expected
+    publisher.close()
+
+
+def test_primary_policy_does_not_wait_for_secondaries():
+    """Test the primary policy returns before slower sinks finish."""
+    release = threading.Event()
+    slow = FakeSink()
+    slow.publish = MagicMock(side_effect=lambda *args, **kwargs: release.wait(5))
+    publisher = make_fanout({"fast": FakeSink(), "slow": slow}, success_policy="primary")
+
+    assert publisher.publish("workout.created", WORKOUT) is True
+    release.set()
+    publisher.close()
+    slow.publish.assert_called_once()
+
+
+def test_primary_runs_on_the_calling_thread():
+    """Test the primary sink is not queued behind other requests for a pool thread."""
+    callers = {}
+    sinks = {"primary": FakeSink(), "secondary": FakeSink()}
+    for name, sink in sinks.items():
+        sink.publish = MagicMock(
+            side_effect=lambda *args, name=name, **kwargs: callers.setdefault(
+                name, threading.current_thread()
+            )
+        )
+    publisher = make_fanout(sinks, success_policy="all", max_workers=1)
+
+    assert publisher.publish("workout.created", WORKOUT)
+    assert callers["primary"] is threading.current_thread()
+    assert callers["secondary"] is not threading.current_thread()
+    publisher.close()
+
+
+def test_busy_pool_does_not_delay_primary_policy():
+    """Test concurrent publishes with the primary policy return while the pool is saturated."""
+    release = threading.Event()
+    slow = FakeSink()
+    slow.publish = MagicMock(side_effect=lambda *args, **kwargs: release.wait(5))
+    publisher = make_fanout(
+        {"fast": FakeSink(), "slow": slow}, success_policy="primary", max_workers=1
+    )
+    results = []
+
+    def publish():
+        results.append(publisher.publish("workout.created", WORKOUT))
+
+    threads = [threading.Thread(target=publish) for _ in range(8)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [True] * 8
+    assert time.monotonic() - start < 1
+    release.set()
+    publisher.close()
+
+
+def test_stats_per_sink():
+    """Test per-sink counts, latency and exceptions are recorded."""
+    broken = FakeSink()
+    broken.publish = MagicMock(side_effect=RuntimeError("boom"))
+    publisher = make_fanout({"ok": FakeSink(delay=0.01), "broken": broken})
+
+    publisher.publish("workout.created", WORKOUT)
+    publisher.publish("workout.created", WORKOUT)
+
+    stats = publisher.stats()
+    assert stats["ok"]["published"] == 2
+    assert stats["ok"]["failed"] == 0
+    assert stats["ok"]["max_latency"] >= 0.01
+    assert (stats["broken"]["published"], stats["broken"]["failed"]) == (0, 2)
+
+
+def test_close_closes_sinks():
+    """Test close closes every sink and rejects later publishes."""
+    sinks = {"a": FakeSink(), "b": FakeSink()}
+    with make_fanout(sinks) as publisher:
+        publisher.publish("workout.created", WORKOUT)
+
+    for sink in sinks.values():
+        sink.close.assert_called_once()
+    assert publisher.publish("workout.created", WORKOUT) is False
+
+
+@patch("fitviz_events.aws_clients.boto3.client")
+@patch("fitviz_events.publisher.pika.BlockingConnection")
+def test_rabbitmq_and_sns_share_one_envelope(mock_blocking_connection, mock_boto_client):
+    """Test both transports send the same encoded envelope, validated once."""
+    connection = MagicMock()
+    connection.is_open = True
+    mock_blocking_connection.return_value = connection
+    sns_client = MagicMock()
+    sns_client.publish.return_value = {"MessageId": "msg-1"}
+    mock_boto_client.return_value = sns_client
+
+    rabbitmq = EventPublisher(rabbitmq_url="amqp://localhost")
+    sns = SNSEventPublisher(
+        config=SNSPublisherConfig(
+            topic_arn="arn:aws:sns:us-east-2:123456789:test-topic", aws_region="us-east-2"
+        )
+    )
+    publisher = FanoutPublisher(
+        {"rabbitmq": rabbitmq, "sns": sns}, organization_id_getter=lambda: "org_123"
+    )
+
+    with (
+        patch("fitviz_events.publisher.validate_event") as rabbitmq_validate,
+        patch("fitviz_events.sns_publisher.validate_event") as sns_validate,
+    ):
+        assert publisher.publish("workout.created", WORKOUT) is True
+
+    rabbitmq_validate.assert_not_called()
+    sns_validate.assert_not_called()
+
+    amqp_body = json.loads(connection.channel().basic_publish.call_args[1]["body"])
+    sns_body = json.loads(sns_client.publish.call_args[1]["Message"])
+    assert amqp_body == sns_body
+    assert amqp_body["organization_id"] == "org_123"
+    assert amqp_body["data"] == WORKOUT
+    publisher.close()
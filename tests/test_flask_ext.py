@@ -0,0 +1,161 @@
+"""Tests for the Flask extension."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+flask = pytest.importorskip("flask")
+
+from fitviz_events.flask_ext import FitVizEvents  # noqa: E402
+
+
+class RecordingPublisher:
+    """Publisher double that records publishes."""
+
+    def __init__(self):
+        self.published = []
+
+    def _get_organization_id(self, organization_id=None):
+        return str(organization_id) if organization_id else flask.g.get("organization_id")
+
+    def publish(self, event_type, data, organization_id=None):
+        self.published.append((event_type, data, organization_id))
+        return True
+
+
+@pytest.fixture
+def publisher():
+    """Wrapped publisher double."""
+    return RecordingPublisher()
+
+
+@pytest.fixture
+def app(publisher):
+    """Application with routes that publish events."""
+    app = flask.Flask(__name__)
+    events = FitVizEvents(app, publisher)
+
+    @app.before_request
+    def set_organization():
+        flask.g.organization_id = "org_123"
+
+    @app.route("/ok")
+    def ok():
+        events.publish("workout.created", {"workout_id": "1"})
+        events.publish("workout.updated", {"workout_id": "1"})
+        assert publisher.published == []
+        return "ok"
+
+    @app.route("/client-error")
+    def client_error():
+        events.publish("payment.failed", {"payment_id": "pay_1"})
+        return "declined", 400
+
+    @app.route("/server-error")
+    def server_error():
+        events.publish("workout.created", {"workout_id": "1"})
+        return "oops", 500
+
+    @app.route("/raises")
+    def raises():
+        events.publish("workout.created", {"workout_id": "1"})
+        raise RuntimeError("database unavailable")
+
+    return app
+
+
+def request(app, path):
+    """Issue a request and close the response, as a WSGI server would."""
+    return app.test_client().get(path, buffered=True)
+
+
+def test_events_flushed_after_response(app, publisher):
+    """Test events are published only once the response is closed."""
+    response = request(app, "/ok")
+
+    assert response.status_code == 200
+    assert publisher.published == [
+        ("workout.created", {"workout_id": "1"}, "org_123"),
+        ("workout.updated", {"workout_id": "1"}, "org_123"),
+    ]
+
+
+def test_client_error_discards_events(app, publisher):
+    """Test 4xx responses discard their events by default."""
+    request(app, "/client-error")
+
+    assert publisher.published == []
+
+
+def test_discard_status_is_configurable(app, publisher):
+    """Test a higher cutoff keeps the events of 4xx responses."""
+    app.extensions["fitviz_events"].discard_status = 500
+    request(app, "/client-error")
+    request(app, "/server-error")
+
+    assert [event_type for event_type, _, _ in publisher.published] == ["payment.failed"]
+
+
+def test_server_error_discards_events(app, publisher):
+    """Test 5xx responses discard their events."""
+    request(app, "/server-error")
+
+    assert publisher.published == []
+
+
+def test_exception_discards_events(app, publisher):
+    """Test an unhandled exception discards the request's events."""
+    app.testing = False
+    response = request(app, "/raises")
+
+    assert response.status_code == 500
+    assert publisher.published == []
+
+
+def test_uses_publish_many_when_available():
+    """Test batches go through publish_many when the publisher has it."""
+    publisher = MagicMock()
+    publisher._get_organization_id.return_value = "org_123"
+    publisher.publish_many.return_value = [True, True]
+    app = flask.Flask(__name__)
+    events = FitVizEvents(app, publisher)
+
+    @app.route("/ok")
+    def ok():
+        events.publish("workout.created", {"workout_id": "1"})
+        events.publish("workout.created", {"workout_id": "2"})
+        return "ok"
+
+    request(app, "/ok")
+
+    publisher.publish_many.assert_called_once_with(
+        [
+            ("workout.created", {"workout_id": "1"}, "org_123"),
+            ("workout.created", {"workout_id": "2"}, "org_123"),
+        ]
+    )
+    publisher.publish.assert_not_called()
+
+
+def test_publish_outside_request_is_immediate(publisher):
+    """Test publishing outside a request goes straight to the publisher."""
+    events = FitVizEvents(flask.Flask(__name__), publisher)
+
+    assert events.publish("workout.created", {"workout_id": "1"}, organization_id="org_1")
+    assert publisher.published == [("workout.created", {"workout_id": "1"}, "org_1")]
+
+
+def test_missing_organization_is_rejected(publisher):
+    """Test events without an organization are not queued."""
+    app = flask.Flask(__name__)
+    events = FitVizEvents(app, publisher)
+
+    with app.test_request_context():
+        assert events.publish("workout.created", {"workout_id": "1"}) is False
+        assert events.pending == 0
+
+
+def test_init_app_requires_publisher():
+    """Test init_app rejects a missing publisher."""
+    with pytest.raises(ValueError, match="publisher"):
+        FitVizEvents(flask.Flask(__name__))
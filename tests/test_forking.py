@@ -0,0 +1,193 @@
+"""Tests for resetting publishers in forked processes."""
+
+import os
+import sqlite3
+import traceback
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fitviz_events import (
+    BackgroundPublisher,
+    BackgroundPublisherConfig,
+    ConfirmingEventPublisher,
+    EventPublisher,
+    EventPublisherConfig,
+    OutboxRelay,
+    SNSEventPublisher,
+    SNSPublisherConfig,
+    TransactionalOutbox,
+)
+from fitviz_events.config import OutboxConfig
+from tests.conftest import wait_until
+from tests.test_async_publisher import FakeConnection
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+
+WORKOUT = {"workout_id": "123", "title": "Morning Yoga", "created_by": "user_456"}
+
+
+def run_in_child(check):
+    """Run ``check`` in a forked child and fail if it raises."""
+    pid = os.fork()
+    if pid == 0:
+        status = 0
+        try:
+            check()
+        except BaseException:
+            traceback.print_exc()
+            status = 1
+        os._exit(status)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0, "check failed in forked child"
+
+
+@patch("fitviz_events.publisher.pika.BlockingConnection")
+def test_publisher_drops_inherited_connection(mock_blocking_connection, tmp_path):
+    """Test a forked child abandons the parent's connection and opens its own."""
+    parent_connection = MagicMock()
+    parent_connection.is_open = True
+    mock_blocking_connection.return_value = parent_connection
+
+    publisher = EventPublisher(
+        config=EventPublisherConfig(
+            rabbitmq_url="amqp://localhost", outbox=OutboxConfig(path=str(tmp_path))
+        ),
+        organization_id_getter=lambda: "org_123",
+    )
+    assert publisher._connect() is True
+    parent_lock = publisher._lock
+
+    def check():
+        assert publisher._connection is None
+        assert publisher._pool is None
+        assert publisher._lock is not parent_lock
+        assert publisher._outbox is None
+        parent_connection.close.assert_not_called()
+
+        child_connection = MagicMock()
+        child_connection.is_open = True
+        mock_blocking_connection.return_value = child_connection
+        assert publisher.publish("workout.created", WORKOUT) is True
+        child_connection.channel().basic_publish.assert_called_once()
+
+    run_in_child(check)
+
+    assert publisher._connection is parent_connection
+    assert publisher._outbox is not None
+    publisher.close()
+
+
+def test_sns_publisher_recreates_client():
+    """Test a forked child creates its own boto3 client."""
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+        publisher = SNSEventPublisher(
+            config=SNSPublisherConfig(topic_arn="arn:aws:sns:us-east-2:1:t"),
+            organization_id_getter=lambda: "org_123",
+        )
+        parent_client = publisher._get_sns_client()
+
+        def check():
+            assert publisher._sns_client is None
+            mock_client.return_value = MagicMock()
+            assert publisher._get_sns_client() is not parent_client
+
+        run_in_child(check)
+        assert publisher._sns_client is parent_client
+
+
+def test_background_publisher_leaves_queue_to_parent(tmp_path):
+    """Test events queued before the fork are not published again by the child."""
+    inner = MagicMock()
+    inner._get_organization_id.return_value = "org_123"
+    publisher = BackgroundPublisher(
+        inner,
+        BackgroundPublisherConfig(overflow_policy="spill", spill_path=str(tmp_path / "spill")),
+    )
+    publisher._ensure_worker = MagicMock()
+    publisher.publish("workout.created", WORKOUT)
+    assert publisher.depth == 1
+
+    def check():
+        assert publisher.depth == 0
+        assert publisher._spill.path == f"{tmp_path / 'spill'}.{os.getpid()}"
+
+    run_in_child(check)
+    assert publisher.depth == 1
+
+
+def test_confirming_publisher_starts_its_own_io_thread():
+    """Test a forked child does not wait on the parent's I/O thread and futures."""
+    FakeConnection.instances = []
+    with patch("fitviz_events.async_publisher.AsyncioConnection", FakeConnection):
+        publisher = ConfirmingEventPublisher(
+            config=EventPublisherConfig(rabbitmq_url="amqp://localhost", confirm_timeout=1.0),
+            organization_id_getter=lambda: "org_123",
+        )
+        unconfirmed = publisher.publish("workout.created", WORKOUT)
+        wait_until(
+            lambda: FakeConnection.instances and FakeConnection.instances[0].channel_obj.published
+        )
+        parent_thread = publisher._thread
+
+        def check():
+            assert publisher._thread is None
+            assert publisher._loop is None
+            assert publisher.pending_confirms == 0
+            assert publisher._publisher._connection is None
+
+            future = publisher.publish("workout.created", WORKOUT)
+            assert publisher._thread is not parent_thread
+            wait_until(
+                lambda: len(FakeConnection.instances) == 2
+                and FakeConnection.instances[1].channel_obj.published
+            )
+            channel = FakeConnection.instances[-1].channel_obj
+            publisher._loop.call_soon_threadsafe(channel.confirm, 1, True, False)
+            assert future.result(timeout=1) is True
+
+        run_in_child(check)
+        assert not unconfirmed.done()
+        publisher.close(timeout=0.1)
+
+
+def test_outbox_relay_is_not_running_in_child(tmp_path):
+    """Test a forked child drops the relay's thread and DB connection."""
+    outbox = TransactionalOutbox()
+    path = str(tmp_path / "app.db")
+    connection = sqlite3.connect(path)
+    outbox.create_table(connection)
+    connection.close()
+    relay = OutboxRelay(outbox, lambda: sqlite3.connect(path), MagicMock())
+    relay.start()
+    wait_until(lambda: relay._connection is not None)
+    parent_thread = relay._thread
+
+    def check():
+        assert relay._thread is None
+        assert relay._connection is None
+        assert not relay._stopped.is_set()
+
+    run_in_child(check)
+    assert relay._thread is parent_thread
+    relay.close(timeout=1)
+
+
+@patch("fitviz_events.publisher.pika.BlockingConnection")
+def test_pid_check_resets_without_fork_hooks(mock_blocking_connection):
+    """Test a PID mismatch resets the publisher even if the fork hooks did not run."""
+    connection = MagicMock()
+    connection.is_open = True
+    mock_blocking_connection.return_value = connection
+    publisher = EventPublisher(
+        rabbitmq_url="amqp://localhost", organization_id_getter=lambda: "org_123"
+    )
+    assert publisher._connect() is True
+    stale_pool = publisher._pool
+
+    publisher._pid = -1
+    assert publisher.publish("workout.created", WORKOUT) is True
+    assert publisher._pool is not stale_pool
+    assert publisher._pid == os.getpid()
+    publisher.close()
@@ -0,0 +1,120 @@
+"""Tests for the background heartbeat pump."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from fitviz_events import EventPublisher, EventPublisherConfig
+from fitviz_events.channel_pool import PooledConnection
+from fitviz_events.heartbeat import HeartbeatPump
+from tests.conftest import wait_until
+
+
+def open_connection():
+    connection = MagicMock()
+    connection.is_open = True
+    return PooledConnection(connection)
+
+
+class TestHeartbeatPump:
+    """Test servicing pooled connections."""
+
+    def test_pump_once_services_idle_connections(self):
+        """Test each idle connection processes data events without blocking."""
+        connections = [open_connection(), open_connection()]
+        pump = HeartbeatPump(lambda: connections, interval=60)
+
+        assert pump.pump_once() == 2
+        for pooled in connections:
+            pooled.connection.process_data_events.assert_called_once_with(time_limit=0)
+
+    def test_busy_connections_are_skipped(self):
+        """Test a connection held by a publishing thread is not touched."""
+        busy = open_connection()
+        pump = HeartbeatPump(lambda: [busy], interval=60)
+
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def publish():
+            with busy.lock:
+                acquired.set()
+                release.wait()
+
+        thread = threading.Thread(target=publish)
+        thread.start()
+        acquired.wait()
+        try:
+            assert pump.pump_once() == 0
+        finally:
+            release.set()
+            thread.join()
+        busy.connection.process_data_events.assert_not_called()
+
+    def test_lost_connection_is_reported(self):
+        """Test closed or failing connections trigger the lost callback."""
+        failing = open_connection()
+        failing.connection.process_data_events.side_effect = Exception("reset")
+        lost = MagicMock()
+        pump = HeartbeatPump(lambda: [failing], interval=60, on_connection_lost=lost)
+
+        assert pump.pump_once() == 0
+        lost.assert_called_once_with()
+
+    def test_background_thread(self):
+        """Test the pump runs on its own until closed."""
+        pooled = open_connection()
+        pump = HeartbeatPump(lambda: [pooled], interval=0.005)
+        pump.start()
+        wait_until(lambda: pooled.connection.process_data_events.call_count >= 2)
+        pump.close(timeout=1)
+        assert not pump.is_running
+
+
+class TestPublisherHeartbeat:
+    """Test EventPublisher starts the pump when configured."""
+
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
+    def test_pump_keeps_publisher_connection_serviced(self, mock_blocking_connection):
+        """Test the publisher's connection is serviced between publishes."""
+        connection = MagicMock()
+        connection.is_open = True
+        mock_blocking_connection.return_value = connection
+
+        publisher = EventPublisher(
+            config=EventPublisherConfig(
+                rabbitmq_url="amqp://localhost", heartbeat_pump_interval=0.005
+            ),
+            organization_id_getter=lambda: "org_123",
+        )
+        assert publisher._connect() is True
+        wait_until(lambda: connection.process_data_events.call_count >= 2)
+
+        publisher.close()
+        assert not publisher._pump.is_running
+
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
+    def test_dropped_connection_reconnects_in_background(self, mock_blocking_connection):
+        """Test a connection the broker dropped while idle is replaced before the next publish."""
+        first, second = MagicMock(), MagicMock()
+        first.is_open = second.is_open = True
+        mock_blocking_connection.side_effect = [first, second]
+
+        publisher = EventPublisher(
+            config=EventPublisherConfig(
+                rabbitmq_url="amqp://localhost",
+                retry_delay=0.001,
+                heartbeat_pump_interval=0.005,
+            ),
+            organization_id_getter=lambda: "org_123",
+        )
+        assert publisher._connect() is True
+
+        first.is_open = False
+        wait_until(lambda: publisher._connection is second and publisher._is_connected())
+        publisher.close()
+
+    def test_no_pump_by_default(self):
+        """Test the pump is opt-in."""
+        publisher = EventPublisher(rabbitmq_url="amqp://localhost")
+        assert publisher._pump is None
+        publisher.close()
@@ -0,0 +1,48 @@
+"""Tests for lazy package imports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import fitviz_events
+
+
+def loaded_modules(statement):
+    """Run ``statement`` in a fresh interpreter and list the transports it imported."""
+    probe = (
+        f"{statement}\n"
+        "import sys\n"
+        "print(','.join(m for m in ('pika', 'boto3') if m in sys.modules))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    ).stdout.strip()
+    return set(filter(None, output.split(",")))
+
+
+def test_package_import_loads_no_transport():
+    """Test importing the package does not import pika or boto3."""
+    assert loaded_modules("import fitviz_events") == set()
+
+
+def test_rabbitmq_publisher_does_not_load_boto3():
+    """Test the RabbitMQ publisher only imports pika."""
+    assert loaded_modules("from fitviz_events import EventPublisher") == {"pika"}
+
+
+def test_sns_publisher_does_not_load_pika():
+    """Test the SNS publisher only imports boto3."""
+    assert loaded_modules("from fitviz_events import SNSEventPublisher") == {"boto3"}
+
+
+def test_every_exported_name_resolves():
+    """Test every name in __all__ can be imported."""
+    for name in fitviz_events.__all__:
+        assert getattr(fitviz_events, name) is not None
+
+
+def test_unknown_attribute_raises():
+    """Test unknown attributes still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        fitviz_events.NotAPublisher
@@ -0,0 +1,192 @@
+"""Tests for the durable local outbox."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from pika.exceptions import AMQPConnectionError
+
+from fitviz_events import EventPublisher, EventPublisherConfig
+from fitviz_events.config import OutboxConfig
+from fitviz_events.outbox import Outbox, SegmentLog
+from tests.conftest import wait_until
+
+WORKOUT = {"workout_id": "123", "title": "Morning Yoga", "created_by": "user_456"}
+
+
+class TestSegmentLog:
+    """Test append, read and compaction of the segment log."""
+
+    def test_append_read_commit(self, tmp_path):
+        """Test records are read in order and removed once committed."""
+        log = SegmentLog(str(tmp_path), fsync_interval=0)
+        for i in range(3):
+            assert log.append("workout.created", f"body-{i}".encode(), {"n": str(i)}) == i
+
+        records = log.read(10)
+        assert [r.body for r in records] == [b"body-0", b"body-1", b"body-2"]
+        assert records[1].headers == {"n": "1"}
+        assert len(log) == 3
+
+        log.commit(records[1].offset)
+        assert len(log) == 1
+        assert [r.offset for r in log.read(10)] == [2]
+        log.close()
+
+    def test_read_is_repeatable_until_commit(self, tmp_path):
+        """Test uncommitted records are returned again by the next read."""
+        log = SegmentLog(str(tmp_path))
+        log.append("a", b"1")
+        assert log.read(10)[0].body == b"1"
+        assert log.read(10)[0].body == b"1"
+        log.close()
+
+    def test_segments_roll_and_compact(self, tmp_path):
+        """Test full segments are sealed and deleted once replayed."""
+        log = SegmentLog(str(tmp_path), segment_bytes=256, fsync_interval=0)
+        for i in range(20):
+            log.append("a", b"x" * 50)
+        assert len(list(tmp_path.glob("*.seg"))) > 1
+
+        records = log.read(100)
+        assert [r.offset for r in records] == list(range(20))
+
+        log.commit(19)
+        assert len(list(tmp_path.glob("*.seg"))) == 1
+        assert len(log) == 0
+        log.close()
+
+    def test_reopen_resumes_from_checkpoint(self, tmp_path):
+        """Test a reopened log continues after the last committed record."""
+        log = SegmentLog(str(tmp_path), segment_bytes=256)
+        for i in range(10):
+            log.append("a", str(i).encode())
+        log.read(4)
+        log.commit(3)
+        log.close()
+
+        log = SegmentLog(str(tmp_path), segment_bytes=256)
+        assert len(log) == 6
+        assert [r.body for r in log.read(100)] == [str(i).encode() for i in range(4, 10)]
+        assert log.append("a", b"10") == 10
+        log.close()
+
+    def test_torn_write_is_truncated(self, tmp_path):
+        """Test a partially written record at the tail is dropped on reopen."""
+        log = SegmentLog(str(tmp_path))
+        log.append("a", b"complete")
+        log.close()
+
+        (segment,) = tmp_path.glob("*.seg")
+        with open(segment, "ab") as f:
+            f.write(b"\x40\x00\x00\x00partial")
+
+        log = SegmentLog(str(tmp_path))
+        assert [r.body for r in log.read(10)] == [b"complete"]
+        assert log.append("a", b"next") == 1
+        assert [r.body for r in log.read(10)] == [b"complete", b"next"]
+        log.close()
+
+    def test_concurrent_appends(self, tmp_path):
+        """Test appends from many threads each get a unique offset."""
+        log = SegmentLog(str(tmp_path), segment_bytes=4096)
+        offsets = []
+
+        def append_many():
+            offsets.extend(log.append("a", b"payload") for _ in range(200))
+
+        threads = [threading.Thread(target=append_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(offsets) == list(range(800))
+        assert len(log.read(1000)) == 800
+        log.close()
+
+
+class TestOutbox:
+    """Test in-order replay."""
+
+    def test_replays_in_order_after_failures(self, tmp_path):
+        """Test replay stops at a failure and resumes from the same event."""
+        delivered = []
+        available = threading.Event()
+
+        def send(record):
+            if not available.is_set():
+                return False
+            delivered.append(record.body)
+            return True
+
+        outbox = Outbox(OutboxConfig(path=str(tmp_path), replay_interval=0.01), send)
+        for i in range(5):
+            assert outbox.append("a", str(i).encode()) is True
+
+        time.sleep(0.05)
+        assert delivered == []
+        assert outbox.pending == 5
+
+        available.set()
+        wait_until(lambda: outbox.pending == 0)
+        assert delivered == [b"0", b"1", b"2", b"3", b"4"]
+        outbox.close()
+
+    def test_pending_events_replayed_on_startup(self, tmp_path):
+        """Test events left by a previous process are replayed."""
+        config = OutboxConfig(path=str(tmp_path), replay_interval=0.01)
+        outbox = Outbox(config, lambda record: False)
+        outbox.append("a", b"left over")
+        outbox.close()
+
+        delivered = []
+        outbox = Outbox(config, lambda record: delivered.append(record.body) or True)
+        wait_until(lambda: delivered)
+        assert delivered == [b"left over"]
+        outbox.close()
+
+
+class TestPublisherOutbox:
+    """Test EventPublisher falls back to the outbox."""
+
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
+    def test_outage_writes_outbox_and_replays(self, mock_blocking_connection, tmp_path):
+        """Test events published during an outage are delivered after recovery."""
+        connection = MagicMock()
+        connection.is_open = True
+        mock_blocking_connection.side_effect = AMQPConnectionError("down")
+
+        publisher = EventPublisher(
+            config=EventPublisherConfig(
+                rabbitmq_url="amqp://localhost",
+                retry_attempts=1,
+                outbox=OutboxConfig(path=str(tmp_path), replay_interval=0.01),
+            ),
+            organization_id_getter=lambda: "org_123",
+        )
+
+        assert publisher.publish("workout.created", WORKOUT) is True
+        assert publisher.publish("workout.updated", {**WORKOUT, "updated_by": "u"}) is True
+        assert publisher._outbox.pending == 2
+
+        mock_blocking_connection.side_effect = None
+        mock_blocking_connection.return_value = connection
+        wait_until(lambda: publisher._outbox.pending == 0)
+
+        calls = connection.channel().basic_publish.call_args_list
+        assert [c[1]["routing_key"] for c in calls] == ["workout.created", "workout.updated"]
+        assert calls[0][1]["properties"].content_type == "application/json"
+        publisher.close()
+
+    def test_validation_errors_are_not_stored(self, tmp_path):
+        """Test invalid events are rejected rather than written to the outbox."""
+        publisher = EventPublisher(
+            config=EventPublisherConfig(
+                rabbitmq_url="amqp://localhost", outbox=OutboxConfig(path=str(tmp_path))
+            ),
+            organization_id_getter=lambda: "org_123",
+        )
+        assert publisher.publish("workout.created", {"invalid": "data"}) is False
+        assert publisher._outbox.pending == 0
+        publisher.close()
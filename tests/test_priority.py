@@ -0,0 +1,143 @@
+"""Tests for priority lanes."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fitviz_events import BackgroundPublisher, BackgroundPublisherConfig, EventPublisher
+from fitviz_events.config import EventPublisherConfig
+from fitviz_events.priority import PriorityLanes
+from fitviz_events.rate_limit import FairQueue
+
+PRIORITIES = {"payment.failed": 9, "booking.confirmed": 5}
+PAYMENT_FAILED = {
+    "payment_id": "pay_1",
+    "user_id": "user_1",
+    "amount": "49.99",
+    "failure_reason": "declined",
+    "reference_type": "membership",
+    "reference_id": "mem_1",
+}
+
+
+def make_lanes(starvation_limit=10, **kwargs):
+    return PriorityLanes(lambda item: PRIORITIES.get(item[0], 0), starvation_limit, **kwargs)
+
+
+def drain(lanes):
+    items = []
+    while lanes:
+        items.append(lanes.popleft())
+    return items
+
+
+class TestPriorityLanes:
+    """Test lane scheduling."""
+
+    def test_higher_lanes_first(self):
+        """Test items are served highest priority first, FIFO within a lane."""
+        lanes = make_lanes()
+        for item in [
+            ("workout.updated", 1),
+            ("booking.confirmed", 1),
+            ("payment.failed", 1),
+            ("workout.updated", 2),
+            ("payment.failed", 2),
+        ]:
+            lanes.append(item)
+
+        assert drain(lanes) == [
+            ("payment.failed", 1),
+            ("payment.failed", 2),
+            ("booking.confirmed", 1),
+            ("workout.updated", 1),
+            ("workout.updated", 2),
+        ]
+        assert lanes.popleft() is None
+
+    def test_starvation_limit(self):
+        """Test a waiting low lane is served after being passed over enough times."""
+        lanes = make_lanes(starvation_limit=2)
+        lanes.append(("workout.updated", 0))
+        for i in range(5):
+            lanes.append(("payment.failed", i))
+
+        order = [event_type for event_type, _ in drain(lanes)]
+        assert order.index("workout.updated") == 2
+
+    def test_evict_from_lowest_lane(self):
+        """Test eviction drops the lowest-priority item first."""
+        lanes = make_lanes()
+        lanes.append(("payment.failed", 1))
+        lanes.append(("workout.updated", 1))
+        lanes.append(("workout.updated", 2))
+
+        assert lanes.evict() == ("workout.updated", 1)
+        assert len(lanes) == 2
+        assert lanes.depths() == {9: 1, 0: 1}
+
+    def test_fair_queue_lanes(self):
+        """Test lanes can be fair queues and skip lanes with nothing ready."""
+        lanes = make_lanes(lane_factory=lambda: FairQueue(key=lambda item: item[1]))
+        lanes.append(("payment.failed", "org_limited"))
+        lanes.append(("workout.updated", "org_free"))
+
+        assert lanes.popleft(ready=lambda org: org != "org_limited") == (
+            "workout.updated",
+            "org_free",
+        )
+        assert len(lanes) == 1
+
+    def test_invalid_starvation_limit(self):
+        """Test the starvation limit must be positive."""
+        with pytest.raises(ValueError):
+            make_lanes(starvation_limit=0)
+
+
+def test_background_publisher_drains_high_priority_first():
+    """Test queued critical events overtake queued low-priority events."""
+    release = threading.Event()
+    started = threading.Event()
+    published = []
+
+    inner = MagicMock()
+    inner._get_organization_id.return_value = "org_123"
+
+    def publish(event_type, data, organization_id=None):
+        started.set()
+        release.wait(5)
+        published.append(event_type)
+        return True
+
+    inner.publish.side_effect = publish
+    publisher = BackgroundPublisher(inner, BackgroundPublisherConfig(event_priorities=PRIORITIES))
+    publisher.publish("workout.updated", {})
+    assert started.wait(1)
+    for _ in range(2):
+        publisher.publish("workout.updated", {})
+    publisher.publish("payment.failed", {})
+
+    release.set()
+    assert publisher.flush(timeout=2)
+    assert published[:2] == ["workout.updated", "payment.failed"]
+    publisher.close()
+
+
+@patch("fitviz_events.publisher.pika.BlockingConnection")
+def test_amqp_priority_property(mock_blocking_connection):
+    """Test the configured priority is set on the AMQP message."""
+    connection = MagicMock()
+    connection.is_open = True
+    mock_blocking_connection.return_value = connection
+    publisher = EventPublisher(
+        config=EventPublisherConfig(rabbitmq_url="amqp://localhost", event_priorities=PRIORITIES),
+        organization_id_getter=lambda: "org_123",
+    )
+
+    publisher.publish("payment.failed", PAYMENT_FAILED)
+    publisher.publish("workout.deleted", {"workout_id": "w", "deleted_by": "u"})
+
+    calls = connection.channel().basic_publish.call_args_list
+    assert [c[1]["properties"].priority for c in calls] == [9, None]
+    publisher.close()
@@ -5,8 +5,8 @@ import json
 from unittest.mock import MagicMock, Mock, patch
 from uuid import uuid4
 
-import pytest
 import pika
+import pytest
 
 from fitviz_events import EventPublisher, EventPublisherConfig
 from fitviz_events.exceptions import EventValidationError
@@ -119,9 +119,7 @@ class TestValidateEvent:
             "created_by": "user_456",
         }
         event = publisher._validate_event("workout.created", data, mock_organization_id)
-        assert event is not None
-        assert event.event_type == "workout.created"
-        assert event.organization_id == mock_organization_id
+        assert event.model_dump(exclude_unset=True) == data
 
     def test_validate_booking_confirmed_event(self, publisher, mock_organization_id):
         """Test validating booking.confirmed event."""
@@ -134,7 +132,19 @@ class TestValidateEvent:
         }
         event = publisher._validate_event("booking.confirmed", data, mock_organization_id)
         assert event is not None
-        assert event.event_type == "booking.confirmed"
+        assert event.booking_id == "booking_123"
+        assert event.scheduled_time.isoformat() == "2025-01-15T10:00:00+00:00"
+
+    def test_validate_normalizes_coerced_values(self, publisher, mock_organization_id):
+        """Test validation returns values coerced by the schema."""
+        data = {
+            "workout_id": "123",
+            "title": "Morning Yoga",
+            "duration_minutes": "45",
+            "created_by": "user_456",
+        }
+        event = publisher._validate_event("workout.created", data, mock_organization_id)
+        assert event.duration_minutes == 45
 
     def test_validate_invalid_event_raises_error(self, publisher, mock_organization_id):
         """Test validating invalid event raises EventValidationError."""
@@ -163,7 +173,7 @@ class TestValidateEvent:
 class TestConnect:
     """Test connection management."""
 
-    @patch('fitviz_events.publisher.pika.BlockingConnection')
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
     def test_connect_success(self, mock_blocking_connection, publisher, mock_connection):
         """Test successful connection."""
         mock_blocking_connection.return_value = mock_connection
@@ -172,30 +182,31 @@ class TestConnect:
         assert publisher._connection is not None
         assert publisher._channel is not None
 
-    @patch('fitviz_events.publisher.pika.BlockingConnection')
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
     def test_connect_already_connected(self, mock_blocking_connection, publisher, mock_connection):
         """Test connecting when already connected."""
         mock_blocking_connection.return_value = mock_connection
         publisher._connect()
-        
+
         # Reset mock to verify it's not called again
         mock_blocking_connection.reset_mock()
         result = publisher._connect()
-        
+
         assert result is True
         mock_blocking_connection.assert_not_called()
 
-    @patch('fitviz_events.publisher.pika.BlockingConnection')
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
     def test_connect_failure_with_retry(self, mock_blocking_connection, publisher):
         """Test connection failure with retry."""
         from pika.exceptions import AMQPConnectionError
+
         mock_blocking_connection.side_effect = AMQPConnectionError("Connection failed")
-        
+
         result = publisher._connect()
         assert result is False
         assert mock_blocking_connection.call_count == publisher.config.retry_attempts
 
-    @patch('fitviz_events.publisher.pika.BlockingConnection')
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
     def test_connect_closed_publisher(self, mock_blocking_connection, publisher):
         """Test connecting with closed publisher."""
         publisher._is_closed = True
@@ -207,46 +218,50 @@ class TestConnect:
 class TestPublish:
     """Test event publishing."""
 
-    @patch('fitviz_events.publisher.pika.BlockingConnection')
-    def test_publish_success(self, mock_blocking_connection, publisher, mock_connection, mock_organization_id):
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
+    def test_publish_success(
+        self, mock_blocking_connection, publisher, mock_connection, mock_organization_id
+    ):
         """Test successful event publishing."""
         mock_blocking_connection.return_value = mock_connection
-        
+
         data = {
             "workout_id": "123",
             "title": "Morning Yoga",
             "created_by": "user_456",
         }
         result = publisher.publish("workout.created", data)
-        
+
         assert result is True
         mock_connection.channel().basic_publish.assert_called_once()
-        
+
         # Verify message content
         call_args = mock_connection.channel().basic_publish.call_args
-        assert call_args[1]['exchange'] == "test.events"
-        assert call_args[1]['routing_key'] == "workout.created"
-        
-        body = json.loads(call_args[1]['body'])
-        assert body['event_type'] == "workout.created"
-        assert body['organization_id'] == mock_organization_id
-        assert body['data'] == data
-
-    @patch('fitviz_events.publisher.pika.BlockingConnection')
-    def test_publish_with_explicit_organization_id(self, mock_blocking_connection, publisher, mock_connection):
+        assert call_args[1]["exchange"] == "test.events"
+        assert call_args[1]["routing_key"] == "workout.created"
+
+        body = json.loads(call_args[1]["body"])
+        assert body["event_type"] == "workout.created"
+        assert body["organization_id"] == mock_organization_id
+        assert body["data"] == data
+
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
+    def test_publish_with_explicit_organization_id(
+        self, mock_blocking_connection, publisher, mock_connection
+    ):
         """Test publishing with explicit organization ID."""
         mock_blocking_connection.return_value = mock_connection
-        
+
         org_id = uuid4()
         data = {"workout_id": "123", "title": "Test", "created_by": "user"}
         result = publisher.publish("workout.created", data, organization_id=org_id)
-        
+
         assert result is True
         call_args = mock_connection.channel().basic_publish.call_args
-        body = json.loads(call_args[1]['body'])
-        assert body['organization_id'] == str(org_id)
+        body = json.loads(call_args[1]["body"])
+        assert body["organization_id"] == str(org_id)
 
-    @patch('fitviz_events.publisher.pika.BlockingConnection')
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
     def test_publish_no_organization_id(self, mock_blocking_connection, publisher, rabbitmq_url):
         """Test publishing without organization ID returns False."""
         publisher_no_org = EventPublisher(rabbitmq_url=rabbitmq_url)
@@ -254,21 +269,22 @@ class TestPublish:
         result = publisher_no_org.publish("workout.created", data)
         assert result is False
 
-    @patch('fitviz_events.publisher.pika.BlockingConnection')
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
     def test_publish_connection_failure(self, mock_blocking_connection, publisher):
         """Test publishing when connection fails."""
         from pika.exceptions import AMQPConnectionError
+
         mock_blocking_connection.side_effect = AMQPConnectionError("Failed")
-        
+
         data = {"workout_id": "123", "title": "Test", "created_by": "user"}
         result = publisher.publish("workout.created", data)
         assert result is False
 
-    @patch('fitviz_events.publisher.pika.BlockingConnection')
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
     def test_publish_validation_error(self, mock_blocking_connection, publisher, mock_connection):
         """Test publishing with validation error returns False."""
         mock_blocking_connection.return_value = mock_connection
-        
+
         # Invalid data for workout.created
         data = {"invalid": "data"}
         result = publisher.publish("workout.created", data)
@@ -284,12 +300,14 @@ class TestPublish:
 class TestAsyncPublish:
     """Test async event publishing."""
 
-    @patch('fitviz_events.publisher.pika.BlockingConnection')
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
     @pytest.mark.asyncio
-    async def test_async_publish_success(self, mock_blocking_connection, publisher, mock_connection, mock_organization_id):
+    async def test_async_publish_success(
+        self, mock_blocking_connection, publisher, mock_connection, mock_organization_id
+    ):
         """Test async publishing."""
         mock_blocking_connection.return_value = mock_connection
-        
+
         data = {
             "workout_id": "123",
             "title": "Async Workout",
@@ -302,19 +320,20 @@ class TestAsyncPublish:
 class TestContextManager:
     """Test context manager functionality."""
 
-    @patch('fitviz_events.publisher.pika.BlockingConnection')
-    def test_context_manager(self, mock_blocking_connection, rabbitmq_url, organization_id_getter, mock_connection):
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
+    def test_context_manager(
+        self, mock_blocking_connection, rabbitmq_url, organization_id_getter, mock_connection
+    ):
         """Test using publisher as context manager."""
         mock_blocking_connection.return_value = mock_connection
-        
+
         with EventPublisher(
-            rabbitmq_url=rabbitmq_url,
-            organization_id_getter=organization_id_getter
+            rabbitmq_url=rabbitmq_url, organization_id_getter=organization_id_getter
         ) as publisher:
             data = {"workout_id": "123", "title": "Test", "created_by": "user"}
             result = publisher.publish("workout.created", data)
             assert result is True
-        
+
         # Verify publisher is closed after context
         assert publisher._is_closed is True
 
@@ -322,12 +341,12 @@ class TestContextManager:
 class TestClose:
     """Test publisher cleanup."""
 
-    @patch('fitviz_events.publisher.pika.BlockingConnection')
+    @patch("fitviz_events.publisher.pika.BlockingConnection")
     def test_close(self, mock_blocking_connection, publisher, mock_connection):
         """Test closing publisher."""
         mock_blocking_connection.return_value = mock_connection
         publisher._connect()
-        
+
         publisher.close()
         assert publisher._is_closed is True
         mock_connection.channel().close.assert_called_once()
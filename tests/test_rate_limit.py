@@ -0,0 +1,195 @@
+"""Tests for per-organization rate limiting and fair scheduling."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fitviz_events import (
+    BackgroundPublisher,
+    BackgroundPublisherConfig,
+    EventPublisher,
+    EventPublisherConfig,
+    RateLimitConfig,
+)
+from fitviz_events.rate_limit import FairQueue, TokenBucketLimiter
+
+WORKOUT = {"workout_id": "123", "title": "Morning Yoga", "created_by": "user_456"}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucketLimiter:
+    """Test token accounting."""
+
+    def test_burst_then_rate(self):
+        """Test a bucket allows a burst and then refills at the rate."""
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(RateLimitConfig(rate=2, burst=3), clock=clock)
+
+        assert [limiter.try_acquire("org_a") for _ in range(4)] == [True, True, True, False]
+        clock.now += 0.5
+        assert limiter.try_acquire("org_a") is True
+        assert limiter.try_acquire("org_a") is False
+
+    def test_organizations_are_independent(self):
+        """Test one organization's usage does not affect another's."""
+        limiter = TokenBucketLimiter(RateLimitConfig(rate=1, burst=1), clock=FakeClock())
+        assert limiter.try_acquire("org_a") is True
+        assert limiter.try_acquire("org_a") is False
+        assert limiter.try_acquire("org_b") is True
+
+    def test_idle_buckets_are_evicted(self):
+        """Test buckets are forgotten once idle, but not before they are full."""
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(RateLimitConfig(rate=1, burst=10, idle_ttl=1), clock=clock)
+        limiter.try_acquire("org_a")
+        limiter.try_acquire("org_b")
+
+        clock.now += 5
+        limiter.try_acquire("org_c")
+        assert len(limiter) == 3
+
+        clock.now += 6
+        limiter.try_acquire("org_c")
+        assert len(limiter) == 1
+
+    def test_invalid_config(self):
+        """Test out-of-range settings are rejected."""
+        with pytest.raises(ValueError):
+            RateLimitConfig(rate=0)
+        with pytest.raises(ValueError):
+            RateLimitConfig(rate=1, burst=0)
+
+
+class TestFairQueue:
+    """Test weighted round-robin scheduling."""
+
+    def make_queue(self, weights=None):
+        return FairQueue(key=lambda item: item[0], weights=weights)
+
+    def drain(self, queue, ready=None):
+        items = []
+        while True:
+            item = queue.popleft(ready)
+            if item is None:
+                return items
+            items.append(item)
+
+    def test_interleaves_keys(self):
+        """Test a large backlog from one key does not delay the others."""
+        queue = self.make_queue()
+        for i in range(3):
+            queue.append(("big", i))
+        queue.append(("small", 0))
+
+        assert self.drain(queue) == [("big", 0), ("small", 0), ("big", 1), ("big", 2)]
+        assert len(queue) == 0
+
+    def test_weights(self):
+        """Test a key with weight 2 gets two items per turn."""
+        queue = self.make_queue({"a": 2})
+        for i in range(4):
+            queue.append(("a", i))
+            queue.append(("b", i))
+
+        order = [key for key, _ in self.drain(queue)]
+        assert order[:6] == ["a", "a", "b", "a", "a", "b"]
+
+    def test_unready_keys_are_skipped(self):
+        """Test keys that are not ready keep their items for later."""
+        queue = self.make_queue()
+        queue.append(("limited", 0))
+        queue.append(("free", 0))
+        queue.append(("free", 1))
+
+        assert self.drain(queue, ready=lambda key: key != "limited") == [("free", 0), ("free", 1)]
+        assert queue.popleft() == ("limited", 0)
+
+    def test_evict_takes_from_largest_backlog(self):
+        """Test eviction removes the oldest item of the busiest key."""
+        queue = self.make_queue()
+        queue.append(("small", 0))
+        for i in range(3):
+            queue.append(("big", i))
+
+        assert queue.evict() == ("big", 0)
+        assert len(queue) == 3
+
+
+@patch("fitviz_events.publisher.pika.BlockingConnection")
+def test_publisher_rejects_over_limit(mock_blocking_connection):
+    """Test EventPublisher rejects events from organizations over their rate."""
+    connection = MagicMock()
+    connection.is_open = True
+    mock_blocking_connection.return_value = connection
+    publisher = EventPublisher(
+        config=EventPublisherConfig(
+            rabbitmq_url="amqp://localhost", rate_limit=RateLimitConfig(rate=0.001, burst=2)
+        ),
+    )
+
+    results = [
+        publisher.publish("workout.created", WORKOUT, organization_id="org_a") for _ in range(3)
+    ]
+    assert results == [True, True, False]
+    assert publisher.publish("workout.created", WORKOUT, organization_id="org_b") is True
+    publisher.close()
+
+
+class RecordingPublisher:
+    """Publisher double that records deliveries once ``release`` is set."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.published = []
+        self.close = MagicMock()
+
+    def _get_organization_id(self, organization_id=None):
+        return organization_id
+
+    def publish(self, event_type, data, organization_id=None):
+        self.release.wait(5)
+        self.published.append(organization_id)
+        return True
+
+
+def test_background_publisher_interleaves_organizations():
+    """Test a bulk import from one organization does not starve the others."""
+    inner = RecordingPublisher()
+    publisher = BackgroundPublisher(inner, BackgroundPublisherConfig(fair_queue=True))
+    publisher.publish("workout.created", WORKOUT, organization_id="org_bulk")
+    for _ in range(5):
+        publisher.publish("workout.created", WORKOUT, organization_id="org_bulk")
+    publisher.publish("workout.created", WORKOUT, organization_id="org_small")
+
+    inner.release.set()
+    assert publisher.flush(timeout=2)
+    assert inner.published.index("org_small") <= 2
+    publisher.close()
+
+
+def test_background_publisher_holds_back_limited_organization():
+    """Test rate-limited organizations wait while others are published."""
+    inner = RecordingPublisher()
+    inner.release.set()
+    publisher = BackgroundPublisher(
+        inner,
+        BackgroundPublisherConfig(rate_limit=RateLimitConfig(rate=20, burst=1)),
+    )
+    for _ in range(3):
+        publisher.publish("workout.created", WORKOUT, organization_id="org_bulk")
+    publisher.publish("workout.created", WORKOUT, organization_id="org_small")
+
+    assert publisher.flush(timeout=2)
+    assert inner.published[:2] == ["org_bulk", "org_small"]
+    assert inner.published.count("org_bulk") == 3
+    publisher.close()
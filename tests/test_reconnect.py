@@ -0,0 +1,218 @@
+"""Tests for background reconnection and fail-fast publishing."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from botocore.exceptions import ClientError
+from pika.exceptions import AMQPConnectionError
+
+from fitviz_events import (
+    EventPublisher,
+    EventPublisherConfig,
+    SNSEventPublisher,
+    SNSPublisherConfig,
+)
+from fitviz_events.reconnect import ReconnectSupervisor, backoff_delay
+from tests.conftest import wait_until
+
+WORKOUT = {"workout_id": "123", "title": "Morning Yoga", "created_by": "user_456"}
+
+
+def test_backoff_delay_is_capped_and_jittered():
+    """Test delays grow exponentially up to the cap and are randomized."""
+    assert all(0 <= backoff_delay(1, 0.5, 30) <= 0.5 for _ in range(100))
+    assert all(0 <= backoff_delay(4, 0.5, 30) <= 4.0 for _ in range(100))
+    assert all(0 <= backoff_delay(50, 0.5, 30) <= 30 for _ in range(100))
+    assert len({backoff_delay(10, 1, 30) for _ in range(20)}) > 1
+
+
+def test_supervisor_retries_until_connected():
+    """Test the supervisor keeps retrying in the background until success."""
+    attempts = []
+
+    def connect():
+        attempts.append(1)
+        return len(attempts) >= 3
+
+    supervisor = ReconnectSupervisor(connect, base_delay=0.001, max_delay=0.005)
+    supervisor.start()
+    supervisor.start()
+    wait_until(lambda: not supervisor.is_reconnecting)
+
+    assert len(attempts) == 3
+    supervisor.close()
+
+
+def test_supervisor_close_stops_retries():
+    """Test closing stops a supervisor that cannot connect."""
+    supervisor = ReconnectSupervisor(lambda: False, base_delay=0.001, max_delay=0.005)
+    supervisor.start()
+    supervisor.close(timeout=1)
+    assert not supervisor.is_reconnecting
+
+
+@patch("fitviz_events.publisher.pika.BlockingConnection")
+def test_publish_fails_fast_while_reconnecting(mock_blocking_connection):
+    """Test publishes during an outage fail fast instead of sleeping."""
+    mock_blocking_connection.side_effect = AMQPConnectionError("down")
+    publisher = EventPublisher(
+        config=EventPublisherConfig(
+            rabbitmq_url="amqp://localhost", retry_attempts=5, retry_delay=5.0
+        ),
+        organization_id_getter=lambda: "org_123",
+    )
+
+    with patch("fitviz_events.publisher.time.sleep") as sleep:
+        results = [publisher.publish("workout.created", WORKOUT) for _ in range(20)]
+    sleep.assert_not_called()
+
+    assert results == [False] * 20
+    assert mock_blocking_connection.call_count == 1
+    assert publisher._supervisor.is_reconnecting
+    publisher.close()
+
+
+@patch("fitviz_events.publisher.pika.BlockingConnection")
+def test_concurrent_publishes_do_not_queue_behind_a_connect(mock_blocking_connection):
+    """Test threads publishing during an outage do not wait for another thread's connect."""
+    attempts = []
+    connecting = threading.Event()
+    release = threading.Event()
+
+    def open_connection(params):
+        attempts.append(params)
+        connecting.set()
+        release.wait(5.0)
+        raise AMQPConnectionError("down")
+
+    mock_blocking_connection.side_effect = open_connection
+    publisher = EventPublisher(
+        config=EventPublisherConfig(
+            rabbitmq_url="amqp://localhost", retry_attempts=5, retry_delay=5.0
+        ),
+        organization_id_getter=lambda: "org_123",
+    )
+    results = []
+
+    def publish():
+        results.append(publisher.publish("workout.created", WORKOUT))
+
+    connector = threading.Thread(target=publish)
+    connector.start()
+    assert connecting.wait(2.0)
+
+    threads = [threading.Thread(target=publish) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        # The connect is still blocked, so these only finish if they did not wait for it
+        thread.join(2.0)
+        assert not thread.is_alive()
+    release.set()
+    connector.join()
+
+    assert results == [False] * 5
+    assert len(attempts) == 1
+    assert attempts[0].connection_attempts == 1
+    publisher.close()
+
+
+@patch("fitviz_events.publisher.pika.BlockingConnection")
+def test_supervisor_restores_connection(mock_blocking_connection):
+    """Test publishing resumes once the supervisor reconnects."""
+    connection = MagicMock()
+    connection.is_open = True
+    outage = threading.Event()
+    outage.set()
+
+    def open_connection(params):
+        if outage.is_set():
+            raise AMQPConnectionError("down")
+        return connection
+
+    mock_blocking_connection.side_effect = open_connection
+    publisher = EventPublisher(
+        config=EventPublisherConfig(
+            rabbitmq_url="amqp://localhost", retry_delay=0.001, max_backoff=0.01
+        ),
+        organization_id_getter=lambda: "org_123",
+    )
+
+    assert publisher.publish("workout.created", WORKOUT) is False
+    outage.clear()
+    wait_until(lambda: not publisher._supervisor.is_reconnecting)
+
+    assert publisher.publish("workout.created", WORKOUT) is True
+    publisher.close()
+
+
+def test_sns_fails_fast_after_outage():
+    """Test SNS publishes skip the API while backing off after an outage."""
+    with (
+        patch("fitviz_events.aws_clients.boto3.client") as mock_client,
+        patch("fitviz_events.sns_publisher.backoff_delay", lambda attempt, base, cap: cap),
+    ):
+        client = MagicMock()
+        client.publish.side_effect = ClientError(
+            {"Error": {"Code": "ServiceUnavailable", "Message": "down"}}, "publish"
+        )
+        mock_client.return_value = client
+        publisher = SNSEventPublisher(
+            config=SNSPublisherConfig(
+                topic_arn="arn:aws:sns:us-east-2:1:t",
+                retry_attempts=2,
+                retry_delay=0.001,
+                max_backoff=60,
+            ),
+            organization_id_getter=lambda: "org_123",
+        )
+
+        assert publisher.publish("workout.created", WORKOUT) is False
+        assert client.publish.call_count == 1
+        assert publisher.publish("workout.created", WORKOUT) is False
+        assert client.publish.call_count == 1
+
+        publisher._unavailable_until = 0.0
+        client.publish.side_effect = None
+        client.publish.return_value = {"MessageId": "m1"}
+        assert publisher.publish("workout.created", WORKOUT) is True
+        assert publisher._outages == 0
+
+
+def test_sns_bad_request_does_not_back_off():
+    """Test rejected requests do not make other publishes fail fast."""
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+        client = MagicMock()
+        client.publish.side_effect = ClientError(
+            {"Error": {"Code": "InvalidParameter", "Message": "bad"}}, "publish"
+        )
+        mock_client.return_value = client
+        publisher = SNSEventPublisher(
+            config=SNSPublisherConfig(topic_arn="arn:aws:sns:us-east-2:1:t", retry_attempts=1),
+            organization_id_getter=lambda: "org_123",
+        )
+
+        assert publisher.publish("workout.created", WORKOUT) is False
+        assert not publisher._is_backing_off()
+
+
+def test_sns_batch_stops_at_an_outage():
+    """Test publish_many stops sending when SNS is unavailable rather than sleeping to retry."""
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+        client = MagicMock()
+        client.publish_batch.side_effect = ClientError(
+            {"Error": {"Code": "ServiceUnavailable", "Message": "down"}}, "publish_batch"
+        )
+        mock_client.return_value = client
+        publisher = SNSEventPublisher(
+            config=SNSPublisherConfig(topic_arn="arn:aws:sns:us-east-2:1:t", retry_attempts=3),
+            organization_id_getter=lambda: "org_123",
+        )
+
+        with patch("fitviz_events.sns_publisher.time.sleep") as sleep:
+            results = publisher.publish_many([("workout.created", WORKOUT)] * 12)
+
+        assert results == [False] * 12
+        assert client.publish_batch.call_count == 1
+        sleep.assert_not_called()
+        assert publisher._is_backing_off()
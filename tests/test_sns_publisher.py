@@ -9,7 +9,9 @@ import pytest
 from botocore.exceptions import ClientError
 
 from fitviz_events import SNSEventPublisher, SNSPublisherConfig
+from fitviz_events.config import OutboxConfig
 from fitviz_events.exceptions import EventValidationError
+from fitviz_events.sns_publisher import chunk_entries
 
 
 @pytest.fixture
@@ -35,7 +37,7 @@ def organization_id():
 @pytest.fixture
 def mock_sns_client():
     """Create mock SNS client."""
-    with patch("fitviz_events.sns_publisher.boto3.client") as mock_client:
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
         client_instance = MagicMock()
         client_instance.publish.return_value = {"MessageId": "test-message-id-123"}
         mock_client.return_value = client_instance
@@ -113,9 +115,7 @@ def test_get_organization_id_from_parameter(sns_config):
 def test_get_organization_id_from_getter(sns_config):
     """Test organization ID retrieved from getter function."""
     org_id = uuid4()
-    publisher = SNSEventPublisher(
-        config=sns_config, organization_id_getter=lambda: org_id
-    )
+    publisher = SNSEventPublisher(config=sns_config, organization_id_getter=lambda: org_id)
 
     result = publisher._get_organization_id()
 
@@ -127,9 +127,7 @@ def test_get_organization_id_parameter_overrides_getter(sns_config):
     getter_org_id = uuid4()
     param_org_id = uuid4()
 
-    publisher = SNSEventPublisher(
-        config=sns_config, organization_id_getter=lambda: getter_org_id
-    )
+    publisher = SNSEventPublisher(config=sns_config, organization_id_getter=lambda: getter_org_id)
 
     result = publisher._get_organization_id(organization_id=param_org_id)
 
@@ -138,9 +136,7 @@ def test_get_organization_id_parameter_overrides_getter(sns_config):
 
 def test_publish_success(sns_config, organization_id, mock_sns_client):
     """Test successful event publish to SNS."""
-    publisher = SNSEventPublisher(
-        config=sns_config, organization_id_getter=lambda: organization_id
-    )
+    publisher = SNSEventPublisher(config=sns_config, organization_id_getter=lambda: organization_id)
 
     success = publisher.publish(
         event_type="workout.created",
@@ -168,9 +164,7 @@ def test_publish_success(sns_config, organization_id, mock_sns_client):
 
 def test_publish_with_message_attributes(sns_config, organization_id, mock_sns_client):
     """Test SNS message attributes are set correctly."""
-    publisher = SNSEventPublisher(
-        config=sns_config, organization_id_getter=lambda: organization_id
-    )
+    publisher = SNSEventPublisher(config=sns_config, organization_id_getter=lambda: organization_id)
 
     publisher.publish(
         event_type="booking.confirmed",
@@ -208,9 +202,7 @@ def test_publish_without_organization_id(sns_config, mock_sns_client):
 def test_publish_validation_disabled(sns_config, organization_id, mock_sns_client):
     """Test publish works with validation disabled."""
     sns_config.enable_validation = False
-    publisher = SNSEventPublisher(
-        config=sns_config, organization_id_getter=lambda: organization_id
-    )
+    publisher = SNSEventPublisher(config=sns_config, organization_id_getter=lambda: organization_id)
 
     success = publisher.publish(
         event_type="custom.event",
@@ -223,9 +215,7 @@ def test_publish_validation_disabled(sns_config, organization_id, mock_sns_clien
 
 def test_publish_invalid_event_data(sns_config, organization_id, mock_sns_client):
     """Test publish fails with invalid event data when validation enabled."""
-    publisher = SNSEventPublisher(
-        config=sns_config, organization_id_getter=lambda: organization_id
-    )
+    publisher = SNSEventPublisher(config=sns_config, organization_id_getter=lambda: organization_id)
 
     success = publisher.publish(
         event_type="workout.created",
@@ -236,9 +226,9 @@ def test_publish_invalid_event_data(sns_config, organization_id, mock_sns_client
     mock_sns_client.publish.assert_not_called()
 
 
-def test_publish_sns_client_error_with_retry(sns_config, organization_id):
-    """Test publish retries on SNS client error."""
-    with patch("fitviz_events.sns_publisher.boto3.client") as mock_client:
+def test_publish_sns_client_error_fails_fast(sns_config, organization_id):
+    """Test publish does not retry while SNS is unavailable."""
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
         client_instance = MagicMock()
         client_instance.publish.side_effect = ClientError(
             {"Error": {"Code": "ServiceUnavailable", "Message": "Service unavailable"}},
@@ -260,12 +250,12 @@ def test_publish_sns_client_error_with_retry(sns_config, organization_id):
         )
 
         assert success is False
-        assert client_instance.publish.call_count == sns_config.retry_attempts
+        assert client_instance.publish.call_count == 1
 
 
 def test_publish_sns_client_error_eventual_success(sns_config, organization_id):
-    """Test publish succeeds after retry."""
-    with patch("fitviz_events.sns_publisher.boto3.client") as mock_client:
+    """Test publishing resumes once the fail-fast backoff expires."""
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
         client_instance = MagicMock()
         client_instance.publish.side_effect = [
             ClientError(
@@ -285,14 +275,11 @@ def test_publish_sns_client_error_eventual_success(sns_config, organization_id):
             config=sns_config, organization_id_getter=lambda: organization_id
         )
 
-        success = publisher.publish(
-            event_type="workout.created",
-            data={
-                "workout_id": "123",
-                "title": "Test",
-                "created_by": "user_456",
-            },
-        )
+        data = {"workout_id": "123", "title": "Test", "created_by": "user_456"}
+        assert publisher.publish(event_type="workout.created", data=data) is False
+
+        publisher._unavailable_until = 0.0
+        success = publisher.publish(event_type="workout.created", data=data)
 
         assert success is True
         assert client_instance.publish.call_count == 2
@@ -300,9 +287,7 @@ def test_publish_sns_client_error_eventual_success(sns_config, organization_id):
 
 def test_publish_when_closed(sns_config, organization_id, mock_sns_client):
     """Test publish fails when publisher is closed."""
-    publisher = SNSEventPublisher(
-        config=sns_config, organization_id_getter=lambda: organization_id
-    )
+    publisher = SNSEventPublisher(config=sns_config, organization_id_getter=lambda: organization_id)
 
     publisher.close()
 
@@ -337,9 +322,7 @@ def test_context_manager(sns_config, organization_id, mock_sns_client):
 @pytest.mark.asyncio
 async def test_async_publish(sns_config, organization_id, mock_sns_client):
     """Test async publish method."""
-    publisher = SNSEventPublisher(
-        config=sns_config, organization_id_getter=lambda: organization_id
-    )
+    publisher = SNSEventPublisher(config=sns_config, organization_id_getter=lambda: organization_id)
 
     success = await publisher.async_publish(
         event_type="workout.created",
@@ -356,9 +339,7 @@ async def test_async_publish(sns_config, organization_id, mock_sns_client):
 
 def test_validate_event_unknown_type(sns_config, organization_id):
     """Test validation logs warning for unknown event type."""
-    publisher = SNSEventPublisher(
-        config=sns_config, organization_id_getter=lambda: organization_id
-    )
+    publisher = SNSEventPublisher(config=sns_config, organization_id_getter=lambda: organization_id)
 
     result = publisher._validate_event(
         event_type="unknown.event",
@@ -373,9 +354,7 @@ def test_thread_safety(sns_config, organization_id, mock_sns_client):
     """Test publisher is thread-safe."""
     import threading
 
-    publisher = SNSEventPublisher(
-        config=sns_config, organization_id_getter=lambda: organization_id
-    )
+    publisher = SNSEventPublisher(config=sns_config, organization_id_getter=lambda: organization_id)
 
     results = []
 
@@ -400,3 +379,335 @@ def test_thread_safety(sns_config, organization_id, mock_sns_client):
 
     assert all(results)
     assert mock_sns_client.publish.call_count == 10
+
+
+def make_batch_client(mock_client, fail_first=()):
+    """Configure a mock SNS client whose publish_batch succeeds except for ``fail_first``."""
+    client_instance = MagicMock()
+    failed_once = set()
+
+    def publish_batch(TopicArn, PublishBatchRequestEntries):
+        successful, failed = [], []
+        for entry in PublishBatchRequestEntries:
+            if entry["Id"] in fail_first and entry["Id"] not in failed_once:
+                failed_once.add(entry["Id"])
+                failed.append({"Id": entry["Id"], "Code": "InternalError", "SenderFault": False})
+            else:
+                successful.append({"Id": entry["Id"], "MessageId": f"msg-{entry['Id']}"})
+        return {"Successful": successful, "Failed": failed}
+
+    client_instance.publish_batch.side_effect = publish_batch
+    mock_client.return_value = client_instance
+    return client_instance
+
+
+def workout_event(index):
+    """Build a valid workout.created event tuple."""
+    return (
+        "workout.created",
+        {"workout_id": f"workout_{index}", "title": f"Test {index}", "created_by": "user_456"},
+    )
+
+
+def test_chunk_entries_respects_entry_count():
+    """Test entries are grouped into chunks of at most 10."""
+    entries = [{"Message": "x", "MessageAttributes": {}} for _ in range(25)]
+
+    chunks = chunk_entries(entries)
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert sum(chunks, []) == list(range(25))
+
+
+def test_chunk_entries_respects_payload_limit():
+    """Test chunks stay within the 256 KB total payload limit."""
+    entries = [{"Message": "x" * 100 * 1024, "MessageAttributes": {}} for _ in range(5)]
+
+    chunks = chunk_entries(entries)
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+def test_publish_many_uses_publish_batch(sns_config, organization_id):
+    """Test publish_many sends events in PublishBatch calls of up to 10."""
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+        client_instance = make_batch_client(mock_client)
+        publisher = SNSEventPublisher(
+            config=sns_config, organization_id_getter=lambda: organization_id
+        )
+
+        results = publisher.publish_many([workout_event(i) for i in range(23)])
+
+        assert results == [True] * 23
+        assert client_instance.publish_batch.call_count == 3
+        client_instance.publish.assert_not_called()
+
+        entries = client_instance.publish_batch.call_args_list[0][1]["PublishBatchRequestEntries"]
+        message_body = json.loads(entries[0]["Message"])
+        assert message_body["organization_id"] == str(organization_id)
+        assert entries[0]["MessageAttributes"]["event_type"]["StringValue"] == "workout.created"
+
+
+def test_publish_many_retries_failed_entries_individually(sns_config, organization_id):
+    """Test only the failed entries are resent."""
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+        client_instance = make_batch_client(mock_client, fail_first={"3"})
+        publisher = SNSEventPublisher(
+            config=sns_config, organization_id_getter=lambda: organization_id
+        )
+
+        results = publisher.publish_many([workout_event(i) for i in range(5)])
+
+        assert results == [True] * 5
+        assert client_instance.publish_batch.call_count == 2
+        retried = client_instance.publish_batch.call_args_list[1][1]["PublishBatchRequestEntries"]
+        assert [entry["Id"] for entry in retried] == ["3"]
+
+
+def test_publish_many_does_not_retry_sender_fault(sns_config, organization_id):
+    """Test entries rejected as sender faults fail without retrying."""
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+        client_instance = MagicMock()
+        client_instance.publish_batch.return_value = {
+            "Successful": [{"Id": "0", "MessageId": "msg-0"}],
+            "Failed": [{"Id": "1", "Code": "InvalidParameter", "SenderFault": True}],
+        }
+        mock_client.return_value = client_instance
+        publisher = SNSEventPublisher(
+            config=sns_config, organization_id_getter=lambda: organization_id
+        )
+
+        results = publisher.publish_many([workout_event(0), workout_event(1)])
+
+        assert results == [True, False]
+        assert client_instance.publish_batch.call_count == 1
+
+
+def test_publish_many_skips_invalid_events(sns_config, organization_id):
+    """Test invalid events fail without blocking the rest of the batch."""
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+        client_instance = make_batch_client(mock_client)
+        publisher = SNSEventPublisher(
+            config=sns_config, organization_id_getter=lambda: organization_id
+        )
+
+        results = publisher.publish_many(
+            [workout_event(0), ("workout.created", {"invalid": "data"}), workout_event(2)]
+        )
+
+        assert results == [True, False, True]
+        entries = client_instance.publish_batch.call_args[1]["PublishBatchRequestEntries"]
+        assert len(entries) == 2
+
+
+def test_micro_batching_groups_concurrent_publishes(sns_config, organization_id):
+    """Test batch_linger groups concurrent publish calls into PublishBatch calls."""
+    import threading
+
+    sns_config.batch_linger = 0.05
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+        client_instance = make_batch_client(mock_client)
+        publisher = SNSEventPublisher(
+            config=sns_config, organization_id_getter=lambda: organization_id
+        )
+
+        results = []
+
+        def publish_event(index):
+            results.append(publisher.publish(*workout_event(index)))
+
+        threads = [threading.Thread(target=publish_event, args=(i,)) for i in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        publisher.close()
+
+        assert results == [True] * 10
+        client_instance.publish.assert_not_called()
+        assert client_instance.publish_batch.call_count < 10
+
+
+@pytest.fixture
+def fifo_config(sns_config):
+    """SNS config for a FIFO topic."""
+    sns_config.topic_arn = "arn:aws:sns:us-east-2:123456789:test-topic.fifo"
+    return sns_config
+
+
+def test_fifo_publish_sets_group_and_deduplication_id(
+    fifo_config, organization_id, mock_sns_client
+):
+    """Test FIFO publishes are grouped by organization and deduplicated by event ID."""
+    publisher = SNSEventPublisher(
+        config=fifo_config, organization_id_getter=lambda: organization_id
+    )
+
+    assert publisher.publish(*workout_event(0)) is True
+
+    call_kwargs = mock_sns_client.publish.call_args[1]
+    body = json.loads(call_kwargs["Message"])
+    assert call_kwargs["MessageGroupId"] == str(organization_id)
+    assert call_kwargs["MessageDeduplicationId"] == body["event_id"]
+
+
+def test_fifo_message_group_field(fifo_config, organization_id, mock_sns_client):
+    """Test a configured data field is used as the message group."""
+    fifo_config.message_group_field = "workout_id"
+    publisher = SNSEventPublisher(
+        config=fifo_config, organization_id_getter=lambda: organization_id
+    )
+
+    publisher.publish(*workout_event(7))
+
+    assert mock_sns_client.publish.call_args[1]["MessageGroupId"] == "workout_7"
+
+
+def test_standard_topic_has_no_fifo_fields(sns_config, organization_id, mock_sns_client):
+    """Test standard topics are published without FIFO fields."""
+    publisher = SNSEventPublisher(config=sns_config, organization_id_getter=lambda: organization_id)
+
+    publisher.publish(*workout_event(0))
+
+    assert "MessageGroupId" not in mock_sns_client.publish.call_args[1]
+
+
+def test_fifo_publish_many_keeps_group_order_on_retry(fifo_config, organization_id):
+    """Test later entries of a group with a failed entry wait for its retry."""
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+        client_instance = make_batch_client(mock_client, fail_first={"3"})
+        publisher = SNSEventPublisher(
+            config=fifo_config, organization_id_getter=lambda: organization_id
+        )
+
+        results = publisher.publish_many([workout_event(i) for i in range(13)])
+
+        assert results == [True] * 13
+        calls = client_instance.publish_batch.call_args_list
+        first = calls[0][1]["PublishBatchRequestEntries"]
+        assert {entry["MessageGroupId"] for entry in first} == {str(organization_id)}
+        assert len({entry["MessageDeduplicationId"] for entry in first}) == 10
+        retried = [entry["Id"] for entry in calls[-1][1]["PublishBatchRequestEntries"]]
+        assert retried == ["3", "10", "11", "12"]
+
+
+def test_standard_publish_many_does_not_hold_back_entries(sns_config, organization_id):
+    """Test a failed entry on a standard topic does not delay later entries."""
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+        client_instance = make_batch_client(mock_client, fail_first={"3"})
+        publisher = SNSEventPublisher(
+            config=sns_config, organization_id_getter=lambda: organization_id
+        )
+
+        assert publisher.publish_many([workout_event(i) for i in range(13)]) == [True] * 13
+        retried = client_instance.publish_batch.call_args[1]["PublishBatchRequestEntries"]
+        assert [entry["Id"] for entry in retried] == ["3"]
+
+
+def test_fifo_fields_survive_outbox_replay(fifo_config, organization_id, mock_sns_client):
+    """Test outbox records keep the group and deduplication ID for replay."""
+    from fitviz_events.outbox import OutboxRecord
+
+    publisher = SNSEventPublisher(
+        config=fifo_config, organization_id_getter=lambda: organization_id
+    )
+    entry = publisher._build_entry(*workout_event(0), str(organization_id), None)
+    headers = publisher._entry_headers(entry)
+
+    assert publisher._replay(OutboxRecord(0, "workout.created", entry["Message"].encode(), headers))
+
+    call_kwargs = mock_sns_client.publish.call_args[1]
+    assert call_kwargs["MessageGroupId"] == entry["MessageGroupId"]
+    assert call_kwargs["MessageDeduplicationId"] == entry["MessageDeduplicationId"]
+    assert set(call_kwargs["MessageAttributes"]) == set(entry["MessageAttributes"])
+
+
+def test_publish_many_encoded_sends_envelopes_unchanged(sns_config, organization_id):
+    """Test pre-encoded envelopes are batched as they are, keeping their event IDs."""
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+        client_instance = make_batch_client(mock_client)
+        publisher = SNSEventPublisher(config=sns_config)
+        bodies = [
+            publisher.codec.encode_event(*workout_event(i), str(organization_id), event_id=str(i))
+            for i in range(3)
+        ]
+
+        results = publisher.publish_many_encoded(
+            ("workout.created", body, organization_id) for body in bodies
+        )
+
+        assert results == [True] * 3
+        entries = client_instance.publish_batch.call_args[1]["PublishBatchRequestEntries"]
+        assert [json.loads(entry["Message"])["event_id"] for entry in entries] == ["0", "1", "2"]
+
+
+def test_publish_many_outage_writes_outbox(sns_config, organization_id, tmp_path):
+    """Test batch entries that fail during an outage are stored, and later ones queue behind."""
+    unavailable = ClientError({"Error": {"Code": "ServiceUnavailable", "Message": "down"}}, "x")
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+        client_instance = MagicMock()
+        client_instance.publish_batch.side_effect = unavailable
+        client_instance.publish.side_effect = unavailable
+        mock_client.return_value = client_instance
+        sns_config.retry_attempts = 1
+        sns_config.outbox = OutboxConfig(path=str(tmp_path), replay_interval=60)
+        publisher = SNSEventPublisher(
+            config=sns_config, organization_id_getter=lambda: organization_id
+        )
+
+        assert publisher.publish_many([workout_event(i) for i in range(2)]) == [True, True]
+        assert publisher.publish_many([workout_event(i) for i in range(2, 4)]) == [True, True]
+
+        assert client_instance.publish_batch.call_count == 1
+        records = publisher._outbox._log.read(10)
+        workout_ids = [json.loads(record.body)["data"]["workout_id"] for record in records]
+        assert workout_ids == [f"workout_{i}" for i in range(4)]
+        publisher.close()
+
+
+def test_fifo_publish_encoded_reads_event_id(fifo_config, organization_id, mock_sns_client):
+    """Test pre-encoded envelopes are deduplicated by their own event ID."""
+    publisher = SNSEventPublisher(config=fifo_config)
+    body = publisher.codec.encode_event(
+        "workout.created", workout_event(0)[1], str(organization_id), event_id="evt-1"
+    )
+
+    assert publisher.publish_encoded("workout.created", body, organization_id=organization_id)
+    assert mock_sns_client.publish.call_args[1]["MessageDeduplicationId"] == "evt-1"
+
+
+def test_sns_publisher_config_to_botocore():
+    """Test connection pool and timeout settings are passed to botocore."""
+    config = SNSPublisherConfig(topic_arn="arn:aws:sns:us-east-2:123456789:test")
+
+    assert config.to_botocore_config() == {
+        "max_pool_connections": 50,
+        "connect_timeout": 5.0,
+        "read_timeout": 10.0,
+        "tcp_keepalive": True,
+    }
+    with pytest.raises(ValueError, match="max_pool_connections"):
+        SNSPublisherConfig(topic_arn=config.topic_arn, max_pool_connections=0)
+
+
+def test_publishers_share_a_client(sns_config):
+    """Test publishers with the same settings share one SNS client."""
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+        first = SNSEventPublisher(config=sns_config)
+        second = SNSEventPublisher(config=sns_config)
+
+        assert first._get_sns_client() is second._get_sns_client()
+        mock_client.assert_called_once()
+        assert mock_client.call_args[1]["config"].max_pool_connections == 50
+
+
+def test_warmup_creates_client_before_first_publish(sns_config, organization_id):
+    """Test warmup builds the client so the first publish does not."""
+    publisher = SNSEventPublisher(config=sns_config, organization_id_getter=lambda: organization_id)
+
+    with patch("fitviz_events.aws_clients.boto3.client") as mock_client:
+        assert publisher.warmup() is True
+        mock_client.assert_called_once()
+
+        assert publisher.publish(*workout_event(0)) is True
+        mock_client.assert_called_once()
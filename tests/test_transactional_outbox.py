@@ -0,0 +1,211 @@
+"""Tests for the transactional outbox and relay."""
+
+import json
+import sqlite3
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fitviz_events import (
+    OutboxRelay,
+    TransactionalOutbox,
+    TransactionalOutboxConfig,
+    get_codec,
+)
+from fitviz_events.exceptions import EventPublishError, EventValidationError
+
+PAYMENT = {
+    "payment_id": "pay_1",
+    "user_id": "user_1",
+    "amount": "49.99",
+    "currency": "USD",
+    "payment_method": "card",
+    "reference_type": "membership",
+    "reference_id": "mem_1",
+}
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path of a SQLite database with the outbox table."""
+    path = str(tmp_path / "app.db")
+    connection = sqlite3.connect(path)
+    TransactionalOutbox().create_table(connection)
+    connection.close()
+    return path
+
+
+@pytest.fixture
+def outbox():
+    """TransactionalOutbox with a fixed organization."""
+    return TransactionalOutbox(
+        TransactionalOutboxConfig(batch_size=2, poll_interval=0.01),
+        organization_id_getter=lambda: "org_123",
+    )
+
+
+def count_rows(db_path):
+    connection = sqlite3.connect(db_path)
+    try:
+        return connection.execute("SELECT COUNT(*) FROM fitviz_event_outbox").fetchone()[0]
+    finally:
+        connection.close()
+
+
+class TestTransactionalOutbox:
+    """Test writing events inside the caller's transaction."""
+
+    def test_commit_stores_event(self, db_path, outbox):
+        """Test an event added in a committed transaction is stored."""
+        connection = sqlite3.connect(db_path)
+        with connection:
+            outbox.add(connection, "payment.completed", PAYMENT)
+
+        rows = outbox.fetch(connection, 10)
+        assert len(rows) == 1
+        _, event_type, org_id, envelope = rows[0]
+        assert (event_type, org_id) == ("payment.completed", "org_123")
+        envelope = json.loads(envelope)
+        assert envelope["event_id"] and envelope["timestamp"]
+        assert envelope["organization_id"] == "org_123"
+        assert envelope["data"]["payment_id"] == "pay_1"
+        assert envelope["data"]["amount"] == 49.99
+
+    def test_rollback_discards_event(self, db_path, outbox):
+        """Test an event added in a rolled-back transaction is not stored."""
+        connection = sqlite3.connect(db_path)
+        with pytest.raises(RuntimeError):
+            with connection:
+                outbox.add(connection, "payment.completed", PAYMENT)
+                raise RuntimeError("business logic failed")
+
+        assert count_rows(db_path) == 0
+
+    def test_invalid_event_raises(self, db_path, outbox):
+        """Test invalid events raise so the caller can roll back."""
+        connection = sqlite3.connect(db_path)
+        with pytest.raises(EventValidationError):
+            outbox.add(connection, "payment.completed", {"invalid": "data"})
+
+    def test_missing_organization_raises(self, db_path):
+        """Test events without an organization ID are rejected."""
+        connection = sqlite3.connect(db_path)
+        with pytest.raises(EventPublishError):
+            TransactionalOutbox().add(connection, "payment.completed", PAYMENT)
+
+    def test_invalid_table_name(self):
+        """Test table names are restricted to identifiers."""
+        with pytest.raises(ValueError):
+            TransactionalOutbox(TransactionalOutboxConfig(table_name="x; DROP TABLE y"))
+
+
+class TestOutboxRelay:
+    """Test relaying stored events."""
+
+    def add_payments(self, db_path, outbox, count):
+        connection = sqlite3.connect(db_path)
+        with connection:
+            for i in range(count):
+                outbox.add(connection, "payment.completed", {**PAYMENT, "payment_id": f"pay_{i}"})
+        connection.close()
+
+    def test_relay_publishes_in_batches_and_deletes(self, db_path, outbox):
+        """Test each pass publishes up to batch_size rows in id order."""
+        self.add_payments(db_path, outbox, 3)
+        publisher = MagicMock(spec=["publish"])
+        publisher.publish.return_value = True
+        relay = OutboxRelay(outbox, lambda: sqlite3.connect(db_path), publisher)
+
+        assert relay.relay_once() == (2, 0)
+        assert relay.relay_once() == (1, 0)
+        assert relay.relay_once() == (0, 0)
+        relay.close()
+
+        payment_ids = [c[0][1]["payment_id"] for c in publisher.publish.call_args_list]
+        assert payment_ids == ["pay_0", "pay_1", "pay_2"]
+        assert publisher.publish.call_args[1] == {"organization_id": "org_123"}
+        assert count_rows(db_path) == 0
+
+    def test_resent_rows_keep_their_event_id(self, db_path, outbox):
+        """Test a row published again after a failed delete carries the same envelope."""
+        self.add_payments(db_path, outbox, 1)
+        publisher = MagicMock(spec=["publish_encoded", "codec"])
+        publisher.codec = get_codec()
+        publisher.publish_encoded.return_value = True
+        relay = OutboxRelay(outbox, lambda: sqlite3.connect(db_path), publisher)
+        with patch.object(outbox, "delete", side_effect=sqlite3.OperationalError("crash")):
+            with pytest.raises(sqlite3.OperationalError):
+                relay.relay_once()
+        assert relay.relay_once() == (1, 0)
+        relay.close()
+
+        first, second = [c[0][1] for c in publisher.publish_encoded.call_args_list]
+        assert first == second
+        assert json.loads(first)["data"]["payment_id"] == "pay_0"
+
+    def test_failed_organization_stays_in_order(self, db_path):
+        """Test an organization's rows after a failure wait, while other organizations proceed."""
+        connection = sqlite3.connect(db_path)
+        outbox = TransactionalOutbox(TransactionalOutboxConfig(batch_size=10))
+        with connection:
+            for i, org_id in enumerate(["org_a", "org_a", "org_b", "org_a"]):
+                payment = {**PAYMENT, "payment_id": f"pay_{i}"}
+                outbox.add(connection, "payment.completed", payment, organization_id=org_id)
+        connection.close()
+
+        publisher = MagicMock(spec=["publish"])
+        publisher.publish.side_effect = [False, True]
+        relay = OutboxRelay(outbox, lambda: sqlite3.connect(db_path), publisher)
+
+        assert relay.relay_once() == (1, 3)
+        relay.close()
+
+        calls = publisher.publish.call_args_list
+        sent = [(c[0][1]["payment_id"], c[1]["organization_id"]) for c in calls]
+        assert sent == [("pay_0", "org_a"), ("pay_2", "org_b")]
+        assert count_rows(db_path) == 3
+
+    def test_batched_publisher_keeps_organizations_in_order(self, db_path):
+        """Test publish_many_encoded gets one row per organization per call, re-encoded once."""
+        connection = sqlite3.connect(db_path)
+        outbox = TransactionalOutbox(TransactionalOutboxConfig(batch_size=10))
+        with connection:
+            for i, org_id in enumerate(["org_a", "org_a", "org_b", "org_a", "org_b"]):
+                payment = {**PAYMENT, "payment_id": f"pay_{i}"}
+                outbox.add(connection, "payment.completed", payment, organization_id=org_id)
+        connection.close()
+
+        publisher = MagicMock(spec=["publish_encoded", "publish_many_encoded", "codec"])
+        publisher.codec = MagicMock(content_type="application/x-test")
+        publisher.codec.encode.side_effect = lambda payload: payload["data"]["payment_id"]
+        publisher.publish_many_encoded.side_effect = [[True, True], [False, True]]
+        relay = OutboxRelay(outbox, lambda: sqlite3.connect(db_path), publisher)
+
+        assert relay.relay_once() == (3, 2)
+        relay.close()
+
+        calls = [c[0][0] for c in publisher.publish_many_encoded.call_args_list]
+        assert [[(body, org_id) for _, body, org_id in events] for events in calls] == [
+            [("pay_0", "org_a"), ("pay_2", "org_b")],
+            [("pay_1", "org_a"), ("pay_4", "org_b")],
+        ]
+        assert publisher.codec.encode.call_count == 5
+        publisher.publish_encoded.assert_not_called()
+        assert count_rows(db_path) == 2
+
+    def test_background_relay(self, db_path, outbox):
+        """Test the relay thread drains the table."""
+        self.add_payments(db_path, outbox, 5)
+        publisher = MagicMock(spec=["publish"])
+        publisher.publish.return_value = True
+        relay = OutboxRelay(outbox, lambda: sqlite3.connect(db_path), publisher)
+
+        relay.start()
+        deadline = time.monotonic() + 2
+        while count_rows(db_path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        relay.close(timeout=1)
+
+        assert count_rows(db_path) == 0
+        assert publisher.publish.call_count == 5
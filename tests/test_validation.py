@@ -0,0 +1,72 @@
+"""Tests for compiled event data validators."""
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from fitviz_events.events import EVENT_TYPE_MAP, BaseEvent
+from fitviz_events.validation import get_data_validator, validate_event_data
+
+
+def test_validator_is_cached():
+    """Test each event type's validator is compiled once and reused."""
+    assert get_data_validator("workout.created") is get_data_validator("workout.created")
+
+
+def test_unknown_event_type_has_no_validator():
+    """Test event types without a schema return None."""
+    assert get_data_validator("unknown.event") is None
+    assert validate_event_data("unknown.event", {"any": "value"}) is None
+
+
+def test_validate_returns_only_set_fields():
+    """Test normalized data keeps the caller's fields without injected defaults."""
+    data = {"workout_id": "1", "deleted_by": "user_1"}
+    assert validate_event_data("workout.deleted", data) == data
+
+
+def test_validate_keeps_keys_outside_the_schema():
+    """Test keys the schema does not declare are kept, JSON-compatible."""
+    from datetime import date
+
+    data = {"workout_id": "1", "deleted_by": "user_1", "deleted_on": date(2025, 1, 15)}
+    assert validate_event_data("workout.deleted", data) == {**data, "deleted_on": "2025-01-15"}
+
+
+def test_validate_serializes_datetimes():
+    """Test datetime fields come back JSON-compatible."""
+    from datetime import datetime
+
+    data = validate_event_data(
+        "membership.expired",
+        {
+            "membership_id": "m1",
+            "user_id": "u1",
+            "plan_name": "Gold",
+            "expired_date": datetime(2025, 1, 15, 10, 0),
+        },
+    )
+    assert data["expired_date"] == "2025-01-15T10:00:00"
+
+
+def test_validate_raises_on_invalid_data():
+    """Test invalid data raises a pydantic ValidationError."""
+    with pytest.raises(ValidationError):
+        validate_event_data("workout.created", {"invalid": "data"})
+
+
+def test_event_types_registered_later_are_compiled():
+    """Test event types added to EVENT_TYPE_MAP after import still validate."""
+
+    class CustomEvent(BaseEvent):
+        event_type: str = "custom.registered"
+
+        class CustomData(BaseModel):
+            custom_id: str
+
+        data: CustomData
+
+    EVENT_TYPE_MAP["custom.registered"] = CustomEvent
+    try:
+        assert validate_event_data("custom.registered", {"custom_id": "c1"}) == {"custom_id": "c1"}
+    finally:
+        del EVENT_TYPE_MAP["custom.registered"]